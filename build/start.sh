@@ -27,9 +27,24 @@ source ./venv/bin/activate
 # cd to the backend directory
 cd ./tirtha_bk/
 
-# Starting celery in a tmux session
+# Starting one celery worker per queue, in the windows of a tmux session
+# NOTE: Each worker takes its pool settings from WORKER_POOLS in tirtha/celery.py; beat runs with maintenance.
 tmux new-session -d -s celery_session || tmux attach-session -t celery_session
-tmux send-keys -t celery_session "celery -A tirtha worker -l INFO --max-tasks-per-child=1 -P threads --beat --concurrency=1" C-m
+for QUEUE in default imageops recon_av recon_gs publish email maintenance; do
+  tmux new-window -t celery_session -n "$QUEUE"
+  CELERY_ARGS="-Q $QUEUE -n $QUEUE@%h"
+  if [ "$QUEUE" = "maintenance" ]; then CELERY_ARGS="$CELERY_ARGS --beat"; fi
+  tmux send-keys -t "celery_session:$QUEUE" "celery -A tirtha worker -l INFO $CELERY_ARGS" C-m
+done
+
+# Starting the VGGT model server in a tmux session, if configured (see VGGT_SERVER_SOCKET in tirtha.env)
+if [ -n "$VGGT_SERVER_SOCKET" ]; then
+  VGGT_SERVER_ARGS="--serve --socket $VGGT_SERVER_SOCKET --warmup"
+  if [ -n "$VGGT_WEIGHTS_PATH" ]; then VGGT_SERVER_ARGS="$VGGT_SERVER_ARGS --weights $VGGT_WEIGHTS_PATH"; fi
+  if [ "${VGGT_OFFLINE,,}" = "true" ]; then VGGT_SERVER_ARGS="$VGGT_SERVER_ARGS --offline"; fi
+  tmux new-session -d -s vggt_session || tmux attach-session -t vggt_session
+  tmux send-keys -t vggt_session "../.venv/bin/python ./tirtha/run_vggt.py $VGGT_SERVER_ARGS" C-m
+fi
 
 # Starting the frontend | NOTE: Browse to HOST_IP:8000 in a browser to access the frontend.
 gunicorn --bind 0.0.0.0:$GUNICORN_PORT tirtha_bk.wsgi
@@ -0,0 +1,76 @@
+// Decoder for the compressed `.csplat` format written by `tirtha/postprocess.py`
+// NOTE: See `quantize_splat()` & `decode_compressed_splat()` there for the layout
+
+const HEADER_SIZE = 16;
+const CHUNK_SIZE = 32;
+const SPLAT_SIZE = 32;
+
+// Decodes a `.csplat` file into `.splat` bytes (32 bytes per Gaussian)
+export function decodeCompressedSplat(buffer) {
+    const view = new DataView(buffer);
+    const bytes = new Uint8Array(buffer);
+    if (String.fromCharCode(...bytes.subarray(0, 4)) !== 'CSPL') {
+        throw new Error('Not a .csplat file');
+    }
+
+    const scaleBits = view.getUint16(6, true);
+    const count = view.getUint32(8, true);
+    const chunkSize = view.getUint32(12, true);
+    const numChunks = Math.ceil(count / chunkSize);
+    const recordSize = scaleBits === 8 ? 17 : 20;
+    const scaleLevels = 2 ** scaleBits - 1;
+    const dataOffset = HEADER_SIZE + numChunks * CHUNK_SIZE;
+
+    const out = new ArrayBuffer(count * SPLAT_SIZE);
+    const outView = new DataView(out);
+    const outBytes = new Uint8Array(out);
+
+    for (let c = 0; c < numChunks; c++) {
+        // Per-chunk bounding box & log-scale range
+        const chunk = HEADER_SIZE + c * CHUNK_SIZE;
+        const posMin = [0, 1, 2].map((a) => view.getFloat32(chunk + 4 * a, true));
+        const posStep = [0, 1, 2].map((a) => (view.getFloat32(chunk + 12 + 4 * a, true) - posMin[a]) / 65535);
+        const logScaleMin = view.getFloat32(chunk + 24, true);
+        const logScaleStep = (view.getFloat32(chunk + 28, true) - logScaleMin) / scaleLevels;
+
+        const end = Math.min((c + 1) * chunkSize, count);
+        for (let i = c * chunkSize; i < end; i++) {
+            const src = dataOffset + i * recordSize;
+            const dst = i * SPLAT_SIZE;
+            for (let a = 0; a < 3; a++) {
+                const position = posMin[a] + view.getUint16(src + 2 * a, true) * posStep[a];
+                const scale = scaleBits === 8 ? view.getUint8(src + 6 + a) : view.getUint16(src + 6 + 2 * a, true);
+                outView.setFloat32(dst + 4 * a, position, true);
+                outView.setFloat32(dst + 12 + 4 * a, Math.exp(logScaleMin + scale * logScaleStep), true);
+            }
+            // Colour & rotation are stored as is
+            outBytes.set(bytes.subarray(src + recordSize - 8, src + recordSize), dst + 24);
+        }
+    }
+
+    return out;
+}
+
+// Fetches a `.splat` or `.csplat` file & returns `.splat` bytes
+export async function fetchSplat(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`Failed to fetch ${url}: ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+
+    return url.endsWith('.csplat') ? decodeCompressedSplat(buffer) : buffer;
+}
+
+// Fetches `length` bytes at `offset` of a `.splat` file with a Range request, e.g., a chunk
+// of the progressive package (see `PostProcess.write_progressive()`)
+export async function fetchSplatRange(url, offset, length) {
+    const response = await fetch(url, { headers: { 'Range': `bytes=${offset}-${offset + length - 1}` } });
+    if (!response.ok) {
+        throw new Error(`Failed to fetch ${url}: ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+
+    // NOTE: A server without Range support sends the whole file
+    return response.status === 206 ? buffer : buffer.slice(offset, offset + length);
+}
@@ -18,8 +18,9 @@ from django.http import HttpResponse, Http404, StreamingHttpResponse
 from django.shortcuts import redirect
 
 # Local imports
-from .models import ARK, Contribution, Contributor, Image, Mesh, Run
-from .tasks import post_save_contrib_imageops, recon_runner_task
+from .models import ARK, Contribution, Contributor, Image, Mesh, ReconJob, Run
+from .postprocess import PostProcess
+from .tasks import enqueue_recon, post_save_contrib_imageops, resume_run
 
 
 # Logger setup
@@ -186,6 +187,7 @@ class MeshAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
         "reconstructed_at",
+        "pending_recon",
         "get_preview",
         "get_thumbnail",
     )
@@ -201,6 +203,7 @@ class MeshAdmin(admin.ModelAdmin):
                     ),
                     ("created_at", "updated_at", "reconstructed_at"),
                     ("status", "completed", "hidden"),
+                    "pending_recon",
                     ("name", "country", "state", "district"),
                     "description",
                     ("center_image", "denoise"),
@@ -698,13 +701,15 @@ class ContributionAdmin(admin.ModelAdmin):
     def trigger_aVOps(self, request, queryset):
         count = queryset.count()
         for obj in queryset:
-            recon_runner_task.delay(str(obj.ID), recons_type="aV")
-            logging.info(f"ADMIN -- aVOps successfully triggered for {obj.ID}.")
+            job_id = enqueue_recon(str(obj.ID), recons_type="aV", reason="Admin")
+            logging.info(
+                f"ADMIN -- aVOps successfully queued for {obj.ID} as job {job_id}."
+            )
         self.message_user(
             request,
             ngettext(
-                "aVOps successfully triggered for %d contribution.",
-                "aVOps successfully triggered for %d contributions.",
+                "aVOps successfully queued for %d contribution.",
+                "aVOps successfully queued for %d contributions.",
                 count,
             )
             % count,
@@ -715,13 +720,15 @@ class ContributionAdmin(admin.ModelAdmin):
     def trigger_GSOps(self, request, queryset):
         count = queryset.count()
         for obj in queryset:
-            recon_runner_task.delay(str(obj.ID), recons_type="GS")
-            logging.info(f"ADMIN -- GSOps successfully triggered for {obj.ID}.")
+            job_id = enqueue_recon(str(obj.ID), recons_type="GS", reason="Admin")
+            logging.info(
+                f"ADMIN -- GSOps successfully queued for {obj.ID} as job {job_id}."
+            )
         self.message_user(
             request,
             ngettext(
-                "GSOps successfully triggered for %d contribution.",
-                "GSOps successfully triggered for %d contributions.",
+                "GSOps successfully queued for %d contribution.",
+                "GSOps successfully queued for %d contributions.",
                 count,
             )
             % count,
@@ -1072,6 +1079,8 @@ class RunAdmin(admin.ModelAdmin):
         "status",
         "directory",
         "notes",
+        "profile",
+        "state",
         "download_link",
     )
     fieldsets = (
@@ -1090,6 +1099,8 @@ class RunAdmin(admin.ModelAdmin):
                         "hidden",
                     ),
                     "notes",
+                    "profile",
+                    "state",
                 )
             },
         ),
@@ -1756,6 +1767,31 @@ class RunAdmin(admin.ModelAdmin):
             )
             return HttpResponse(status=500)
 
+        # Regenerate the files the viewers prefer over the `.splat`, so that they show the replacement
+        if kind == "GS":
+            try:
+                csplat_path = os.path.splitext(orig_path)[0] + ".csplat"
+                compressed = os.path.isfile(csplat_path)
+                if compressed:
+                    PostProcess.write_compressed(
+                        orig_path, scale_bits=settings.GS_SPLAT_SCALE_BITS
+                    )
+                if os.path.isdir(os.path.splitext(orig_path)[0] + "_lod"):
+                    PostProcess.write_progressive(
+                        orig_path,
+                        compressed=compressed,
+                        scale_bits=settings.GS_SPLAT_SCALE_BITS,
+                    )
+            except Exception:
+                logging.exception(
+                    f"Error regenerating viewer files for run {run.ID} after replacement"
+                )
+                self.message_user(
+                    request,
+                    "Replaced the .splat, but could not regenerate the compressed/progressive files.",
+                    level=messages.WARNING,
+                )
+
         # Update Run.notes and log the admin action
         try:
             note = f"Final output replaced by admin {request.user.username} at {datetime.now(timezone.utc).isoformat()} UTC. Original file moved to {backup_name}."
@@ -1907,7 +1943,31 @@ class RunAdmin(admin.ModelAdmin):
 
         return resp
 
-    actions = ["download_final_outputs", "download_full_runs"]
+    @admin.action(description="Resume selected errored-out runs at the failed step")
+    def resume_runs(self, request, queryset):
+        count = 0
+        for run in queryset:
+            try:
+                steps = resume_run(str(run.ID))
+            except Exception as e:
+                self.message_user(
+                    request, f"Run {run.ID} was not resumed: {e}", messages.WARNING
+                )
+                continue
+            count += 1
+            logging.info(f"ADMIN -- Run {run.ID} resumed with steps {steps}.")
+        self.message_user(
+            request,
+            ngettext(
+                "%d run successfully resumed.",
+                "%d runs successfully resumed.",
+                count,
+            )
+            % count,
+            messages.SUCCESS,
+        )
+
+    actions = ["download_final_outputs", "download_full_runs", "resume_runs"]
 
 
 @admin.register(ARK)
@@ -1959,3 +2019,96 @@ class ARKAdmin(admin.ModelAdmin):
     )
     list_display = ("ark", "mesh_id_verbose", "get_run", "created_at", "image_count")
     list_per_page = 50
+
+
+@admin.register(ReconJob)
+class ReconJobAdmin(admin.ModelAdmin):
+    def mesh_id_verbose(self, obj):
+        return obj.mesh.verbose_id
+
+    mesh_id_verbose.short_description = "Mesh ID (Verbose)"
+
+    readonly_fields = (
+        "ID",
+        "mesh_id_verbose",
+        "contribution",
+        "recons_type",
+        "reason",
+        "cost",
+        "status",
+        "ops",
+        "notes",
+        "created_at",
+        "dispatched_at",
+    )
+    fieldsets = (
+        (
+            "Job Details",
+            {
+                "fields": (
+                    "ID",
+                    "mesh_id_verbose",
+                    "contribution",
+                    ("recons_type", "reason"),
+                    ("priority", "cost"),
+                    ("status", "ops"),
+                    ("created_at", "dispatched_at"),
+                    "notes",
+                )
+            },
+        ),
+    )
+    list_filter = ("status", "reason", "recons_type")
+    list_display = (
+        "ID",
+        "mesh_id_verbose",
+        "recons_type",
+        "reason",
+        "priority",
+        "cost",
+        "status",
+        "created_at",
+        "dispatched_at",
+    )
+    # NOTE: Lower runs first - see `tasks.recon_dispatch_task()`
+    list_editable = ("priority",)
+    list_per_page = 50
+
+    def has_add_permission(self, request):
+        return False  # Jobs are queued by `tasks.enqueue_recon()`
+
+    @admin.action(description="Move selected queued jobs to the front")
+    def move_to_front(self, request, queryset):
+        queued = ReconJob.objects.filter(status="Queued")
+        front = min(queued.values_list("priority", flat=True), default=0) - 1
+        updated = queryset.filter(status="Queued").update(priority=front)
+        logging.info(f"ADMIN -- {updated} job(s) moved to priority {front}.")
+        self.message_user(
+            request,
+            ngettext(
+                "%d job successfully moved to the front.",
+                "%d jobs successfully moved to the front.",
+                updated,
+            )
+            % updated,
+            messages.SUCCESS,
+        )
+
+    @admin.action(description="Cancel selected queued jobs")
+    def cancel_jobs(self, request, queryset):
+        updated = queryset.filter(status="Queued").update(
+            status="Cancelled", notes="Cancelled by admin."
+        )
+        logging.info(f"ADMIN -- {updated} job(s) cancelled.")
+        self.message_user(
+            request,
+            ngettext(
+                "%d job successfully cancelled.",
+                "%d jobs successfully cancelled.",
+                updated,
+            )
+            % updated,
+            messages.SUCCESS,
+        )
+
+    actions = ["move_to_front", "cancel_jobs"]
@@ -4,22 +4,40 @@ For Internal Use
 
 """
 
+import hashlib
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from multiprocessing import Pool, cpu_count
+from datetime import datetime
+from functools import wraps
+from multiprocessing import cpu_count
 from pathlib import Path
 from subprocess import (
     PIPE,
-    STDOUT,
     CalledProcessError,
     Popen,
     TimeoutExpired,
-    check_output,
 )
-from time import sleep
-from typing import Dict, Iterable, Optional, Tuple, Union
+from time import perf_counter, sleep
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import psutil
 
 # Local imports
-from .utils import Logger, _sysinfo
+from .utils import (
+    PROFILE_FILE,
+    GPUSlot,
+    Logger,
+    _kill_group,
+    _sysinfo,
+    log_progress,
+    run_profiled,
+    write_profile,
+)
 
 # NOTE: Tweak as needed
 MAX_RETRIES = 3  # For all nodes, except cameraInit
@@ -27,6 +45,201 @@ RETRY_INTERVAL = 2  # seconds
 CAMERAINIT_MAX_RETRIES = 5
 CAMERAINIT_RETRY_INTERVAL = 1  # seconds
 CAMERAINIT_MAX_RUNTIME = 2  # seconds
+MANIFEST_FILE = ".manifest.json"  # Completion manifest in each node's output folder
+MANIFEST_VERSION = 1
+HASH_BLOCK_SIZE = 1 << 20  # bytes
+IMAGE_HASHES_FILE = "images.json"  # Image hashes in the feature cache
+SFM_EXPORT_FILE = "sfm.json"  # Final SfM as JSON in `07_sfmRotate`, with `export_sfm`
+# Per-node cost profiles for `_parallelRunner`
+# threads: Cores per block | concurrency: Max. blocks at a time (None: as many as the cores allow)
+# minBlockSize: Min. views per block, to amortise the node's start-up
+# NOTE: Tweak as needed, using the per-block wall times in the logs
+NODE_PROFILES = {
+    "featureExtraction": {"threads": 4, "concurrency": 2, "minBlockSize": 8},  # GPU
+    "featureMatching": {"threads": 4, "concurrency": None, "minBlockSize": 8},
+    "prepareDenseScene": {"threads": 2, "concurrency": None, "minBlockSize": 8},  # I/O
+    "depthMapEstimation": {"threads": 4, "concurrency": 1, "minBlockSize": 4},  # GPU
+    "depthMapFiltering": {"threads": 4, "concurrency": None, "minBlockSize": 4},
+}
+DEFAULT_NODE_PROFILE = {"threads": 4, "concurrency": None, "minBlockSize": 4}
+GPU_NODES = ("depthMapEstimation",)  # Need a GPU slot, if `gpu_slots` is set
+# Rough peak memory per process of a node, in GiB:
+# base + megapixels * (perThreadPerMP * threads + perViewPerMP * views)
+# lowMemoryArgs: Fallback parameters, if a single thread does not fit
+# lowMemoryScale: Scales the estimate with `lowMemoryArgs`
+# NOTE: Tweak as needed, using the peak RSS in the logs
+NODE_MEMORY = {
+    "featureExtraction": {"base": 0.5, "perThreadPerMP": 0.15},
+    "depthMapEstimation": {
+        "base": 1.0,
+        "perThreadPerMP": 0.1,
+        "lowMemoryArgs": "--downscale 4",  # NOTE: Default is 2
+        "lowMemoryScale": 0.25,
+    },
+    "depthMapFiltering": {
+        "base": 0.5,
+        "perThreadPerMP": 0.1,
+        "lowMemoryArgs": "--nNearestCams 5",  # NOTE: Default is 10
+        "lowMemoryScale": 0.5,
+    },
+    "meshing": {
+        "base": 8.0,
+        "perViewPerMP": 0.002,
+        "lowMemoryArgs": "--maxInputPoints 20000000 --maxPoints 2000000",  # NOTE: Defaults are 50M & 5M
+        "lowMemoryScale": 0.4,
+    },
+}
+MEMORY_HEADROOM = 0.8  # Fraction of the available RAM that the nodes may use
+DEFAULT_MEGAPIXELS = 12  # If `cameraInit.sfm` has no image sizes
+
+
+def _sha256(path: Path) -> str:
+    """
+    SHA-256 of a file, read in blocks
+
+    """
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            sha.update(block)
+
+    return sha.hexdigest()
+
+
+def _link(src: Path, dst: Path) -> None:
+    """
+    Hard-links `src` to `dst`, or copies it across devices
+
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _remap_matches(
+    matches_files: Iterable[Path], out_file: Path, id_map: Dict[str, str]
+) -> int:
+    """
+    Copies the feature matches to `out_file`, with the view IDs mapped by `id_map`.
+    Drops the pairs with views that are not in `id_map`.
+    NOTE: Uses aliceVision's text format, i.e., per pair: "I J", the number of
+    describer types & per describer type: "type count" followed by "i j" per match.
+
+    Parameters
+    ----------
+    matches_files : Iterable[Path]
+        `*.matches.txt` files
+    out_file : Path
+        Output `.matches.txt` file
+    id_map : Dict[str, str]
+        Old to new view IDs
+
+    Returns
+    -------
+    int
+        Number of pairs copied
+
+    """
+    num_pairs = 0
+    with open(out_file, "w") as out:
+        for matches_file in matches_files:
+            lines = iter(matches_file.read_text().splitlines())
+            for line in lines:
+                if not line.strip():
+                    continue
+                I, J = line.split()
+                blocks = []
+                for _ in range(int(next(lines))):
+                    describerType, count = next(lines).split()
+                    blocks.append(
+                        (describerType, [next(lines) for _ in range(int(count))])
+                    )
+
+                if I not in id_map or J not in id_map:
+                    continue
+                I, J = id_map[I], id_map[J]
+                # NOTE: Pairs are stored with I < J
+                if int(I) > int(J):
+                    I, J = J, I
+                    blocks = [
+                        (describerType, [" ".join(m.split()[::-1]) for m in matches])
+                        for describerType, matches in blocks
+                    ]
+
+                out.write(f"{I} {J}\n{len(blocks)}\n")
+                for describerType, matches in blocks:
+                    out.write(f"{describerType} {len(matches)}\n")
+                    out.writelines(f"{m}\n" for m in matches)
+                num_pairs += 1
+
+    return num_pairs
+
+
+def _node_files(path: Path) -> List[Path]:
+    """
+    Files in a node's output folder, except the logs & the completion manifest
+
+    """
+    if not path.is_dir():
+        return [path]
+
+    return sorted(
+        p
+        for p in path.rglob("*")
+        if p.is_file() and p.suffix != ".log" and p.name != MANIFEST_FILE
+    )
+
+
+def _resumable(node_dir: str) -> Callable:
+    """
+    Decorator for the node methods.
+    Writes a completion manifest to `cache_dir/node_dir` after the node finishes.
+    In resume mode, skips the node if its manifest still matches, i.e., same
+    commands, same input hashes & untouched outputs. Otherwise, runs the node
+    & turns off resume mode for all the later nodes.
+
+    Parameters
+    ----------
+    node_dir : str
+        Name of the node's output folder, e.g., `01_cameraInit`
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self._check_state()
+
+            out_path = self.cache_dir / node_dir
+            manifest_path = out_path / MANIFEST_FILE
+            manifest = self._load_manifest(manifest_path)
+
+            if self.resume:
+                if self._manifest_matches(manifest, out_path, func, args, kwargs):
+                    self.logger.info(
+                        f"{func.__name__} is up to date. Skipping. Manifest: {manifest_path}."
+                    )
+                    return
+                # NOTE: Every later node depends on this node's outputs
+                self.logger.info(f"Resuming the pipeline from {func.__name__}.")
+                self.resume = False
+
+            manifest_path.unlink(missing_ok=True)
+            self._record = {"cmds": [], "inputs": [], "outputs": []}
+            try:
+                func(self, *args, **kwargs)
+                record = self._record
+            finally:
+                self._record = None
+
+            if not AliceVision.state["error"]:
+                self._write_manifest(manifest_path, func.__name__, record)
+
+        return wrapper
+
+    return decorator
 
 
 @dataclass
@@ -50,6 +263,22 @@ class AliceVision:
             "Types": "dspsift",  # NOTE: String of comma separated values (no spaces & no trailing comma) NOTE: dspsift is absent from docs, but available in MR21/23.
         }
     )
+    # Skip the nodes whose completion manifests in `cache_dir` still match
+    resume: Optional[bool] = False
+    # Per-mesh cache of the extracted features, keyed by image hash & describer presets
+    feature_cache: Optional[Union[str, Path]] = None
+    # `cache_dir` of an earlier run, to only match the new images against it
+    previous_run: Optional[Union[str, Path]] = None
+    # Max. blocks at a time per node, e.g., {"depthMapEstimation": 1}. Overrides `NODE_PROFILES`.
+    concurrency: Optional[Dict[str, int]] = field(default_factory=dict)
+    # Max. seconds per command of a node, e.g., {"depthMapEstimation": 7200}. None or absent: no limit.
+    timeouts: Optional[Dict[str, int]] = field(default_factory=dict)
+    # Fit the nodes in `NODE_MEMORY` into the available RAM
+    admission_control: Optional[bool] = True
+    # GPU slots shared with the other pipelines on the host (see `utils.GPUSlot`), for `GPU_NODES`
+    gpu_slots: Optional[int] = None
+    # Also export the final SfM (`07_sfmRotate/sfm.json`), e.g., as GS's cameras (see `utilssfm.py`)
+    export_sfm: Optional[bool] = False
 
     def __post_init__(self):
         """
@@ -66,17 +295,18 @@ class AliceVision:
 
         """
         self.cpu_count = cpu_count()
-        # NOTE: Tweak as needed
-        # Minimum number of images to process before splitting into blocks
-        self.minBlockSize = self.cpu_count * 2
-        # Max number of cores to use
-        # NOTE: nodes are multithreaded, so using all cores may not be optimal
-        self.maxCores = self.cpu_count // 2
 
         # Tracks the state of the pipeline (intended for when we want to continue despite errors)
         # NOTE: Defined as class variable to be accessible from the static method `_serialRunner`
         AliceVision.state = {"error": False, "source": None, "log_file": None}
         AliceVision.logger = self.logger
+        # Resource usage of every command, for the run's profile
+        AliceVision.profile_file = self.cache_dir / PROFILE_FILE
+
+        # Commands & inputs of the running node, for its completion manifest
+        self._record = None
+        self._dry_run = False  # Record the commands without running them
+        self._hashes = {}  # (path, size, mtime_ns) -> sha256
 
         self.exec_path = Path(self.exec_path)
         self.input_dir = Path(self.input_dir)
@@ -92,6 +322,10 @@ class AliceVision:
             raise FileNotFoundError(err)
 
         self.cache_dir = Path(self.cache_dir).resolve()
+        if self.feature_cache is not None:
+            self.feature_cache = Path(self.feature_cache).resolve()
+        if self.previous_run is not None:
+            self.previous_run = Path(self.previous_run).resolve()
         if (
             not self.cache_dir.exists()
         ):  # TODO: Redundant check, since Run.save() creates runDir.
@@ -135,6 +369,7 @@ class AliceVision:
             "featureMatching": "aliceVision_featureMatching",
             "structureFromMotion": "aliceVision_incrementalSfM",
             "sfmTransform": "aliceVision_utils_sfmTransform",
+            "convertSfMFormat": "aliceVision_convertSfMFormat",
             "prepareDenseScene": "aliceVision_prepareDenseScene",
             "depthMapEstimation": "aliceVision_depthMapEstimation",
             "depthMapFiltering": "aliceVision_depthMapFiltering",
@@ -160,37 +395,134 @@ class AliceVision:
         return len([i for i in Path(self.input_dir).iterdir() if i.is_file()])
         # return len(next(os.walk(self.input_dir))[2]) # CHECK: Performance
 
-    @property
-    def blockSize(self):
+    def _schedule(
+        self, caller: str, size: int
+    ) -> Tuple[List[Tuple[int, int]], int, int]:
         """
-        Number of images to process in each block
+        Splits `size` views into blocks for `_parallelRunner`, based on the
+        node's cost profile in `NODE_PROFILES`.
+        NOTE: The nodes are multithreaded, so the cores are shared between
+        the blocks that run at a time, instead of one block per core.
+        Blocks shrink towards the end (guided scheduling), so that the
+        workers that finish early take the small blocks left, instead of
+        waiting on a straggler.
+
+        Parameters
+        ----------
+        caller : str
+            Name of the node
+        size : int
+            Number of views
 
         Returns
         -------
-        int
-            `block_size` or number of images to process in each block
+        Tuple[List[Tuple[int, int]], int, int]
+            (rangeStart, rangeSize) per block, blocks at a time & threads per block
 
         """
-        # NOTE: We can also maintain a dict with varying block sizes for different nodes
-        # Or, different ratios with respect to the max block size
-        if self.inputSize <= self.minBlockSize:
-            return self.inputSize
-        return self.inputSize // self.maxCores
+        profile = NODE_PROFILES.get(caller, DEFAULT_NODE_PROFILE)
+        minBlockSize = profile["minBlockSize"]
 
-    @property
-    def numBlocks(self):
+        workers = max(1, self.cpu_count // profile["threads"])
+        concurrency = self.concurrency.get(caller, profile["concurrency"])
+        if concurrency:
+            workers = min(workers, concurrency)
+        workers = max(1, min(workers, -(-size // minBlockSize)))
+        threads = max(1, self.cpu_count // workers)
+
+        if workers == 1:
+            return ([(0, size)] if size else []), workers, threads
+
+        blocks, start = [], 0
+        while start < size:
+            remaining = size - start
+            count = min(remaining, max(minBlockSize, -(-remaining // (2 * workers))))
+            blocks.append((start, count))
+            start += count
+
+        return blocks, workers, threads
+
+    def _image_stats(self) -> Tuple[int, float]:
         """
-        Number of blocks to process
+        Number of views & the largest image size, from `cameraInit.sfm`.
 
         Returns
         -------
-        int
-            Number of blocks to process
+        Tuple[int, float]
+            Number of views & megapixels
 
         """
-        return (
-            self.inputSize // self.blockSize
-        ) + 1  # NOTE: +1 to account for the remainder
+        try:
+            sfm = json.loads(
+                (self.cache_dir / "01_cameraInit/cameraInit.sfm").read_text()
+            )
+            megapixels = max(
+                int(view["width"]) * int(view["height"]) / 1e6 for view in sfm["views"]
+            )
+            return len(sfm["views"]), megapixels
+        except (OSError, ValueError, KeyError):
+            return self.inputSize, DEFAULT_MEGAPIXELS
+
+    def _admit(self, caller: str, workers: int, threads: int) -> Tuple[int, int, str]:
+        """
+        Fits a node into the available RAM, based on its memory model in
+        `NODE_MEMORY`. In order, runs fewer blocks at a time, fewer threads
+        per block & finally, falls back to the node's low-memory parameters.
+
+        Parameters
+        ----------
+        caller : str
+            Name of the node
+        workers : int
+            Blocks at a time
+        threads : int
+            Threads per block
+
+        Returns
+        -------
+        Tuple[int, int, str]
+            Blocks at a time, threads per block & extra arguments for the node
+
+        """
+        model = NODE_MEMORY.get(caller)
+        if not self.admission_control or self._dry_run or model is None:
+            return workers, threads, ""
+
+        num_views, megapixels = self._image_stats()
+        available = psutil.virtual_memory().available / 2**30 * MEMORY_HEADROOM
+
+        def estimate(workers: int, threads: int, scale: float = 1.0) -> float:
+            per_mp = model.get("perThreadPerMP", 0) * threads
+            per_mp += model.get("perViewPerMP", 0) * num_views
+            return scale * workers * (model["base"] + megapixels * per_mp)
+
+        planned = estimate(workers, threads)
+        while workers > 1 and estimate(workers, threads) > available:
+            workers -= 1
+        while (
+            threads > 1
+            and "perThreadPerMP" in model
+            and estimate(workers, threads) > available
+        ):
+            threads = max(1, threads // 2)
+
+        args, scale = "", 1.0
+        if estimate(workers, threads) > available and "lowMemoryArgs" in model:
+            args, scale = model["lowMemoryArgs"], model["lowMemoryScale"]
+
+        needed = estimate(workers, threads, scale)
+        if needed < planned:
+            self.logger.warning(
+                f"{caller}: Estimated {planned:.1f} GiB for {num_views} views of {megapixels:.1f} MP,"
+                + f" but only {available:.1f} GiB available. Using {workers} blocks at a time"
+                + f" with {threads} threads each{f' & {args}' if args else ''} ({needed:.1f} GiB)."
+            )
+        if needed > available:
+            self.logger.warning(
+                f"{caller}: Estimated {needed:.1f} GiB still exceeds the {available:.1f} GiB available."
+            )
+
+        return workers, threads, args
 
     @classmethod
     def _check_state(cls):
@@ -210,9 +542,15 @@ class AliceVision:
             raise RuntimeError(msg)
 
     @staticmethod  # NOTE: Won't be picklable as a regular method
-    def _serialRunner(cmd: str, log_file: Path) -> None:
+    def _serialRunner(
+        cmd: str,
+        log_file: Path,
+        threads: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
         """
-        Run a command serially and log the output
+        Run a command serially and stream its output to the log file
+        Logs its progress & appends the resource usage of every try to `AliceVision.profile_file`.
 
         Parameters
         ----------
@@ -220,31 +558,73 @@ class AliceVision:
             Command to run
         log_file : Path
             Path to the log file
+        threads : Optional[int]
+            Optional, Number of threads for the node (`OMP_NUM_THREADS`)
+            Default: None, i.e., all cores
+        timeout : Optional[int]
+            Optional, Timeout in seconds. Timed-out commands are not retried.
+            Default: None, i.e., no timeout
 
         Raises
         ------
         CalledProcessError
             If the command fails
+        TimeoutExpired
+            If the command times out
 
         """
         logger = Logger(log_file.stem, log_file.parent)
         log_path = Path(log_file).resolve()
+        env = None
+        if threads is not None:
+            env = {**os.environ, "OMP_NUM_THREADS": str(threads)}
         for i in range(MAX_RETRIES):
             try:
                 AliceVision.logger.info(
                     f"Starting command execution. Log file: {log_path}."
                 )
                 logger.info(f"Command:\n{cmd}")
-                output = check_output(cmd, shell=True, stderr=STDOUT)
-                logger.info(f"Output:\n{output.decode().strip()}")
+                logger.info("Output:")
+                exit_status, output, profile = run_profiled(
+                    cmd,
+                    log_path,
+                    env=env,
+                    timeout=timeout,
+                    on_progress=log_progress(AliceVision.logger, logger.name),
+                )
+                write_profile(
+                    AliceVision.profile_file,
+                    {
+                        "step": log_file.stem.split(".")[0],
+                        "log": log_file.stem,
+                        "cmd": cmd,
+                        "threads": threads,
+                        "try": i,
+                        **profile,
+                    },
+                )
+                if profile["timed_out"]:
+                    raise TimeoutExpired(cmd, timeout, output)
+                if exit_status:
+                    raise CalledProcessError(exit_status, cmd, output)
                 AliceVision.logger.info(
                     f"Finished command execution after {i} retries. Log file: {log_path}."
                 )
                 break
+            except TimeoutExpired as error:
+                msg = f"{logger.name} timed out after {timeout}s. Check log file: {log_path}."
+                logger.error(msg)
+                AliceVision.logger.error(msg)
+                error.add_note(msg)
+                AliceVision.state = {
+                    "error": True,
+                    "source": logger.name,
+                    "log_file": log_path,
+                }
+                raise error
             except CalledProcessError as error:
-                err = error.output.decode().strip()
                 sysinfo = _sysinfo()
-                logger.error(f"\n{err}")
+                logger.error(f"Exited with status {error.returncode}.")
                 logger.error(f"System Info:\n{sysinfo}")
                 AliceVision.logger.error(
                     f"Error in command execution for {logger.name} for Try {i} / {MAX_RETRIES}. Check log file: {log_path}."
@@ -279,9 +659,12 @@ class AliceVision:
                 "log_file": log_path,
             }
 
-    def _parallelRunner(self, cmd: str, log_path: Path, caller: str) -> None:
+    def _parallelRunner(
+        self, cmd: str, log_path: Path, caller: str, size: Optional[int] = None
+    ) -> None:
         """
-        Run a command in parallel and log the output
+        Run a command in parallel over blocks of views and log the output
+        See `_schedule()` for the blocks.
 
         Parameters
         ----------
@@ -291,18 +674,133 @@ class AliceVision:
             Path to the log file
         caller : str
             Name of the caller function
+        size : Optional[int]
+            Optional, Number of views in the input sfm file
+            Default: `self.inputSize`
 
         """
-        block_size = self.blockSize
+        size = self.inputSize if size is None else size
+        blocks, workers, threads = self._schedule(caller, size)
+        workers, threads, extra_args = self._admit(caller, workers, threads)
+        self.logger.info(
+            f"{caller}: {size} views in {len(blocks)} blocks, {workers} at a time with {threads} threads each."
+        )
+        if not blocks:
+            return
+
+        # NOTE: `--maxThreads` goes with the other extra arguments, since it depends on the host
+        extra_args = f"--maxThreads {threads} {extra_args}".rstrip()
+        cmds_and_logs = [
+            (
+                f"{cmd} --rangeStart {start} --rangeSize {count}",
+                log_path / f"{caller}.{i}.log",
+            )
+            for i, (start, count) in enumerate(blocks)
+        ]
+        self._batchRunner(cmds_and_logs, workers, threads, extra_args)
 
-        cmds, logs = [], []
-        for i in range(self.numBlocks):
-            logs.extend([log_path / f"{caller}.{i}.log"])
-            cmds.append(f"{cmd} --rangeStart {i * block_size} --rangeSize {block_size}")
-        cmds_and_logs = list(zip(cmds, logs))
+    def _batchRunner(
+        self,
+        cmds_and_logs: List[Tuple[str, Path]],
+        processes: int = 1,
+        threads: Optional[int] = None,
+        extra_args: Optional[str] = "",
+    ) -> None:
+        """
+        Run commands with `_serialRunner`, in a thread pool if there are several.
+        Logs the wall time per command & profiles the pool as a whole.
+        Records the commands for the node's completion manifest &
+        does not run them during a dry run.
+
+        Parameters
+        ----------
+        cmds_and_logs : List[Tuple[str, Path]]
+            (Command, log file) pairs
+        processes : int
+            Number of commands at a time
+            Default: 1
+        threads : Optional[int]
+            Optional, Number of threads per command
+            Default: None, i.e., all cores
+        extra_args : Optional[str]
+            Optional, Arguments added to every command, e.g., from `_admit()`
+            NOTE: Not recorded in the manifest, since they depend on the free RAM
+            Default: ""
+
+        """
+        if not cmds_and_logs or self._record_cmds([cmd for cmd, _ in cmds_and_logs]):
+            return
+
+        jobs = [
+            (
+                f"{cmd} {extra_args}" if extra_args else cmd,
+                log_file,
+                threads,
+                self.timeouts.get(log_file.stem.split(".")[0]),
+            )
+            for cmd, log_file in cmds_and_logs
+        ]
+        # NOTE: GPU-heavy nodes share the GPU slots with the other pipelines on the host
+        step = cmds_and_logs[0][1].stem.split(".")[0]
+        gpu_slot = (
+            GPUSlot(self.gpu_slots, self.logger, step)
+            if self.gpu_slots and step in GPU_NODES
+            else nullcontext()
+        )
+        with gpu_slot:
+            start = perf_counter()
+            if processes == 1 or len(jobs) == 1:
+                times = [self._timedRunner(job) for job in jobs]
+            else:
+                # NOTE: Threads, since each block is already a subprocess & the op tasks
+                # run in daemonic (prefork) workers, which cannot start child processes.
+                # Idle threads take the next command, as they are handed out in order.
+                with ThreadPoolExecutor(processes, "aliceVision") as pool:
+                    times = list(pool.map(self._timedRunner, jobs))
+
+        for log_file, elapsed in times:
+            self.logger.info(f"{log_file.stem} finished in {elapsed:.1f}s.")
+        if len(times) > 1:
+            wall = perf_counter() - start
+            elapsed = [t for _, t in times]
+            self.logger.info(
+                f"Ran {len(times)} blocks in {wall:.1f}s"
+                + f" (min {min(elapsed):.1f}s, mean {sum(elapsed) / len(elapsed):.1f}s, max {max(elapsed):.1f}s)."
+            )
+            write_profile(
+                AliceVision.profile_file,
+                {
+                    "kind": "pool",
+                    "step": step,
+                    "blocks": len(times),
+                    "processes": processes,
+                    "threads": threads,
+                    "wall_s": round(wall, 3),
+                },
+            )
+
+    @staticmethod
+    def _timedRunner(
+        job: Tuple[str, Path, Optional[int], Optional[int]]
+    ) -> Tuple[Path, float]:
+        """
+        Runs `_serialRunner` & times it
+
+        Parameters
+        ----------
+        job : Tuple[str, Path, Optional[int], Optional[int]]
+            Command, log file, number of threads & timeout
+
+        Returns
+        -------
+        Tuple[Path, float]
+            Log file & wall time in seconds
+
+        """
+        start = perf_counter()
+        AliceVision._serialRunner(*job)
 
-        with Pool(self.cpu_count) as pool:
-            pool.starmap(self._serialRunner, cmds_and_logs)  # NOTE: Blocking call
+        return job[1], perf_counter() - start
 
     def _timeoutRunner(self, cmd: Iterable, timeout: int) -> str:
         """
@@ -329,7 +827,7 @@ class AliceVision:
             If the command times out
 
         """
-        process = Popen(cmd, stdout=PIPE, stderr=PIPE)
+        process = Popen(cmd, stdout=PIPE, stderr=PIPE, start_new_session=True)
 
         try:
             stdout, stderr = process.communicate(timeout=timeout)
@@ -340,9 +838,62 @@ class AliceVision:
                     process.returncode, cmd, stderr.decode("utf-8")
                 )
         except TimeoutExpired:
-            process.kill()
+            _kill_group(process)
             raise
 
+    def _split_views(self, inputSfm: Path) -> Optional[Tuple[List, List, Dict]]:
+        """
+        Splits the views in `inputSfm` into the ones already matched in
+        `self.previous_run` & the new ones, for incremental matching.
+        NOTE: Views are matched by image path, since images are never modified in place.
+
+        Parameters
+        ----------
+        inputSfm : Path
+            Path to the input sfm file
+
+        Returns
+        -------
+        Optional[Tuple[List, List, Dict]]
+            Old views, new views & the previous to current view IDs, or None if
+            the previous run is unusable (incomplete, other describers) or if
+            there are no old or no new views
+
+        """
+        previous = self.previous_run
+        if previous is None:
+            return None
+
+        # The previous run must have finished matching with the same describers
+        try:
+            features = json.loads(
+                (previous / "02_featureExtraction" / MANIFEST_FILE).read_text()
+            )
+            previousSfm = json.loads(
+                (previous / "01_cameraInit/cameraInit.sfm").read_text()
+            )
+        except (OSError, ValueError):
+            return None
+        if not (
+            (previous / "03_imageMatching/imageMatches.txt").exists()
+            and (previous / "04_featureMatching" / MANIFEST_FILE).exists()
+            and self._add_desc_presets("", addAll=True) in features["cmds"][0]
+        ):
+            return None
+
+        previous_ids = {view["path"]: view["viewId"] for view in previousSfm["views"]}
+        old, new, id_map = [], [], {}
+        for view in json.loads(Path(inputSfm).read_text())["views"]:
+            if view["path"] in previous_ids:
+                old.append(view)
+                id_map[previous_ids[view["path"]]] = view["viewId"]
+            else:
+                new.append(view)
+        if not old or not new:
+            return None
+
+        return old, new, id_map
+
     def _check_input(
         self,
         cmd: str,
@@ -376,6 +927,7 @@ class AliceVision:
         if not Path(inp).exists():
             raise FileNotFoundError(f"Input file not found at {inp}.")
         cmd += f" {arg} {inp}"
+        self._record_input(inp)
 
         return cmd, inp
 
@@ -431,6 +983,268 @@ class AliceVision:
 
         return cmd
 
+    def _record_input(self, inp: Union[str, Path]) -> None:
+        """
+        Records an input file or folder of the running node.
+
+        Parameters
+        ----------
+        inp : Union[str, Path]
+            Input file or folder
+
+        """
+        if self._record is not None:
+            self._record["inputs"].append(Path(inp))
+
+    def _record_output(self, out: Union[str, Path]) -> None:
+        """
+        Records a file that the running node overwrites in an earlier node's
+        output folder, e.g., `--outputViewsAndPoses` in sfmTransform.
+        NOTE: Checked by `_check_input`, but not an input of the node.
+
+        Parameters
+        ----------
+        out : Union[str, Path]
+            Output file
+
+        """
+        if self._record is not None:
+            self._record["inputs"].remove(Path(out))
+            self._record["outputs"].append(Path(out))
+
+    def _record_cmds(self, cmds: Iterable[str]) -> bool:
+        """
+        Records the commands of the running node.
+
+        Parameters
+        ----------
+        cmds : Iterable[str]
+            Commands
+
+        Returns
+        -------
+        bool
+            True during a dry run, i.e., if the commands must not be run
+
+        """
+        if self._record is not None:
+            self._record["cmds"].extend(cmds)
+
+        return self._dry_run
+
+    def _portable(self, cmd: str) -> str:
+        """
+        Makes a command or path independent of `cache_dir`, so that the manifests
+        stay valid when the node folders move to a new run. Also drops `--verboseLevel`,
+        which is raised to "trace" after an error.
+
+        Parameters
+        ----------
+        cmd : str
+            Command or path
+
+        Returns
+        -------
+        str
+            Command or path with `cache_dir` replaced by "{cache_dir}"
+
+        """
+        cmd = str(cmd).replace(str(self.cache_dir), "{cache_dir}")
+
+        return re.sub(r" --verboseLevel \S+", "", cmd)
+
+    def _fingerprint(self, paths: Iterable[Path]) -> Dict[str, Dict]:
+        """
+        Size, mtime & SHA-256 of the input files. Folders are expanded.
+        NOTE: Files are only hashed if their size or mtime changed since the last manifest.
+
+        Parameters
+        ----------
+        paths : Iterable[Path]
+            Input files or folders
+
+        Returns
+        -------
+        Dict[str, Dict]
+            Fingerprint per (portable) file path
+
+        """
+        fingerprint = {}
+        for path in paths:
+            for file in _node_files(Path(path)):
+                stat = file.stat()
+                fingerprint[self._portable(file)] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": self._file_hash(file, stat),
+                }
+
+        return fingerprint
+
+    def _file_hash(self, file: Path, stat: Optional[os.stat_result] = None) -> str:
+        """
+        SHA-256 of a file, cached by path, size & mtime.
+
+        Parameters
+        ----------
+        file : Path
+            Path to the file
+        stat : Optional[os.stat_result]
+            Optional, `file.stat()`, if already available
+            Default: None
+
+        Returns
+        -------
+        str
+            SHA-256 of the file
+
+        """
+        stat = stat or file.stat()
+        key = (self._portable(file), stat.st_size, stat.st_mtime_ns)
+        if key not in self._hashes:
+            self._hashes[key] = _sha256(file)
+
+        return self._hashes[key]
+
+    def _load_manifest(self, manifest_path: Path) -> Optional[Dict]:
+        """
+        Loads a node's completion manifest & caches its input hashes.
+
+        Parameters
+        ----------
+        manifest_path : Path
+            Path to the manifest
+
+        Returns
+        -------
+        Optional[Dict]
+            Manifest, or None if it is missing, unreadable or outdated
+
+        """
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+
+        for path, stat in manifest["inputs"].items():
+            self._hashes[(path, stat["size"], stat["mtime_ns"])] = stat["sha256"]
+
+        return manifest
+
+    def _manifest_matches(
+        self,
+        manifest: Optional[Dict],
+        out_path: Path,
+        func: Callable,
+        args: Tuple,
+        kwargs: Dict,
+    ) -> bool:
+        """
+        Checks if a node's manifest still matches, by dry-running the node to
+        get its current commands & inputs.
+
+        Parameters
+        ----------
+        manifest : Optional[Dict]
+            Node's completion manifest
+        out_path : Path
+            Node's output folder
+        func : Callable
+            Node method
+        args : Tuple
+            Positional arguments of the node method
+        kwargs : Dict
+            Keyword arguments of the node method
+
+        Returns
+        -------
+        bool
+            True if the node can be skipped
+
+        """
+        if manifest is None:
+            return False
+
+        # Dry run
+        self._record = {"cmds": [], "inputs": [], "outputs": []}
+        self._dry_run = True
+        try:
+            func(self, *args, **kwargs)
+            record = self._record
+        except (FileNotFoundError, ValueError):
+            return False
+        finally:
+            self._record = None
+            self._dry_run = False
+
+        if [self._portable(cmd) for cmd in record["cmds"]] != manifest["cmds"]:
+            return False
+
+        hashes = {
+            p: s["sha256"] for p, s in self._fingerprint(record["inputs"]).items()
+        }
+        if hashes != {p: s["sha256"] for p, s in manifest["inputs"].items()}:
+            return False
+
+        for name, stat in manifest["outputs"].items():
+            path = out_path / name
+            if not path.is_file():
+                return False
+            current = path.stat()
+            if (current.st_size, current.st_mtime_ns) != (
+                stat["size"],
+                stat["mtime_ns"],
+            ):
+                return False
+
+        return True
+
+    def _write_manifest(self, manifest_path: Path, node: str, record: Dict) -> None:
+        """
+        Writes a node's completion manifest, with its commands, inputs & outputs.
+
+        Parameters
+        ----------
+        manifest_path : Path
+            Path to the manifest
+        node : str
+            Name of the node
+        record : Dict
+            Commands, inputs & overwritten files recorded while running the node
+
+        """
+        outputs = {}
+        for file in _node_files(manifest_path.parent):
+            stat = file.stat()
+            outputs[str(file.relative_to(manifest_path.parent))] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "node": node,
+            "completed_at": datetime.now().isoformat(),
+            "cmds": [self._portable(cmd) for cmd in record["cmds"]],
+            "inputs": self._fingerprint(record["inputs"]),
+            "outputs": outputs,
+        }
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+
+        # Refresh the overwritten files in the earlier nodes' manifests
+        for file in record["outputs"]:
+            earlier = self._load_manifest(file.parent / MANIFEST_FILE)
+            if earlier is not None and file.name in earlier["outputs"]:
+                stat = file.stat()
+                earlier["outputs"][file.name] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                }
+                (file.parent / MANIFEST_FILE).write_text(json.dumps(earlier, indent=2))
+
+    @_resumable("01_cameraInit")
     def cameraInit(self) -> None:
         """
         Initializes the camera intrinsics from a set of images and
@@ -457,6 +1271,10 @@ class AliceVision:
         sensorDatabase = self.exec_path / "cameraSensors.db"
         cmd, sensorDatabase = self._check_input(cmd, sensorDatabase, arg="-s")
 
+        self._record_input(self.input_dir)
+        if self._record_cmds([cmd]):
+            return
+
         # Set up logger
         log_file = out_path / "cameraInit.log"
         logger = Logger(log_file.stem, log_file.parent)
@@ -518,6 +1336,7 @@ class AliceVision:
                 "log_file": log_path,
             }
 
+    @_resumable("02_featureExtraction")
     def featureExtraction(self, inputSfm: Optional[Union[str, Path]] = None) -> None:
         """
         Extracts features from a set of images using `aliceVision_featureExtraction`.
@@ -549,10 +1368,103 @@ class AliceVision:
         cmd = self._add_desc_presets(cmd, addAll=True)
 
         # Add other arguments
-        cmd += " --forceCpuExtraction 0 --maxThreads 0"  # NOTE: maxThreads 0 means "automatic"
+        cmd += " --forceCpuExtraction 0"  # NOTE: `_parallelRunner()` sets `--maxThreads` per block
 
-        self._parallelRunner(cmd, out_path, "featureExtraction")
+        if self.feature_cache is None:
+            self._parallelRunner(cmd, out_path, "featureExtraction")
+            return
 
+        # NOTE: The manifest gets the full command, since the cache decides which views are extracted
+        if self._record_cmds([cmd]):
+            return
+        record, self._record = self._record, None
+        try:
+            self._cachedFeatureExtraction(cmd, Path(inputSfm), out_path)
+        finally:
+            self._record = record
+
+    def _cachedFeatureExtraction(
+        self, cmd: str, inputSfm: Path, out_path: Path
+    ) -> None:
+        """
+        Links the cached features of the unchanged images into `out_path`,
+        under the view IDs from `inputSfm`, & only extracts the features of
+        the remaining views. The new features are then added to the cache.
+        NOTE: Cached features are keyed by image hash & describer presets.
+
+        Parameters
+        ----------
+        cmd : str
+            featureExtraction command for all the views in `inputSfm`
+        inputSfm : Path
+            Path to the input sfm file
+        out_path : Path
+            Path to the output folder
+
+        """
+        describerPreset, describerQuality, describerTypes = self.descPresets.values()
+        cache = self.feature_cache / "-".join(
+            [describerPreset, describerQuality, describerTypes.replace(",", "+")]
+        )
+        cache.mkdir(parents=True, exist_ok=True)
+        suffixes = [
+            f".{describerType}.{ext}"
+            for describerType in describerTypes.split(",")
+            for ext in ["feat", "desc"]
+        ]
+
+        # Image hashes from earlier runs
+        hashes_file = self.feature_cache / IMAGE_HASHES_FILE
+        try:
+            for path, stat in json.loads(hashes_file.read_text()).items():
+                self._hashes[(path, stat["size"], stat["mtime_ns"])] = stat["sha256"]
+        except (OSError, ValueError):
+            pass
+
+        # Link the cached features
+        sfm = json.loads(inputSfm.read_text())
+        shas, uncached, images = {}, [], {}
+        for view in sfm["views"]:
+            image = Path(view["path"])
+            stat = image.stat()
+            shas[view["viewId"]] = sha = self._file_hash(image, stat)
+            images[str(image)] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha,
+            }
+            if all((cache / f"{sha}{suffix}").exists() for suffix in suffixes):
+                for suffix in suffixes:
+                    _link(
+                        cache / f"{sha}{suffix}", out_path / f"{view['viewId']}{suffix}"
+                    )
+            else:
+                uncached.append(view)
+        hashes_file.write_text(json.dumps(images, indent=2))
+        self.logger.info(
+            f"Found cached features for {len(shas) - len(uncached)} / {len(shas)} views in {cache}."
+        )
+
+        # Extract the features of the remaining views
+        if uncached:
+            uncachedSfm = out_path / "uncachedViews.sfm"
+            uncachedSfm.write_text(json.dumps({**sfm, "views": uncached}, indent=4))
+            cmd = cmd.replace(f" -i {inputSfm}", f" -i {uncachedSfm}")
+            self._parallelRunner(cmd, out_path, "featureExtraction", len(uncached))
+
+            for view in uncached:
+                for suffix in suffixes:
+                    feature_file = out_path / f"{view['viewId']}{suffix}"
+                    if feature_file.exists():
+                        _link(feature_file, cache / f"{shas[view['viewId']]}{suffix}")
+
+        # Drop the features of the images that are no longer in the mesh
+        current = set(shas.values())
+        for cached in cache.iterdir():
+            if cached.name.split(".")[0] not in current:
+                cached.unlink()
+
+    @_resumable("03_imageMatching")
     def imageMatching(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -596,8 +1508,42 @@ class AliceVision:
         cmd, tree_path = self._check_input(cmd, tree_path, arg="-t")
 
         log_file = out_path / "imageMatching.log"
-        self._serialRunner(cmd, log_file)
-
+        split = self._split_views(inputSfm)
+        if split is None:
+            self._batchRunner([(cmd, log_file)])
+            return
+
+        # Incremental matching - only pairs with new views, i.e., new-new & new-old
+        old, new, id_map = split
+        self.logger.info(
+            f"Matching {len(new)} new views against {len(old)} views from {self.previous_run}."
+        )
+        previousPairs = self.previous_run / "03_imageMatching/imageMatches.txt"
+        self._record_input(previousPairs)
+        sfm = json.loads(Path(inputSfm).read_text())
+        oldSfm, newSfm = out_path / "oldViews.sfm", out_path / "newViews.sfm"
+        newPairs = out_path / "newImageMatches.txt"
+        cmd = cmd.replace(f"-o {out_file}", f"-o {newPairs}")
+        cmd = cmd.replace(
+            f" -i {inputSfm}",
+            f" -i {newSfm} --inputB {oldSfm} --matchingMode a/a+a/b",
+        )
+        if not self._dry_run:
+            oldSfm.write_text(json.dumps({**sfm, "views": old}, indent=4))
+            newSfm.write_text(json.dumps({**sfm, "views": new}, indent=4))
+
+        self._batchRunner([(cmd, log_file)])
+
+        # Previous pairs (among the old views) + new pairs
+        if not self._dry_run:
+            with open(out_file, "w") as out:
+                for line in previousPairs.read_text().splitlines():
+                    ids = [id_map[i] for i in line.split() if i in id_map]
+                    if len(ids) > 1:
+                        out.write(" ".join(ids) + "\n")
+                out.write(newPairs.read_text())
+
+    @_resumable("04_featureMatching")
     def featureMatching(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -653,8 +1599,27 @@ class AliceVision:
         # Add other arguments
         cmd += " --guidedMatching 1"  # NOTE: guidedMatching set to True
 
+        # Incremental matching - reuse the matches of the old pairs
+        newPairs = Path(imagePairsList).with_name("newImageMatches.txt")
+        split = self._split_views(inputSfm)
+        if split is not None and newPairs.exists():
+            _, _, id_map = split
+            previousMatches = self.previous_run / "04_featureMatching"
+            self._record_input(previousMatches)
+            cmd = cmd.replace(f" -l {imagePairsList}", f" -l {newPairs}")
+            if not self._dry_run:
+                num_pairs = _remap_matches(
+                    sorted(previousMatches.glob("*.matches.txt")),
+                    out_path / "previous.matches.txt",
+                    id_map,
+                )
+                self.logger.info(
+                    f"Reused the matches of {num_pairs} pairs from {previousMatches}."
+                )
+
         self._parallelRunner(cmd, out_path, "featureMatching")
 
+    @_resumable("05_structureFromMotion")
     def structureFromMotion(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -710,8 +1675,9 @@ class AliceVision:
         cmd = self._add_desc_presets(cmd)
 
         log_file = out_path / "structureFromMotion.log"
-        self._serialRunner(cmd, log_file)
+        self._batchRunner([(cmd, log_file)])
 
+    @_resumable("06_sfmTransform")
     def sfmTransform(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -767,14 +1733,16 @@ class AliceVision:
             alt=self.cache_dir / "05_structureFromMotion/cameras.sfm",
             arg="--outputViewsAndPoses",
         )
+        self._record_output(outputViewsAndPoses)
 
         # Add transformation presets
         applyScale, applyRotation, applyTranslation = [0, 1, 1]
         cmd += f" --applyScale {applyScale} --applyRotation {applyRotation} --applyTranslation {applyTranslation}"
 
         log_file = out_path / "sfmTransform.log"
-        self._serialRunner(cmd, log_file)
+        self._batchRunner([(cmd, log_file)])
 
+    @_resumable("07_sfmRotate")
     def sfmRotate(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -784,6 +1752,7 @@ class AliceVision:
     ) -> None:
         """
         Rotates the SfM data using `aliceVision_utils_sfmTransform`.
+        With `export_sfm`, also exports the result with `aliceVision_convertSfMFormat`.
 
         Parameters
         ----------
@@ -837,10 +1806,19 @@ class AliceVision:
             alt=self.cache_dir / "05_structureFromMotion/cameras.sfm",
             arg="--outputViewsAndPoses",
         )
+        self._record_output(outputViewsAndPoses)
 
         log_file = out_path / "sfmRotate.log"
-        self._serialRunner(cmd, log_file)
+        self._batchRunner([(cmd, log_file)])
+
+        # Export the views, intrinsics, poses & sparse points as JSON
+        if self.export_sfm:
+            node_path = self.exec_path / self._nodes["convertSfMFormat"]
+            cmd = f"{node_path} -i {out_file} -o {out_path / SFM_EXPORT_FILE}"
+            cmd += f" --verboseLevel {self.verboseLevel} --observations 0"
+            self._batchRunner([(cmd, out_path / "convertSfMFormat.log")])
 
+    @_resumable("08_prepareDenseScene")
     def prepareDenseScene(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -872,6 +1850,7 @@ class AliceVision:
 
         self._parallelRunner(cmd, out_path, "prepareDenseScene")
 
+    @_resumable("09_depthMapEstimation")
     def depthMapEstimation(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -917,6 +1896,7 @@ class AliceVision:
 
         self._parallelRunner(cmd, out_path, "depthMapEstimation")
 
+    @_resumable("10_depthMapFiltering")
     def depthMapFiltering(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -959,6 +1939,7 @@ class AliceVision:
 
         self._parallelRunner(cmd, out_path, "depthMapFiltering")
 
+    @_resumable("11_meshing")
     def meshing(
         self,
         inputSfm: Optional[Union[str, Path]] = None,
@@ -1018,8 +1999,10 @@ class AliceVision:
         )
 
         log_file = out_path / "meshing.log"
-        self._serialRunner(cmd, log_file)
+        _, threads, extra_args = self._admit("meshing", 1, self.cpu_count)
+        self._batchRunner([(cmd, log_file)], 1, threads, extra_args)
 
+    @_resumable("12_meshFiltering")
     def meshFiltering(
         self,
         inputMesh: Optional[Union[str, Path]] = None,
@@ -1059,8 +2042,9 @@ class AliceVision:
         cmd += f" --keepLargestMeshOnly {keepLargestMeshOnly}"
 
         log_file = out_path / "meshFiltering.log"
-        self._serialRunner(cmd, log_file)
+        self._batchRunner([(cmd, log_file)])
 
+    @_resumable("13_meshDecimate")
     def meshDecimate(
         self,
         inputMesh: Optional[Union[str, Path]] = None,
@@ -1103,7 +2087,7 @@ class AliceVision:
         )
 
         log_file = out_path / "meshDecimate.log"
-        self._serialRunner(cmd, log_file)
+        self._batchRunner([(cmd, log_file)])
 
     # FIXME: Resampled meshes cannot be textured using the dense.abc generated by `Meshing`. Leaves untextured areas.
     # def meshResampling(
@@ -1164,6 +2148,7 @@ class AliceVision:
 
     #     self._serialRunner(cmd)
 
+    @_resumable("14_meshDenoising")
     def meshDenoising(
         self,
         useDecimated: Optional[bool] = True,
@@ -1229,9 +2214,9 @@ class AliceVision:
             out_path / "meshDenoising.raw.log",
         ]
         cmds_and_logs = list(zip(cmds, logs))
-        with Pool(2) as pool:
-            pool.starmap(self._serialRunner, cmds_and_logs)
+        self._batchRunner(cmds_and_logs, 2)
 
+    @_resumable("15_texturing")
     def texturing(
         self,
         useDecimated: Optional[bool] = True,
@@ -1320,8 +2305,7 @@ class AliceVision:
 
         logs = [out_path / "texturing.deci.log", out_path / "texturing.raw.log"]
         cmds_and_logs = list(zip(cmds, logs))
-        with Pool(2) as pool:
-            pool.starmap(self._serialRunner, cmds_and_logs)
+        self._batchRunner(cmds_and_logs, 2)
 
     def _run_all(
         self,
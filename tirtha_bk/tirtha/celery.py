@@ -2,13 +2,17 @@ import os
 import logging
 
 from celery import Celery
-from celery.signals import task_failure
+from celery.signals import task_failure, worker_init
+from kombu import Queue
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tirtha_bk.settings")
 
 app = Celery("tirtha")
 
+# Setup logger for task failure handling
+logger = logging.getLogger(__name__)
+
 # Using a string here means the worker doesn't have to serialize
 # the configuration object to child processes.
 # - namespace='CELERY' means all celery-related configuration keys
@@ -18,16 +22,124 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
+# Queues & routing
+# NOTE: Run one worker per queue, named after it, e.g.,
+# `celery -A tirtha worker -Q recon_gs -n recon_gs@%h` (see `build/start.sh`).
+# Each worker then takes its pool settings from `WORKER_POOLS`.
+QUEUES = (
+    "default",  # Dispatch, e.g., `recon_runner_task`
+    "imageops",  # Image checks - NSFW & quality models
+    "recon_av",  # aliceVision reconstruction - CPU & GPU heavy
+    "recon_gs",  # GS training - GPU heavy
+    "publish",  # Post-processing & publishing
+    "email",  # Notifications - I/O bound
+    "maintenance",  # Archiving runs across devices, backups & DB cleanup
+)
+app.conf.task_queues = [Queue(queue) for queue in QUEUES]
+app.conf.task_default_queue = "default"
+app.conf.task_routes = {
+    "tirtha.tasks.post_save_contrib_imageops": {"queue": "imageops"},
+    "tirtha.tasks.recon_runner_task": {"queue": "default"},
+    "tirtha.tasks.recon_coalesce_task": {"queue": "default"},
+    "tirtha.tasks.recon_sweep_task": {"queue": "default"},
+    "tirtha.tasks.recon_dispatch_task": {"queue": "default"},
+    "tirtha.tasks.recon_job_end_task": {"queue": "default"},
+    "tirtha.tasks.send_email_task": {"queue": "email"},
+    "tirtha.tasks.archive_run_task": {"queue": "maintenance"},
+    "tirtha.tasks.backup_task": {"queue": "maintenance"},
+    "tirtha.tasks.db_cleanup_task": {"queue": "maintenance"},
+}
+
+# NOTE: The ops' tasks are queued per step (see `tasks.ops_workflow()`)
+OPS_QUEUES = {"aV": "recon_av", "GS": "recon_gs"}  # `ops_start_task`, i.e., a new Run
+STEP_QUEUES = {  # `ops_step_task`
+    "run_aliceVision": "recon_av",
+    "run_obj2gltf": "publish",
+    "run_meshopt": "publish",
+    "run_splatfacto": "recon_gs",
+    "run_postprocess": "publish",
+    "run_cleanup": "publish",
+    "run_ark": "publish",
+    "run_finalize": "publish",
+}
+
+# Pool settings per queue
+# NOTE: `max_tasks_per_child` is None for `imageops`, so that its models stay loaded across tasks.
+# The reconstruction queues take one task at a time; their GPU-heavy steps also take turns
+# across workers (`GPU_CONCURRENCY`). The queues of the ops' steps use prefork pools, since only
+# those enforce the steps' time limits (`RECON_STEP_TIME_LIMITS`). Their children are daemonic,
+# so the steps run their commands in threads, not in process pools.
+WORKER_POOLS = {
+    "default": {
+        "pool": "threads",
+        "concurrency": 2,
+        "prefetch_multiplier": 1,
+        "max_tasks_per_child": None,
+    },
+    "imageops": {
+        "pool": "threads",
+        "concurrency": 1,
+        "prefetch_multiplier": 1,
+        "max_tasks_per_child": None,
+    },
+    "recon_av": {
+        "pool": "prefork",
+        "concurrency": 1,
+        "prefetch_multiplier": 1,
+        "max_tasks_per_child": 1,
+    },
+    "recon_gs": {
+        "pool": "prefork",
+        "concurrency": 1,
+        "prefetch_multiplier": 1,
+        "max_tasks_per_child": 1,
+    },
+    "publish": {
+        "pool": "prefork",
+        "concurrency": 2,
+        "prefetch_multiplier": 1,
+        "max_tasks_per_child": None,
+    },
+    "email": {
+        "pool": "threads",
+        "concurrency": 4,
+        "prefetch_multiplier": 4,
+        "max_tasks_per_child": None,
+    },
+    "maintenance": {
+        "pool": "threads",
+        "concurrency": 1,
+        "prefetch_multiplier": 1,
+        "max_tasks_per_child": None,
+    },
+}
+
+
+@worker_init.connect
+def configure_worker_pool(sender=None, **kwargs):
+    """
+    Applies the pool settings of `WORKER_POOLS` to a worker named after its queue, e.g.,
+    `recon_gs@host`. Other workers keep their CLI / Django settings.
+    NOTE: `worker_init` fires before the worker builds its pool, so these take effect.
+
+    """
+    queue = sender.hostname.split("@")[0]
+    pool = WORKER_POOLS.get(queue)
+    if pool is None:
+        return
+
+    sender.pool_cls = pool["pool"]
+    sender.concurrency = pool["concurrency"]
+    sender.prefetch_multiplier = pool["prefetch_multiplier"]
+    sender.max_tasks_per_child = pool["max_tasks_per_child"]
+    logger.info(f"Worker {sender.hostname}: {pool}")
+
 
 @app.task(bind=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
 
 
-# Setup logger for task failure handling
-logger = logging.getLogger(__name__)
-
-
 @task_failure.connect
 def task_failure_handler(
     sender=None, task_id=None, exception=None, traceback=None, einfo=None, **kwargs
@@ -46,6 +158,8 @@ def task_failure_handler(
     if sender and sender.name in [
         "tirtha.tasks.post_save_contrib_imageops",
         "tirtha.tasks.recon_runner_task",
+        "tirtha.tasks.ops_start_task",
+        "tirtha.tasks.ops_step_task",
     ]:
         logger.info(
             f"Task {sender.name} failed - task-level error handling should have already sent notification"
@@ -31,6 +31,26 @@ def get_admin_emails() -> List[str]:
     return admin_emails
 
 
+def queue_email(func_name: str, **kwargs) -> None:
+    """
+    Queues an email on the `email` queue (see `tirtha/celery.py`), so that the
+    reconstruction & image check workers do not wait on SMTP.
+    Sends it right away, if the broker is unreachable.
+
+    Args:
+        func_name (str): Name of the `send_*` function in this module
+        **kwargs: Its (JSON-serializable) arguments
+
+    """
+    from .tasks import send_email_task  # NOTE: Avoids a circular import
+
+    try:
+        send_email_task.delay(func_name, kwargs)
+    except Exception as e:
+        logger.warning(f"Failed to queue {func_name}: {e}; sending it now.")
+        globals()[func_name](**kwargs)
+
+
 def send_contribution_processing_failure_email(
     contribution_id: str,
     mesh_id: str,
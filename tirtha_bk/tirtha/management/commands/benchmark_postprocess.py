@@ -0,0 +1,379 @@
+"""
+Django management command to benchmark the Gaussian Splat post-processing
+(`tirtha.postprocess.PostProcess`) against its previous, loop-based implementation.
+
+Usage: `python manage.py benchmark_postprocess [--points 500000] [--seed 0]`
+
+A synthetic cloud (dense blobs + uniform floaters) is written to a temporary
+`.ply` file, loaded through `PostProcess` and filtered by both implementations.
+NOTE: Only times them - `tirtha.tests.PostProcessTests` checks that the outputs match.
+
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from collections import deque
+from io import BytesIO
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from plyfile import PlyData, PlyElement
+from sklearn.neighbors import NearestNeighbors
+
+# Local imports
+from tirtha.postprocess import SPLAT_DTYPE, SPLAT_FIELDS, PostProcess
+
+
+# 3DGS `.ply` layout, as exported by `ns-export gaussian-splat`
+PLY_DTYPE = [
+    ("x", "f4"),
+    ("y", "f4"),
+    ("z", "f4"),
+    ("nx", "f4"),
+    ("ny", "f4"),
+    ("nz", "f4"),
+    ("f_dc_0", "f4"),
+    ("f_dc_1", "f4"),
+    ("f_dc_2", "f4"),
+    *[(f"f_rest_{i}", "f4") for i in range(45)],
+    ("opacity", "f4"),
+    ("scale_0", "f4"),
+    ("scale_1", "f4"),
+    ("scale_2", "f4"),
+    ("rot_0", "f4"),
+    ("rot_1", "f4"),
+    ("rot_2", "f4"),
+    ("rot_3", "f4"),
+]
+
+
+def make_synthetic_cloud(num_points: int, seed: int = 0) -> np.ndarray:
+    """
+    Creates a synthetic Gaussian Splat with a few dense blobs and ~5% uniform floaters.
+
+    """
+    rng = np.random.default_rng(seed)
+    data = np.zeros(num_points, dtype=PLY_DTYPE)
+
+    num_floaters = num_points // 20
+    centers = rng.uniform(-4, 4, size=(4, 3))
+    blob_ids = rng.integers(0, len(centers), size=num_points - num_floaters)
+    coords = np.concatenate(
+        [
+            centers[blob_ids] + rng.normal(0, 1.5, size=(len(blob_ids), 3)),
+            rng.uniform(-40, 40, size=(num_floaters, 3)),
+        ]
+    )
+    coords = coords[rng.permutation(num_points)]  # Mimic unordered `.ply` exports
+
+    for i, ax in enumerate(("x", "y", "z")):
+        data[ax] = coords[:, i]
+    for name in ("f_dc_0", "f_dc_1", "f_dc_2", "opacity"):
+        data[name] = rng.normal(0, 1.5, size=num_points)
+    for name in ("scale_0", "scale_1", "scale_2"):
+        data[name] = rng.normal(-4, 1, size=num_points)
+    for name in ("rot_0", "rot_1", "rot_2", "rot_3"):
+        data[name] = rng.normal(0, 1, size=num_points)
+
+    return data
+
+
+"""
+Reference (previous) implementations
+
+"""
+
+
+def _count_voxels_chunk(vertices_chunk: np.ndarray, voxel_size: float) -> dict:
+    voxel_counts = {}
+    for vertex in vertices_chunk:
+        voxel_coords = (
+            int(vertex["x"] / voxel_size),
+            int(vertex["y"] / voxel_size),
+            int(vertex["z"] / voxel_size),
+        )
+        if voxel_coords in voxel_counts:
+            voxel_counts[voxel_coords] += 1
+        else:
+            voxel_counts[voxel_coords] = 1
+
+    return voxel_counts
+
+
+def legacy_density_filter(
+    vertices: np.ndarray, voxel_size: float, thresh_percen: float
+) -> np.ndarray:
+    """
+    Loop-based density filter, as used by `PostProcess` before vectorization.
+
+    """
+    num_cores = max(1, cpu_count() // 2)
+    chunk_size = max(1, len(vertices) // num_cores)
+    chunks = [vertices[i : i + chunk_size] for i in range(0, len(vertices), chunk_size)]
+    with Pool(processes=num_cores) as pool:
+        results = pool.starmap(
+            _count_voxels_chunk, [(chunk, voxel_size) for chunk in chunks]
+        )
+
+    voxel_counts = {}
+    for result in results:
+        for k, v in result.items():
+            voxel_counts[k] = voxel_counts.get(k, 0) + v
+
+    threshold = int(len(vertices) * thresh_percen / 100.0)
+    dense_voxels = {k: v for k, v in voxel_counts.items() if v >= threshold}
+
+    visited = set()
+    max_cluster = set()
+    for voxel in dense_voxels:
+        if voxel not in visited:
+            current_cluster = set()
+            queue = deque([voxel])
+            while queue:
+                current_voxel = queue.popleft()
+                visited.add(current_voxel)
+                current_cluster.add(current_voxel)
+                x, y, z = current_voxel
+                for neighbor in [
+                    (x - 1, y, z),
+                    (x + 1, y, z),
+                    (x, y - 1, z),
+                    (x, y + 1, z),
+                    (x, y, z - 1),
+                    (x, y, z + 1),
+                ]:
+                    if neighbor in dense_voxels and neighbor not in visited:
+                        queue.append(neighbor)
+                        visited.add(neighbor)
+            if len(current_cluster) > len(max_cluster):
+                max_cluster = current_cluster
+
+    filtered_vertices = [
+        vertex
+        for vertex in vertices
+        if (
+            int(vertex["x"] / voxel_size),
+            int(vertex["y"] / voxel_size),
+            int(vertex["z"] / voxel_size),
+        )
+        in max_cluster
+    ]
+
+    return np.array(filtered_vertices, dtype=vertices.dtype)
+
+
+def legacy_remove_floaters(
+    vertices: np.ndarray, k: int, threshold_factor: float, chunk_size: int = 50_000
+) -> np.ndarray:
+    """
+    Per-chunk floater removal, as used by `PostProcess` before the global KD-tree.
+    NOTE: The per-vertex `pool.map()` is replaced by one `kneighbors()` call per chunk
+    to keep the benchmark tractable. The output is the same.
+
+    """
+    num_vertices = len(vertices)
+    k = max(3, min(k, num_vertices // 100))
+    masks = []
+    for start_idx in range(0, num_vertices, chunk_size):
+        end_idx = min(start_idx + chunk_size, num_vertices)
+        chunk_coords = np.vstack(
+            (
+                vertices["x"][start_idx:end_idx],
+                vertices["y"][start_idx:end_idx],
+                vertices["z"][start_idx:end_idx],
+            )
+        ).T
+        nbrs = NearestNeighbors(n_neighbors=k + 1, algorithm="ball_tree").fit(
+            chunk_coords
+        )
+        distances, _ = nbrs.kneighbors(chunk_coords)
+        avg_distances = distances[:, 1:].mean(axis=1)
+        threshold = np.mean(avg_distances) + threshold_factor * np.std(avg_distances)
+        masks.append(avg_distances < threshold)
+
+    return vertices[np.concatenate(masks)]
+
+
+def legacy_convert(vertices: np.ndarray) -> bytes:
+    """
+    Per-vertex `.splat` encoder, as used by `PostProcess.run_convert()` before vectorization.
+
+    """
+    sorted_indices = np.argsort(
+        -np.exp(vertices["scale_0"] + vertices["scale_1"] + vertices["scale_2"])
+        / (1 + np.exp(-vertices["opacity"]))
+    )
+    buffer = BytesIO()
+    for idx in sorted_indices:
+        v = vertices[idx]
+        position = np.array([v["x"], v["y"], v["z"]], dtype=np.float32)
+        scales = np.exp(
+            np.array([v["scale_0"], v["scale_1"], v["scale_2"]], dtype=np.float32)
+        )
+        rot = np.array(
+            [v["rot_0"], v["rot_1"], v["rot_2"], v["rot_3"]], dtype=np.float32
+        )
+        SH_C0 = 0.28209479177387814
+        color = np.array(
+            [
+                0.5 + SH_C0 * v["f_dc_0"],
+                0.5 + SH_C0 * v["f_dc_1"],
+                0.5 + SH_C0 * v["f_dc_2"],
+                1 / (1 + np.exp(-v["opacity"])),
+            ]
+        )
+        buffer.write(position.tobytes())
+        buffer.write(scales.tobytes())
+        buffer.write((color * 255).clip(0, 255).astype(np.uint8).tobytes())
+        buffer.write(
+            ((rot / np.linalg.norm(rot)) * 128 + 128)
+            .clip(0, 255)
+            .astype(np.uint8)
+            .tobytes()
+        )
+
+    return buffer.getvalue()
+
+
+def same_columns(a: np.ndarray, b: np.ndarray, fields: tuple = SPLAT_FIELDS) -> bool:
+    """
+    Checks if two structured arrays have the same values in the given columns.
+
+    """
+    return len(a) == len(b) and all(
+        a[name].tobytes() == b[name].tobytes() for name in fields
+    )
+
+
+class Command(BaseCommand):
+    help = "Benchmark Gaussian Splat post-processing against the previous implementation on a synthetic cloud."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--points",
+            type=int,
+            default=500_000,
+            help="Number of Gaussians in the synthetic cloud (default: 500000)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the synthetic cloud (default: 0)",
+        )
+
+    def _timed(self, label: str, func, *args, **kwargs):
+        start = time.perf_counter()
+        out = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"  {label}: {elapsed:.3f}s")
+
+        return out, elapsed
+
+    def handle(self, *args, **options):
+        num_points, seed = options["points"], options["seed"]
+        self.stdout.write(f"Generating synthetic cloud with {num_points} Gaussians...")
+        cloud = make_synthetic_cloud(num_points, seed)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            inp = tmp / "splat.ply"
+            PlyData([PlyElement.describe(cloud, "vertex")]).write(inp)
+
+            # Ingestion
+            self.stdout.write(".ply ingestion:")
+            full, _ = self._timed(
+                "previous (PlyData.read)", lambda: PlyData.read(inp)["vertex"].data
+            )
+            postproc, _ = self._timed(
+                "current (np.memmap)",
+                PostProcess,
+                input_path=inp,
+                output_path=tmp / "postprocessed.splat",
+                runDir=tmp,
+                log_path=tmp / "logs",
+            )
+            self.stdout.write(
+                f"  Filters carry {full.dtype.itemsize} B (previous)"
+                + f" vs. {postproc.index.itemsize} B (current) per vertex"
+            )
+            voxel_size, thresh_percen = map(float, postproc.dens_filt_args)
+
+            # Density filter
+            self.stdout.write("Density filter:")
+            ref, t_ref = self._timed(
+                "previous",
+                legacy_density_filter,
+                full,
+                voxel_size,
+                thresh_percen,
+            )
+            _, t_new = self._timed(
+                "current",
+                postproc.apply_density_filter,
+                voxel_size=voxel_size,
+                thresh_percen=thresh_percen,
+            )
+            self.stdout.write(
+                f"  Retained {len(ref)} / {num_points} | Speed-up: {t_ref / t_new:.1f}x"
+            )
+
+            # Floater removal
+            self.stdout.write("Floater removal:")
+            k, threshold_factor = int(postproc.rem_float_args[0]), float(
+                postproc.rem_float_args[1]
+            )
+            num_dense = len(postproc.index)
+            ref, t_ref = self._timed(
+                "previous (per-chunk)",
+                legacy_remove_floaters,
+                ref,
+                k,
+                threshold_factor,
+            )
+            _, t_new = self._timed(
+                "current (global)",
+                postproc.remove_floaters,
+                k=k,
+                threshold_factor=threshold_factor,
+            )
+            self.stdout.write(
+                f"  Retained {len(ref)} (previous) & {len(postproc.index)} (current) / {num_dense}"
+                + f" | Speed-up: {t_ref / t_new:.1f}x"
+            )
+
+            # `.splat` conversion
+            self.stdout.write(".splat conversion:")
+            ref, t_ref = self._timed("previous", legacy_convert, postproc.data)
+            _, t_new = self._timed("current", postproc.run_convert)
+            self.stdout.write(
+                f"  Wrote {postproc.output_path.stat().st_size} bytes | Speed-up: {t_ref / t_new:.1f}x"
+            )
+
+            # Streaming mode
+            self.stdout.write("Streaming mode:")
+            streamer = PostProcess(
+                input_path=inp,
+                output_path=tmp / "streamed.splat",
+                runDir=tmp,
+                log_path=tmp / "logs",
+                streaming=True,
+            )
+            self._timed(
+                "streaming (tiles on disk)",
+                streamer.run_ops_streaming,
+                chunk_size=max(1, num_points // 10),
+            )
+            num_records, num_streamed = (
+                path.stat().st_size // SPLAT_DTYPE.itemsize
+                for path in (postproc.output_path, streamer.output_path)
+            )
+            self.stdout.write(
+                f"  Wrote {num_streamed} (streaming) & {num_records} (in-memory) Gaussians"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Done."))
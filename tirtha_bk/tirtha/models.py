@@ -117,6 +117,10 @@ class Mesh(models.Model):
     reconstructed_at = models.DateTimeField(
         "Last reconstructed at", blank=True, null=True
     )
+    # Coalesced reconstruction - the contributions waiting out the quiet period - see `tasks.schedule_recon()`
+    pending_recon = models.JSONField(
+        default=dict, blank=True, verbose_name="Pending reconstruction"
+    )
 
     class Meta:
         ordering = ["-updated_at"]
@@ -385,6 +389,7 @@ class Run(models.Model):
         ("Processing", "Processing"),
         ("Error", "Error"),
         ("Manual", "Manual"),
+        ("Archiving", "Archiving"),  # Being moved to ARCHIVE_ROOT across devices
         ("Archived", "Archived"),
         (
             "Cancelled",
@@ -401,6 +406,12 @@ class Run(models.Model):
     # Notes for cancelled/errored runs (includes reason and log file path)
     notes = models.TextField(blank=True, verbose_name="Notes")
 
+    # Resource usage per step (wall & CPU time, peak RSS) - see `utils.summarize_profile()`
+    profile = models.JSONField(default=dict, blank=True, verbose_name="Profile")
+
+    # Checkpoint of the pipeline - the steps done & their outputs - see `BaseOps.run_step()`
+    state = models.JSONField(default=dict, blank=True, verbose_name="Pipeline state")
+
     # Metadata
     contributors = models.ManyToManyField(
         Contributor, verbose_name="Contributors", related_name="runs"
@@ -477,3 +488,108 @@ class Run(models.Model):
         if not self.directory:
             self.directory = f"{self.mesh.ID}/{str(self.kind).lower()}cache/{self.started_at.astimezone(pytz.timezone('Asia/Kolkata')).strftime('%Y-%m-%d-%H-%M-%S')}__{str(self.ID)}"
         super().save(update_fields=["directory"])
+
+
+class ReconJob(models.Model):
+    """
+    Reconstruction queue - one job per pending reconstruction of a mesh.
+    `tasks.recon_dispatch_task()` hands jobs to `recon_runner_task` by priority, fairness
+    across meshes & estimated cost.
+
+    """
+
+    ID = ShortUUIDField(
+        primary_key=True, length=16, max_length=16, verbose_name="Job ID"
+    )
+    mesh = models.ForeignKey(
+        Mesh, on_delete=models.CASCADE, verbose_name="Mesh ID", related_name="jobs"
+    )
+    # The latest contribution, i.e., the Runs' contributor
+    contribution = models.ForeignKey(
+        Contribution,
+        on_delete=models.CASCADE,
+        verbose_name="Contribution",
+        related_name="jobs",
+    )
+
+    recons_type_options = [
+        ("all", "All"),
+        ("aV", "Photogrammetry"),
+        ("GS", "Gaussian Splatting"),
+    ]
+    recons_type = models.CharField(
+        max_length=50,
+        blank=False,
+        choices=recons_type_options,
+        default="all",
+        verbose_name="Reconstruction type",
+    )
+
+    reason_options = [
+        ("First", "First reconstruction"),
+        ("Admin", "Admin-triggered"),
+        ("Incremental", "Incremental"),
+    ]
+    reason = models.CharField(
+        max_length=50, blank=False, choices=reason_options, default="Incremental"
+    )
+    # Lower runs first - set from `RECON_PRIORITIES`; operators can edit it to reorder
+    priority = models.IntegerField(default=0, verbose_name="Priority")
+    # Good images x `RECON_COST_WEIGHTS` of the kinds
+    cost = models.FloatField(default=0.0, verbose_name="Estimated cost")
+
+    # Multiple choices for status: [Queued, Dispatched, Done, Skipped, Cancelled]
+    status_options = [
+        ("Queued", "Queued"),
+        ("Dispatched", "Dispatched"),
+        ("Done", "Done"),
+        ("Skipped", "Skipped"),  # Failed `prerun_check()` or its runs never started
+        ("Cancelled", "Cancelled"),
+    ]
+    status = models.CharField(
+        max_length=50, blank=False, choices=status_options, default="Queued"
+    )
+    notes = models.TextField(blank=True, verbose_name="Notes")
+    # Ops of a dispatched job that have not ended - see `tasks.recon_job_end_task()`
+    ops = models.JSONField(default=list, blank=True, verbose_name="Ops running")
+
+    created_at = models.DateTimeField("Queued at", auto_now_add=True)
+    dispatched_at = models.DateTimeField("Dispatched at", blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Reconstruction job"
+        verbose_name_plural = "Reconstruction jobs"
+
+    def __str__(self):
+        return f"{self.ID}"
+
+
+class MeshLock(models.Model):
+    """
+    Lease on the runs of a kind on a mesh - held by one Run at a time, so that no two runs
+    share a run directory. The Run renews it while it works & for `MESH_LOCK_QUEUED_TTL`
+    between its steps, and it expires, if the Run's worker dies - see
+    `workers.acquire_mesh_lock()`.
+
+    """
+
+    mesh = models.ForeignKey(
+        Mesh, on_delete=models.CASCADE, verbose_name="Mesh ID", related_name="locks"
+    )
+    kind = models.CharField(
+        max_length=50, blank=False, choices=Run.kind_options, default="aV"
+    )
+    # Run ID of the holder - blank, if free
+    owner = models.CharField(max_length=16, blank=True, verbose_name="Owner")
+    acquired_at = models.DateTimeField("Acquired at", blank=True, null=True)
+    expires_at = models.DateTimeField("Expires at", blank=True, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["mesh", "kind"], name="unique_mesh_lock")
+        ]
+        verbose_name_plural = "Mesh locks"
+
+    def __str__(self):
+        return f"{self.mesh_id} ({self.kind})"
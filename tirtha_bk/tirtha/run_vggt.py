@@ -33,15 +33,27 @@ Key Features
 • Dual-mode Support: Run reconstructions using either VGGT or VGGT+BA
 • Resolution Preservation: Maintains original image resolution in camera parameters and tracks
 • COLMAP Compatibility: Exports results in standard COLMAP sparse reconstruction format
+• Memory-bounded Batches: Splits large scenes into overlapping batches, registered through their shared images
+• Model Server: With --serve, keeps the model loaded & runs jobs sent over a Unix socket
 
 """
 
 import random
 import numpy as np
 import glob
+import json
 import os
 import copy
+import contextlib
+import resource
+import signal
+import socketserver
+import sys
+import threading
+import time
+import traceback
 import torch
+from concurrent.futures import ThreadPoolExecutor
 import torch.nn.functional as F
 
 # Configure CUDA settings
@@ -66,6 +78,11 @@ from vggt.dependency.np_to_pycolmap import (
 )
 
 
+# Batching
+BYTES_PER_IMAGE = 0.2 * 2**30  # Rough peak memory per image at 518 px (VGGT-1B)
+MEMORY_HEADROOM = 0.8  # Fraction of the free memory to use
+MIN_ANCHOR_PIXELS = 1000  # Min. confident anchor depths to estimate a batch's scale
+
 # TODO: add support for masks
 # TODO: add iterative BA
 # TODO: add support for radial distortion, which needs extra_params
@@ -73,12 +90,12 @@ from vggt.dependency.np_to_pycolmap import (
 # TODO: test different camera types
 
 
-def parse_args():
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description="VGGT Demo")
     parser.add_argument(
         "--scene_dir",
         type=str,
-        required=True,
+        default=None,
         help="Directory containing the scene images",
     )
     parser.add_argument(
@@ -140,7 +157,351 @@ def parse_args():
         default=5.0,
         help="Confidence threshold value for depth filtering (wo BA)",
     )
-    return parser.parse_args()
+    ######### Batching & fallback #########
+    parser.add_argument(
+        "--max_batch_images",
+        type=int,
+        default=0,
+        help="Max. images per forward pass, incl. the overlap (0 to fit the free memory)",
+    )
+    parser.add_argument(
+        "--chunk_overlap",
+        type=int,
+        default=4,
+        help="Images shared by consecutive batches, to register them",
+    )
+    parser.add_argument(
+        "--loader_threads",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Threads to load & preprocess the images",
+    )
+    parser.add_argument(
+        "--min_confident_fraction",
+        type=float,
+        default=0.0,
+        help="Min. fraction of depths above --conf_thres_value, else no reconstruction is written",
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="Path to a JSON report on the batches & the confidence",
+    )
+    parser.add_argument(
+        "--stub_model",
+        action="store_true",
+        default=False,
+        help="Use a tiny stub model instead of VGGT-1B, for testing on CPU",
+    )
+    parser.add_argument(
+        "--stub_confidence",
+        type=float,
+        default=10.0,
+        help="Depth confidence predicted by the stub model",
+    )
+    ######### Model & server #########
+    parser.add_argument(
+        "--weights",
+        type=str,
+        default=None,
+        help="Path to local VGGT-1B weights (model.pt), else they are downloaded",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=False,
+        help="Never download anything, i.e., --weights is required",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        default=False,
+        help="Keep the model loaded & run jobs sent over --socket (--scene_dir is then unused)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default="/tmp/tirtha_vggt.sock",
+        help="Unix socket of the server",
+    )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        default=False,
+        help="Run a dummy forward pass once the server has loaded the model",
+    )
+    return parser.parse_args(argv)
+
+
+class StubVGGT(torch.nn.Module):
+    """
+    Tiny stand-in for VGGT with the same heads, to test the runner on CPU without the weights.
+    Predicts cameras along the x-axis, looking at a fronto-parallel plane at unit depth.
+
+    """
+
+    def __init__(self, confidence=10.0):
+        super().__init__()
+        self.confidence = confidence
+        self.depth = torch.nn.Parameter(torch.ones(1))
+
+    def aggregator(self, images):
+        # images: [B, S, 3, H, W]
+        return [images], None
+
+    def camera_head(self, aggregated_tokens_list):
+        images = aggregated_tokens_list[-1]
+        B, S = images.shape[:2]
+        # absT_quaR_FoV: translation, quaternion (XYZW) & field of view
+        pose_enc = torch.zeros(B, S, 9, device=images.device)
+        pose_enc[..., 0] = torch.arange(S, device=images.device) * 0.1
+        pose_enc[..., 6] = 1.0
+        pose_enc[..., 7:] = 1.0
+        return [pose_enc]
+
+    def depth_head(self, aggregated_tokens_list, images, ps_idx):
+        B, S, _, H, W = images.shape
+        depth_map = self.depth.expand(B, S, H, W, 1).to(images.device)
+        depth_conf = torch.full((B, S, H, W), self.confidence, device=images.device)
+        return depth_map, depth_conf
+
+
+def load_model(args, device):
+    if args.stub_model:
+        model = StubVGGT(args.stub_confidence)
+    else:
+        model = VGGT()
+        if args.weights:
+            state_dict = torch.load(args.weights, map_location="cpu")
+        elif args.offline:
+            raise FileNotFoundError("Offline mode needs local weights (--weights).")
+        else:
+            _URL = "https://huggingface.co/facebook/VGGT-1B/resolve/main/model.pt"
+            state_dict = torch.hub.load_state_dict_from_url(_URL)
+        model.load_state_dict(state_dict)
+    model.eval()
+    return model.to(device)
+
+
+def get_device_and_dtype():
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    if device == "cuda":
+        dtype = (
+            torch.bfloat16
+            if torch.cuda.get_device_capability()[0] >= 8
+            else torch.float16
+        )
+    else:
+        dtype = torch.float32
+    return device, dtype
+
+
+def auto_batch_size(device):
+    """
+    Max. images per forward pass that fit the free (GPU or system) memory
+
+    """
+    if device == "cuda":
+        free_bytes = torch.cuda.mem_get_info()[0]
+    else:
+        free_bytes = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    return max(2, int(free_bytes * MEMORY_HEADROOM / BYTES_PER_IMAGE))
+
+
+def make_batches(num_images, batch_size, overlap):
+    """
+    Splits the image indices into overlapping windows of at most `batch_size`. Each batch
+    starts with the last `overlap` images of the previous one, which register it.
+
+    """
+    if num_images <= batch_size:
+        return [list(range(num_images))]
+    overlap = min(max(overlap, 1), batch_size - 1)
+    batches, start = [], 0
+    while True:
+        end = min(start + batch_size, num_images)
+        batches.append(list(range(start, end)))
+        if end == num_images:
+            return batches
+        start = end - overlap
+
+
+def _homogeneous(extrinsic):
+    # [S, 3, 4] -> [S, 4, 4]
+    bottom = np.zeros((len(extrinsic), 1, 4))
+    bottom[..., 3] = 1.0
+    return np.concatenate([extrinsic, bottom], axis=1)
+
+
+def register_batch(
+    extrinsic,
+    depth_map,
+    depth_conf,
+    ref_extrinsic,
+    ref_depth,
+    ref_conf,
+    conf_thres,
+):
+    """
+    Brings a batch's cameras & depths into the merged frame, through its first images,
+    which are already merged (`ref_*`). VGGT normalises the scale of each forward pass,
+    so the scale comes from the ratio of their confident depths. The rotation is the
+    chordal mean over the shared images & the translation aligns their camera centres.
+
+    """
+    shared = len(ref_extrinsic)
+    mask = (depth_conf[:shared] >= conf_thres) & (ref_conf >= conf_thres)
+    if mask.sum() < MIN_ANCHOR_PIXELS:
+        mask = np.ones_like(mask)
+    scale = np.median(ref_depth[..., 0][mask]) / np.median(
+        depth_map[:shared, ..., 0][mask]
+    )
+
+    # Similarity from the batch's world to the merged world: X_ref = scale * R @ X + t
+    rotation = np.linalg.svd(
+        (ref_extrinsic[:, :, :3].transpose(0, 2, 1) @ extrinsic[:shared, :, :3]).sum(0)
+    )
+    rotation = (
+        rotation[0]
+        @ np.diag([1.0, 1.0, np.linalg.det(rotation[0] @ rotation[2])])
+        @ rotation[2]
+    )
+    centres = -np.einsum(
+        "sji,sj->si", extrinsic[:shared, :, :3], extrinsic[:shared, :, 3]
+    )
+    ref_centres = -np.einsum(
+        "sji,sj->si", ref_extrinsic[..., :3], ref_extrinsic[..., 3]
+    )
+    translation = (ref_centres - scale * centres @ rotation.T).mean(0)
+
+    # camera_from_ref = [R_c @ R.T | scale * t_c - R_c @ R.T @ t]
+    registered = np.empty_like(extrinsic)
+    registered[..., :3] = extrinsic[..., :3] @ rotation.T
+    registered[..., 3] = scale * extrinsic[..., 3] - registered[..., :3] @ translation
+    return registered, depth_map * scale, scale
+
+
+def _tail(arrays, n):
+    # Last `n` rows of a list of arrays, without concatenating all of them
+    rows = []
+    for arr in reversed(arrays):
+        rows.insert(0, arr[-n:])
+        n -= len(rows[0])
+        if n <= 0:
+            break
+    return np.concatenate(rows)
+
+
+def submit_images(executor, image_paths, load_resolution):
+    # Decodes the images in worker threads
+    return [
+        executor.submit(load_and_preprocess_images_square, [path], load_resolution)
+        for path in image_paths
+    ]
+
+
+def gather_images(futures):
+    loaded = [future.result() for future in futures]
+    return (
+        torch.cat([images for images, _ in loaded]),
+        torch.cat([original_coords for _, original_coords in loaded]),
+    )
+
+
+def run_batches(
+    model, image_path_list, batches, dtype, device, args, load_resolution, resolution
+):
+    """
+    Runs VGGT batch by batch, registers each batch to the ones before it & concatenates
+    the predictions. The next batch's images load in worker threads while a batch runs,
+    so at most two batches of images are in memory.
+
+    """
+    outputs = {
+        key: []
+        for key in (
+            "extrinsic",
+            "intrinsic",
+            "depth_map",
+            "depth_conf",
+            "points_rgb",
+            "original_coords",
+        )
+    }
+    scales = [1.0]
+    merged = 0  # Images merged so far
+    with ThreadPoolExecutor(args.loader_threads) as executor:
+        futures = submit_images(
+            executor, [image_path_list[i] for i in batches[0]], load_resolution
+        )
+        for b, batch in enumerate(batches):
+            images, original_coords = gather_images(futures)
+            if b + 1 < len(batches):  # Prefetch
+                futures = submit_images(
+                    executor,
+                    [image_path_list[i] for i in batches[b + 1]],
+                    load_resolution,
+                )
+            images = images.to(device)
+            extrinsic, intrinsic, depth_map, depth_conf, _, _ = run_VGGT(
+                model, images, dtype, args.prediction_mode, resolution
+            )
+            points_rgb = F.interpolate(
+                images,
+                size=(resolution, resolution),
+                mode="bilinear",
+                align_corners=False,
+            )
+            points_rgb = (points_rgb.cpu().numpy() * 255).astype(np.uint8)
+            points_rgb = points_rgb.transpose(0, 2, 3, 1)
+            original_coords = original_coords.cpu().numpy()
+            del images
+            if device == "cuda":
+                torch.cuda.empty_cache()
+
+            shared = merged - batch[0]  # Images shared with the previous batch
+            if shared > 0:
+                extrinsic, depth_map, scale = register_batch(
+                    extrinsic,
+                    depth_map,
+                    depth_conf,
+                    _tail(outputs["extrinsic"], shared),
+                    _tail(outputs["depth_map"], shared),
+                    _tail(outputs["depth_conf"], shared),
+                    args.conf_thres_value,
+                )
+                scales.append(float(scale))
+            print(
+                f"Batch {b + 1}/{len(batches)}: {len(batch)} images, scale {scales[-1]:.4f}"
+            )
+
+            for key, value in zip(
+                outputs,
+                (
+                    extrinsic,
+                    intrinsic,
+                    depth_map,
+                    depth_conf,
+                    points_rgb,
+                    original_coords,
+                ),
+            ):
+                # Drop the shared images' duplicates
+                outputs[key].append(value[max(shared, 0) :])
+            merged = batch[-1] + 1
+
+    outputs = {key: np.concatenate(value) for key, value in outputs.items()}
+    outputs["scales"] = scales
+    return outputs
+
+
+def write_report(args, report):
+    print("Report:", report)
+    if args.report is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=4)
 
 
 def run_VGGT(model, images, dtype, prediction_mode="depth", resolution=518):
@@ -155,7 +516,11 @@ def run_VGGT(model, images, dtype, prediction_mode="depth", resolution=518):
     )
 
     with torch.no_grad():
-        with torch.cuda.amp.autocast(dtype=dtype):
+        with torch.autocast(
+            device_type=images.device.type,
+            dtype=dtype,
+            enabled=images.device.type == "cuda",
+        ):
             images = images[None]  # add batch dimension
             aggregated_tokens_list, ps_idx = model.aggregator(images)
 
@@ -184,9 +549,11 @@ def run_VGGT(model, images, dtype, prediction_mode="depth", resolution=518):
     return extrinsic, intrinsic, depth_map, depth_conf, point_map, point_conf
 
 
-def demo_fn(args):
+def demo_fn(args, model=None):
     # Print configuration
     print("Arguments:", vars(args))
+    if args.scene_dir is None:
+        raise ValueError("--scene_dir is required")
 
     # Set seed for reproducibility
     np.random.seed(args.seed)
@@ -198,53 +565,90 @@ def demo_fn(args):
     print(f"Setting seed as: {args.seed}")
 
     # Set device and dtype
-    dtype = (
-        torch.bfloat16 if torch.cuda.get_device_capability()[0] >= 8 else torch.float16
-    )
-    device = "cuda" if torch.cuda.is_available() else "cpu"
+    device, dtype = get_device_and_dtype()
     print(f"Using device: {device}")
     print(f"Using dtype: {dtype}")
 
     # Run VGGT for camera and depth estimation
-    model = VGGT()
-    _URL = "https://huggingface.co/facebook/VGGT-1B/resolve/main/model.pt"
-    model.load_state_dict(torch.hub.load_state_dict_from_url(_URL))
-    model.eval()
-    model = model.to(device)
-    print("Model loaded")
+    # NOTE: The server passes its resident model
+    if model is None:
+        model = load_model(args, device)
+        print("Model loaded")
 
-    # Get image paths and preprocess them
+    # Get image paths
     image_dir = os.path.join(args.scene_dir, "images")
-    image_path_list = glob.glob(os.path.join(image_dir, "*"))
+    image_path_list = sorted(glob.glob(os.path.join(image_dir, "*")))
     if len(image_path_list) == 0:
         raise ValueError(f"No images found in {image_dir}")
     base_image_path_list = [os.path.basename(path) for path in image_path_list]
 
-    # Load images and original coordinates
     # Load Image in 1024, while running VGGT with 518
     vggt_fixed_resolution = 518
     img_load_resolution = 1024
 
-    images, original_coords = load_and_preprocess_images_square(
-        image_path_list, img_load_resolution
-    )
-    images = images.to(device)
-    original_coords = original_coords.to(device)
-    print(f"Loaded {len(images)} images from {image_dir}")
+    # Split the images into batches that fit the memory
+    batch_size = args.max_batch_images or auto_batch_size(device)
+    batches = make_batches(len(image_path_list), batch_size, args.chunk_overlap)
+    if args.use_ba and len(batches) > 1:
+        # NOTE: Tracks are predicted jointly over all the images
+        print(f"BA needs a single batch, but got {len(batches)}. Skipping BA.")
+        args.use_ba = False
+    print(f"Running {len(image_path_list)} images in {len(batches)} batch(es)")
 
     # Run VGGT to estimate camera and depth
     # Run with 518x518 images
-    extrinsic, intrinsic, depth_map, depth_conf, point_map, point_conf = run_VGGT(
-        model, images, dtype, args.prediction_mode, vggt_fixed_resolution
+    predictions = run_batches(
+        model,
+        image_path_list,
+        batches,
+        dtype,
+        device,
+        args,
+        img_load_resolution,
+        vggt_fixed_resolution,
     )
+    extrinsic = predictions["extrinsic"]
+    intrinsic = predictions["intrinsic"]
+    depth_map = predictions["depth_map"]
+    depth_conf = predictions["depth_conf"]
+    original_coords = predictions["original_coords"]
+    del model
+    if device == "cuda":
+        torch.cuda.empty_cache()
+
+    # Too few confident depths, e.g., textureless or reflective scenes
+    frame_confidence = (depth_conf >= args.conf_thres_value).mean(axis=(1, 2))
+    confident_fraction = float(frame_confidence.mean())
+    report = {
+        "images": len(image_path_list),
+        "batches": len(batches),
+        "batch_size": batch_size,
+        "chunk_overlap": args.chunk_overlap,
+        "scales": predictions["scales"],
+        "confident_fraction": confident_fraction,
+        "min_frame_confident_fraction": float(frame_confidence.min()),
+        "min_confident_fraction": args.min_confident_fraction,
+        "ok": confident_fraction >= args.min_confident_fraction,
+    }
+    if not report["ok"]:
+        print(
+            f"Only {confident_fraction:.1%} of the depths are confident. No reconstruction written."
+        )
+        write_report(args, report)
+        return False
+
     points_3d = unproject_depth_map_to_point_map(depth_map, extrinsic, intrinsic)
 
     if args.use_ba:
+        images, _ = load_and_preprocess_images_square(
+            image_path_list, img_load_resolution
+        )
+        images = images.to(device)
         image_size = np.array(images.shape[-2:])
         scale = img_load_resolution / vggt_fixed_resolution
         shared_camera = args.shared_camera
 
-        with torch.cuda.amp.autocast(dtype=dtype):
+        with torch.autocast(device_type=device, dtype=dtype, enabled=device == "cuda"):
             # Predicting Tracks
             # Using VGGSfM tracker instead of VGGT tracker for efficiency
             # VGGT tracker requires multiple backbone runs to query different frames (this is a problem caused by the training process)
@@ -306,14 +710,7 @@ def demo_fn(args):
         image_size = np.array([vggt_fixed_resolution, vggt_fixed_resolution])
         num_frames, height, width, _ = points_3d.shape
 
-        points_rgb = F.interpolate(
-            images,
-            size=(vggt_fixed_resolution, vggt_fixed_resolution),
-            mode="bilinear",
-            align_corners=False,
-        )
-        points_rgb = (points_rgb.cpu().numpy() * 255).astype(np.uint8)
-        points_rgb = points_rgb.transpose(0, 2, 3, 1)
+        points_rgb = predictions["points_rgb"]
 
         # (S, H, W, 3), with x, y coordinates and frame indices
         points_xyf = create_pixel_coordinate_grid(num_frames, height, width)
@@ -343,7 +740,7 @@ def demo_fn(args):
     reconstruction = rename_colmap_recons_and_rescale_camera(
         reconstruction,
         base_image_path_list,
-        original_coords.cpu().numpy(),
+        original_coords,
         img_size=reconstruction_resolution,
         shift_point2d_to_original_res=True,
         shared_camera=shared_camera,
@@ -364,6 +761,9 @@ def demo_fn(args):
         os.path.join(sparse_reconstruction_dir, "points.ply")
     )
 
+    report["points"] = len(points_3d)
+    write_report(args, report)
+
     return True
 
 
@@ -413,10 +813,143 @@ def rename_colmap_recons_and_rescale_camera(
     return reconstruction
 
 
+def warm_up(model, device, dtype, resolution=518, num_images=2):
+    # Dummy forward pass, so that the first job does not pay for CUDA's & cuDNN's setup
+    images = torch.rand(num_images, 3, resolution, resolution, device=device)
+    run_VGGT(model, images, dtype, resolution=resolution)
+    if device == "cuda":
+        torch.cuda.synchronize()
+
+
+class VGGTServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Keeps VGGT loaded & runs the jobs sent over a Unix socket, one at a time.
+    Each request & response is a line of JSON:
+        {"op": "health"}  -> the server's status
+        {"op": "warmup"}  -> runs a dummy forward pass
+        {"op": "run", "argv": [...], "log": "path"}  -> runs `demo_fn()` with the CLI args,
+            appending its output to `log`. Model & server args in `argv` are ignored.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, args):
+        self.args = args
+        self.device, self.dtype = get_device_and_dtype()
+        self.model = load_model(args, self.device)
+        self.lock = threading.Lock()  # One job at a time
+        self.started_at = time.time()
+        self.waiting = 0
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.warm = False
+        print(f"Model loaded on {self.device} ({self.dtype})", flush=True)
+        if args.warmup:
+            self.warm_up()
+
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)  # Stale socket
+        super().__init__(args.socket, VGGTRequestHandler)
+        print(f"Listening on {args.socket}", flush=True)
+
+    def warm_up(self):
+        with self.lock, torch.no_grad():
+            start = time.perf_counter()
+            warm_up(self.model, self.device, self.dtype)
+            self.warm = True
+        print(f"Warmed up in {time.perf_counter() - start:.1f}s", flush=True)
+
+    def status(self):
+        return {
+            "device": self.device,
+            "dtype": str(self.dtype),
+            "weights": "stub" if self.args.stub_model else self.args.weights,
+            "offline": self.args.offline,
+            "warm": self.warm,
+            "busy": self.lock.locked(),
+            "waiting": self.waiting,
+            "jobs_done": self.jobs_done,
+            "jobs_failed": self.jobs_failed,
+            "uptime_s": round(time.time() - self.started_at, 1),
+        }
+
+    def run_job(self, argv, log=None):
+        job_args = parse_args(argv)
+        self.waiting += 1
+        with self.lock:
+            self.waiting -= 1
+            print(f"Running job: {job_args.scene_dir}", flush=True)
+            wall, cpu = time.perf_counter(), time.process_time()
+            log_file = open(log, "a") if log else open(os.devnull, "w")
+            try:
+                with log_file, contextlib.redirect_stdout(log_file), torch.no_grad():
+                    try:
+                        result = demo_fn(job_args, model=self.model)
+                    except Exception:
+                        traceback.print_exc(file=log_file)
+                        raise
+                self.warm = True
+                self.jobs_done += 1
+            except Exception:
+                self.jobs_failed += 1
+                raise
+            finally:
+                if self.device == "cuda":
+                    torch.cuda.empty_cache()
+            profile = {
+                "wall_s": round(time.perf_counter() - wall, 3),
+                "cpu_s": round(time.process_time() - cpu, 3),
+                "peak_rss_mb": round(
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+                ),
+            }
+            print(f"Finished job in {profile['wall_s']:.1f}s", flush=True)
+        return {"result": result, "profile": profile}
+
+    def dispatch(self, request):
+        op = request.get("op")
+        if op == "health":
+            return {"ok": True, "status": self.status()}
+        if op == "warmup":
+            self.warm_up()
+            return {"ok": True, "status": self.status()}
+        if op == "run":
+            return {"ok": True, **self.run_job(request["argv"], request.get("log"))}
+        raise ValueError(f"Unknown op: {op}")
+
+
+class VGGTRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.dispatch(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write((json.dumps(response) + "\n").encode())
+            self.wfile.flush()
+
+
+def serve(args):
+    if args.offline:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+    with VGGTServer(args) as server:
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(args.socket)
+
+
 if __name__ == "__main__":
     args = parse_args()
-    with torch.no_grad():
-        demo_fn(args)
+    if args.serve:
+        serve(args)
+    else:
+        if args.offline:
+            os.environ["HF_HUB_OFFLINE"] = "1"
+        with torch.no_grad():
+            demo_fn(args)
 
 
 # Work in Progress (WIP)
@@ -347,6 +347,22 @@ def post_del_image(sender, instance, **kwargs):
     Contribution.objects.filter(images__isnull=True).delete()
 
 
+def move_image(instance: Image, label: str) -> None:
+    """
+    Moves an image to the folder for `label` - nsfw, good, bad, and updates its path.
+    NOTE: Does not save the instance; `ImageOps` bulk-updates the images after moving them.
+
+    """
+    image_root = f"models/{instance.contribution.mesh.ID}/images/"
+    src = MEDIA / instance.image.name
+    fname = instance.image.name.split("/")[-1]
+    name = f"{image_root}{label}/{fname}" if label else f"{image_root}{fname}"
+    dest = MEDIA / name
+    if src != dest:
+        shutil.move(src, dest)  # Move image
+        instance.image.name = name  # Update path in DB
+
+
 @receiver(pre_save, sender=Image)
 def pre_save_image(sender, instance, **kwargs):
     """
@@ -357,18 +373,7 @@ def pre_save_image(sender, instance, **kwargs):
         old_instance = Image.objects.get(pk=instance.pk)
 
         if instance.label != old_instance.label:
-            image_root = f"models/{instance.contribution.mesh.ID}/images/"
-            src = MEDIA / instance.image.name
-            fname = instance.image.name.split("/")[-1]
-            if not instance.label:
-                dest = MEDIA / image_root / f"{fname}"
-            else:
-                dest = MEDIA / image_root / f"{instance.label}/{fname}"
-            if src != dest:
-                shutil.move(src, dest)  # Move image
-                instance.image.name = (
-                    f"{image_root}{instance.label}/{fname}"  # Update path in DB
-                )
+            move_image(instance, instance.label)
 
 
 @receiver(post_save, sender=Run)
@@ -410,22 +415,36 @@ def post_del_run(sender, instance, **kwargs):
 
         # 1. Deletes the published files for a run
         kind = instance.kind.lower()
-        suffix = (
-            "glb" if kind == "av" else "splat"
+        suffixes = (
+            ["glb"] if kind == "av" else ["splat", "csplat"]
         )  # TODOLATER: Update when PointMaps are added
-        pub_fpath = Path(
-            f"{STATIC}/models/{meshID}/published/{meshID}_{runID}.{suffix}"
-        )
+        for suffix in suffixes:
+            pub_fpath = Path(
+                f"{STATIC}/models/{meshID}/published/{meshID}_{runID}.{suffix}"
+            )
 
-        if pub_fpath.exists():
+            if pub_fpath.exists():
+                try:
+                    pub_fpath.unlink()
+                    print(
+                        f"post_del_run | Run ID: {runID} | Deleted published file {pub_fpath}"
+                    )
+                except Exception as e:
+                    print(
+                        f"post_del_run | Run ID: {runID} | Error deleting published file {pub_fpath}: {e}"
+                    )
+
+        # Progressive LOD package, if any
+        pub_lod_dir = pub_fpath.with_name(f"{pub_fpath.stem}_lod")
+        if pub_lod_dir.exists():
             try:
-                pub_fpath.unlink()
+                shutil.rmtree(pub_lod_dir)
                 print(
-                    f"post_del_run | Run ID: {runID} | Deleted published file {pub_fpath}"
+                    f"post_del_run | Run ID: {runID} | Deleted published LOD package {pub_lod_dir}"
                 )
             except Exception as e:
                 print(
-                    f"post_del_run | Run ID: {runID} | Error deleting published file {pub_fpath}: {e}"
+                    f"post_del_run | Run ID: {runID} | Error deleting published LOD package {pub_lod_dir}: {e}"
                 )
 
         # 2. Deletes the cached folder for a run
@@ -1,9 +1,14 @@
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+from uuid import uuid4
 
 from django.conf import settings
+from django.utils import timezone
 
 # Local imports
-from .celery import app
+from .celery import OPS_QUEUES, STEP_QUEUES, app
+from celery import Signature, chain, group
 from celery.schedules import crontab
 from celery.utils.log import get_task_logger
 from .utils import Logger
@@ -11,7 +16,19 @@ from .utils import Logger
 cel_logger = get_task_logger(__name__)
 LOG_DIR = Path(settings.LOG_DIR)
 MESHOPS_MAX_IMAGES = settings.MESHOPS_MAX_IMAGES
+ALICEVISION_ADMISSION_CONTROL = settings.ALICEVISION_ADMISSION_CONTROL
 MESHOPS_CONTRIB_DELAY = settings.MESHOPS_CONTRIB_DELAY  # hours
+RECON_OVERLAP = settings.RECON_OVERLAP
+GS_CAMERAS_FROM_AV = settings.GS_CAMERAS_FROM_AV
+RECON_STEP_TIME_LIMITS = settings.RECON_STEP_TIME_LIMITS  # seconds
+STEP_KILL_GRACE = 60  # seconds, between a step's soft & hard time limits
+RECON_PRIORITIES = settings.RECON_PRIORITIES
+RECON_COST_WEIGHTS = settings.RECON_COST_WEIGHTS
+RECON_MAX_ACTIVE = settings.RECON_MAX_ACTIVE
+RECON_FAIRNESS_WINDOW = timedelta(days=1)  # Meshes with more runs in this window wait
+RECON_START_TIMEOUT = timedelta(hours=1)  # For a dispatched job's runs to start
+RECON_DISPATCH_INTERVAL = 60  # seconds
+RECON_SWEEP_INTERVAL = 15 * 60  # seconds, also the grace for overdue reconstructions
 BACKUP_INTERVAL = crontab(minute=0, hour=0)  # Every day at 00:00
 DBCLEANUP_INTERVAL = crontab(
     minute=0, hour=0, day_of_week=0
@@ -46,20 +63,16 @@ def post_save_contrib_imageops(self, contrib_id: str, recons_type: str = "all")
 
     try:
         iops = ImageOps(contrib_id=contrib_id)
-        # FIXME: TODO: Till the VRAM + concurrency issue is fixed, skipping image checks.
         iops.check_images()
-        # cel_logger.info(
-        #     f"post_save_contrib_imageops: Finished checking images for contrib_id: {contrib_id}."
-        # )
         cel_logger.info(
-            f"Skipping image checks for contrib_id: {contrib_id} due to VRAM + concurrency issues. FIXME:"
+            f"post_save_contrib_imageops: Finished checking images for contrib_id: {contrib_id}."
         )
     except Exception as e:
         cel_logger.error(f"ImageOps failed for contribution {contrib_id}: {e}")
 
         # Send email notification about the failure
         try:
-            from .email_utils import send_image_processing_failure_email
+            from .email_utils import queue_email
 
             # Get contribution details for the email
             try:
@@ -68,7 +81,8 @@ def post_save_contrib_imageops(self, contrib_id: str, recons_type: str = "all")
                 mesh_id = str(contribution.mesh.ID)
                 mesh_name = contribution.mesh.name
 
-                send_image_processing_failure_email(
+                queue_email(
+                    "send_image_processing_failure_email",
                     contribution_id=contrib_id,
                     mesh_id=mesh_id,
                     mesh_name=mesh_name,
@@ -92,25 +106,286 @@ def post_save_contrib_imageops(self, contrib_id: str, recons_type: str = "all")
         # Re-raise the original exception
         raise e
 
-    # FIXME: TODO: MESHOPS_CONTRIB_DELAY = 0.1 (6 minutes), till the image checks are fixed.
-    # Create mesh after MESHOPS_CONTRIB_DELAY hours
-
+    # Create mesh after MESHOPS_CONTRIB_DELAY hours, with any other contributions till then
     cel_logger.info(
         f"post_save_contrib_imageops (task_id={self.request.id}): Will trigger reconstruction pipelines for {contrib_id} after {MESHOPS_CONTRIB_DELAY} hours..."
     )
-    recon_runner_task.apply_async(
-        args=(
-            contrib_id,
-            recons_type,
-        ),
-        countdown=MESHOPS_CONTRIB_DELAY * 60 * 60,
+    schedule_recon(contrib_id, recons_type)
+
+
+def schedule_recon(contrib_id: str, recons_type: str = "all") -> None:
+    """
+    Coalesces a contribution into its mesh's pending reconstruction (`Mesh.pending_recon`)
+    & restarts the quiet period of `MESHOPS_CONTRIB_DELAY` hours. Each call supersedes the
+    previous one's `recon_coalesce_task`, so a burst of contributions gets a single run.
+
+    Parameters
+    ----------
+    contrib_id : str
+        The `Contribution` instance's UUID.
+    recons_type : str, optional
+        The reconstruction type, by default "all" ["GS", "aV"].
+        If the pending contributions differ in type, "all" runs.
+
+    """
+    from django.db import transaction
+    from .models import Contribution, Mesh
+
+    mesh_id = Contribution.objects.values_list("mesh", flat=True).get(ID=contrib_id)
+    token = uuid4().hex
+    due_at = timezone.now() + timedelta(hours=MESHOPS_CONTRIB_DELAY)
+    with transaction.atomic():
+        pending = Mesh.objects.select_for_update().get(ID=mesh_id).pending_recon
+        if pending and pending["recons_type"] != recons_type:
+            recons_type = "all"
+        # NOTE: `update()`, since `Mesh.save()` also re-compresses the thumbnail
+        Mesh.objects.filter(ID=mesh_id).update(
+            pending_recon={
+                "token": token,
+                "contrib_id": contrib_id,  # The latest one, i.e., the Run's contributor
+                "contrib_ids": pending.get("contrib_ids", []) + [contrib_id],
+                "recons_type": recons_type,
+                "due_at": due_at.isoformat(),
+            }
+        )
+        transaction.on_commit(
+            lambda: recon_coalesce_task.apply_async(
+                args=(mesh_id, token), countdown=MESHOPS_CONTRIB_DELAY * 60 * 60
+            )
+        )
+    cel_logger.info(
+        f"schedule_recon: Mesh {mesh_id} - {len(pending.get('contrib_ids', [])) + 1} contribution(s) pending, due at {due_at}."
     )
 
 
 @app.task(bind=True)
-def recon_runner_task(self, contrib_id: str, recons_type: str = "all", cond_run_av: bool = True) -> None:
+def recon_coalesce_task(self, mesh_id: str, token: str) -> None:
+    """
+    Queues the pending reconstruction of a mesh, once its quiet period is over.
+    Does nothing, if a later contribution superseded `token`. A mesh has at most one queued
+    job, which waits while the mesh is processing (see `recon_dispatch_task()`), so
+    contributions made during a run get exactly one follow-up run.
+
+    Parameters
+    ----------
+    self : Task
+        Celery task instance (when bind=True)
+    mesh_id : str
+        The `Mesh` instance's ID.
+    token : str
+        The token of the `schedule_recon()` call that queued this task.
+
+    """
+    from django.db import transaction
+    from .models import Mesh
+
+    with transaction.atomic():
+        mesh = Mesh.objects.select_for_update().get(ID=mesh_id)
+        pending = mesh.pending_recon
+        if pending.get("token") != token:
+            cel_logger.info(
+                f"recon_coalesce_task (task_id={self.request.id}): Superseded for mesh {mesh_id}."
+            )
+            return
+        # Claim the pending contributions
+        Mesh.objects.filter(ID=mesh_id).update(pending_recon={})
+
+    cel_logger.info(
+        f"recon_coalesce_task (task_id={self.request.id}): Coalesced contributions {pending['contrib_ids']} for mesh {mesh_id}."
+    )
+    enqueue_recon(pending["contrib_id"], pending["recons_type"])
+
+
+@app.task(bind=True)
+def recon_sweep_task(self) -> None:
+    """
+    Queues the pending reconstructions (`Mesh.pending_recon`) that are overdue by more than
+    `RECON_SWEEP_INTERVAL`, i.e., whose `recon_coalesce_task` was lost, e.g., with its
+    countdown in a worker that was killed. Runs every `RECON_SWEEP_INTERVAL` seconds.
+
+    """
+    from .models import Mesh
+
+    cutoff = timezone.now() - timedelta(seconds=RECON_SWEEP_INTERVAL)
+    pending_recons = Mesh.objects.filter(pending_recon__has_key="due_at").values_list(
+        "ID", "pending_recon"
+    )
+    for mesh_id, pending in pending_recons:
+        if datetime.fromisoformat(pending["due_at"]) < cutoff:
+            cel_logger.warning(
+                f"recon_sweep_task (task_id={self.request.id}): Pending reconstruction of mesh {mesh_id} was due at {pending['due_at']}. Queueing it..."
+            )
+            # NOTE: Claims it like the lost task would, so a late one does nothing
+            recon_coalesce_task.delay(mesh_id, pending["token"])
+
+
+def enqueue_recon(
+    contrib_id: str, recons_type: str = "all", reason: Optional[str] = None
+) -> str:
+    """
+    Adds a reconstruction of the contribution's mesh to the queue (`ReconJob`), or merges it
+    into the mesh's queued job, if any. The job is dispatched by `recon_dispatch_task()`.
+
+    Parameters
+    ----------
+    contrib_id : str
+        The `Contribution` instance's UUID.
+    recons_type : str, optional
+        The reconstruction type, by default "all" ["GS", "aV"].
+    reason : Optional[str]
+        Key of `RECON_PRIORITIES` ["First", "Admin", "Incremental"]
+        Default: None, i.e., "First" if the mesh was never reconstructed, else "Incremental"
+
+    Returns
+    -------
+    str
+        The job's ID
+
+    """
+    from django.db import transaction
+    from .models import Contribution, Mesh, ReconJob
+
+    contrib = Contribution.objects.get(ID=contrib_id)
+    with transaction.atomic():
+        # NOTE: Locks the mesh, so that it never gets two queued jobs
+        mesh = Mesh.objects.select_for_update().get(ID=contrib.mesh_id)
+        if reason is None:
+            reason = "Incremental" if mesh.reconstructed_at else "First"
+        priority = RECON_PRIORITIES[reason]
+
+        job = ReconJob.objects.filter(mesh=mesh, status="Queued").first()
+        if job is None:
+            job = ReconJob(mesh=mesh, recons_type=recons_type, reason=reason)
+            job.priority = priority
+        else:
+            if job.recons_type != recons_type:
+                job.recons_type = "all"
+            if priority < job.priority:  # The more urgent reason wins
+                job.reason, job.priority = reason, priority
+        job.contribution = contrib
+        job.cost = _estimate_cost(mesh, job.recons_type)
+        job.save()
+        transaction.on_commit(lambda: recon_dispatch_task.delay())
+    cel_logger.info(
+        f"enqueue_recon: Job {job.ID} for mesh {mesh.ID} - {job.reason}, {job.recons_type}, priority {job.priority}, cost {job.cost}."
+    )
+
+    return job.ID
+
+
+def _estimate_cost(mesh, recons_type: str) -> float:
+    """
+    Estimated cost of a reconstruction - the mesh's good images x `RECON_COST_WEIGHTS`
+    of the kinds to run
+
+    """
+    from .models import Image
+
+    kinds = ["aV", "GS"] if recons_type == "all" else [recons_type]
+    images = Image.objects.filter(contribution__mesh=mesh, label="good").count()
+
+    return images * sum(RECON_COST_WEIGHTS.get(kind, 1.0) for kind in kinds)
+
+
+def _job_active(job, now) -> bool:
+    """
+    Whether a dispatched job is still running, i.e., its ops have not all ended - see
+    `recon_job_end_task()`, which marks it "Done". Marks it "Skipped", if none of its runs
+    started within `RECON_START_TIMEOUT`, e.g., if its messages were lost.
+
+    """
+    from .models import Run
+
+    runs = Run.objects.filter(mesh=job.mesh_id, started_at__gte=job.dispatched_at)
+    if runs.exists() or now - job.dispatched_at < RECON_START_TIMEOUT:
+        return True
+    job.status = "Skipped"
+    job.notes = f"No run started within {RECON_START_TIMEOUT} of dispatch."
+    job.save(update_fields=["status", "notes"])
+
+    return False
+
+
+@app.task(bind=True)
+def recon_dispatch_task(self) -> None:
+    """
+    Dispatches the queued `ReconJob`s to `recon_runner_task`, while fewer than
+    `RECON_MAX_ACTIVE` meshes are processing. Jobs run in order of:
+    - priority - see `RECON_PRIORITIES`; editable in the admin,
+    - fairness - meshes with fewer runs in the last `RECON_FAIRNESS_WINDOW` first,
+    - cost, aged by the hours waited - so that big jobs are not starved by small ones.
+    A mesh with a dispatched job, or locked by a run (`MeshLock`), e.g., a resumed one, is
+    skipped, i.e., it runs one job at a time.
+    Runs every `RECON_DISPATCH_INTERVAL` seconds & on `enqueue_recon()`.
+
+    """
+    from django.db import transaction
+    from django.db.models import Count
+    from .models import MeshLock, ReconJob, Run
+
+    now = timezone.now()
+    with transaction.atomic():
+        # NOTE: Locks the queue, so that concurrent dispatches do not overbook
+        jobs = list(
+            ReconJob.objects.select_for_update().filter(
+                status__in=["Queued", "Dispatched"]
+            )
+        )
+        active = [
+            job for job in jobs if job.status == "Dispatched" and _job_active(job, now)
+        ]
+        busy = {job.mesh_id for job in active} | set(
+            MeshLock.objects.filter(expires_at__gt=now).values_list("mesh", flat=True)
+        )
+        queued = [
+            job for job in jobs if job.status == "Queued" and job.mesh_id not in busy
+        ]
+        slots = RECON_MAX_ACTIVE - len(busy)
+        if not queued or slots <= 0:
+            return
+
+        served = dict(
+            Run.objects.filter(started_at__gte=now - RECON_FAIRNESS_WINDOW)
+            .values_list("mesh")
+            .annotate(count=Count("ID"))
+        )
+
+        def rank(job):
+            waited = (now - job.created_at).total_seconds() / 3600
+            return (job.priority, served.get(job.mesh_id, 0), job.cost / (1 + waited))
+
+        # NOTE: A mesh has at most one queued job - see `enqueue_recon()`
+        dispatched = sorted(queued, key=rank)[:slots]
+        for job in dispatched:
+            job.status, job.dispatched_at = "Dispatched", now
+            job.save(update_fields=["status", "dispatched_at"])
+
+        def dispatch():
+            for job in dispatched:
+                recon_runner_task.apply_async(
+                    args=(str(job.contribution_id), job.recons_type),
+                    kwargs={"job_id": job.ID},
+                )
+
+        transaction.on_commit(dispatch)
+    cel_logger.info(
+        f"recon_dispatch_task (task_id={self.request.id}): Dispatched jobs {[job.ID for job in dispatched]}."
+    )
+
+
+@app.task(bind=True)
+def recon_runner_task(
+    self,
+    contrib_id: str,
+    recons_type: str = "all",
+    cond_run_av: bool = True,
+    job_id: Optional[str] = None,
+) -> None:
     """
     Triggers `MeshOps` & `GSOps`, when a `Run` instance is created.
+    Queues each as a chain of step tasks (see `ops_workflow()`), side by side with
+    `RECON_OVERLAP`, else - or if GS trains on aV's cameras (`GS_CAMERAS_FROM_AV`) -
+    one after the other.
 
     Parameters
     ----------
@@ -123,6 +398,10 @@ def recon_runner_task(self, contrib_id: str, recons_type: str = "all", cond_run_
     cond_run_av : bool, optional
         Whether to conditionally run aV based on image count, by default True.
         Needed on low V/RAM devices to avoid OOM & malloc issues.
+        NOTE: With `ALICEVISION_ADMISSION_CONTROL`, aV still runs, but throttled to the free RAM.
+    job_id : Optional[str]
+        The `ReconJob` that dispatched this, if any - marked "Skipped", if the checks fail,
+        else "Done" once the ops end (see `_job_end()`).
 
     """
     # Determine ops based on recons_type and conditional AV checks
@@ -142,10 +421,16 @@ def recon_runner_task(self, contrib_id: str, recons_type: str = "all", cond_run_
                 mesh = contrib.mesh
                 total_images = Image.objects.filter(contribution__mesh=mesh).count()
                 if total_images > MESHOPS_MAX_IMAGES:
-                    cel_logger.warning(
-                        f"recon_runner_task (task_id={self.request.id}): Mesh {mesh.ID} has {total_images} images (> {MESHOPS_MAX_IMAGES}); skipping aV to avoid OOM. Running GS only."
-                    )
-                    ops = ["GS"]
+                    if ALICEVISION_ADMISSION_CONTROL:
+                        # NOTE: `AliceVision` throttles the memory-heavy nodes to the free RAM
+                        cel_logger.warning(
+                            f"recon_runner_task (task_id={self.request.id}): Mesh {mesh.ID} has {total_images} images (> {MESHOPS_MAX_IMAGES}); running aV with memory admission control."
+                        )
+                    else:
+                        cel_logger.warning(
+                            f"recon_runner_task (task_id={self.request.id}): Mesh {mesh.ID} has {total_images} images (> {MESHOPS_MAX_IMAGES}); skipping aV to avoid OOM. Running GS only."
+                        )
+                        ops = ["GS"]
             except Exception as e:
                 cel_logger.error(
                     f"recon_runner_task (task_id={self.request.id}): Failed to check image count for contrib {contrib_id}: {e}. Proceeding with ops={ops}."
@@ -153,7 +438,7 @@ def recon_runner_task(self, contrib_id: str, recons_type: str = "all", cond_run_
     else:
         ops = [recons_type,]
 
-    from .workers import prerun_check, ops_runner
+    from .workers import prerun_check
 
     cel_logger.info(
         f"recon_runner_task (task_id={self.request.id}): Running prerun checks for contrib_id: {contrib_id}..."
@@ -162,26 +447,286 @@ def recon_runner_task(self, contrib_id: str, recons_type: str = "all", cond_run_
     cel_logger.info(
         f"recon_runner_task (task_id={self.request.id}): {contrib_id} - {msg}"
     )
+    if not chk and job_id:
+        from .models import ReconJob
+
+        ReconJob.objects.filter(ID=job_id).update(status="Skipped", notes=msg)
     if chk:
-        for op in ops:
-            cel_logger.info(
-                f"recon_runner_task (task_id={self.request.id}): Triggering {op}Ops for contrib_id: {contrib_id}."
-            )
-            cel_logger.info(
-                f"recon_runner_task (task_id={self.request.id}): Running {op}Ops for {contrib_id}..."
+        # NOTE: With RECON_OVERLAP, e.g., GS's COLMAP runs alongside aV's dense stages, while
+        # the GPU-heavy steps take turns (`GPU_CONCURRENCY`). Else, each op waits for the previous one,
+        # and is skipped if it fails.
+        workflows = [ops_workflow(op, contrib_id=contrib_id) for op in ops]
+        if job_id:
+            from .models import ReconJob
+
+            ReconJob.objects.filter(ID=job_id).update(ops=ops)
+        # NOTE: With GS_CAMERAS_FROM_AV, GS waits for aV, since it trains on aV's SfM
+        if RECON_OVERLAP and not (GS_CAMERAS_FROM_AV and "aV" in ops):
+            workflow = group(
+                _job_end(workflow, job_id, [op]) for workflow, op in zip(workflows, ops)
             )
-            try:
-                ops_runner(contrib_id=contrib_id, kind=op)
-                cel_logger.info(
-                    f"recon_runner_task (task_id={self.request.id}): Finished running {op}Ops for {contrib_id}."
-                )
-            except Exception as e:
-                cel_logger.error(
-                    f"recon_runner_task (task_id={self.request.id}): {op}Ops failed for {contrib_id}: {e}"
-                )
-                # Note: ops_runner already sends its own notification, so we don't need to send another here
-                # Re-raise to maintain the error propagation
-                raise e
+        else:
+            workflow = _job_end(chain(*workflows), job_id, ops)
+        workflow.apply_async()
+        cel_logger.info(
+            f"recon_runner_task (task_id={self.request.id}): Queued {ops} for {contrib_id}."
+        )
+
+
+def _job_end(workflow: Signature, job_id: Optional[str], ops: list) -> Signature:
+    """
+    Ends `ops` of a `ReconJob` after a workflow: `recon_job_end_task` is its last link &
+    its errback, so the job ends whether the runs finish, fail or are cancelled.
+
+    Parameters
+    ----------
+    workflow : Signature
+        Chain of the ops' tasks - see `ops_workflow()`
+    job_id : Optional[str]
+        The `ReconJob`'s ID
+        Default: None, i.e., no job - the workflow is returned as is
+    ops : list
+        The ops the workflow runs ["aV", "GS"]
+
+    Returns
+    -------
+    Signature
+        The chain
+
+    """
+    if not job_id:
+        return workflow
+
+    workflow = chain(workflow, recon_job_end_task.si(job_id, ops))
+    workflow.link_error(recon_job_end_task.si(job_id, ops, failed=True))
+
+    return workflow
+
+
+@app.task(bind=True)
+def recon_job_end_task(self, job_id: str, ops: list, failed: bool = False) -> None:
+    """
+    Ends `ops` of a dispatched `ReconJob` - the last link of their workflow, or its errback
+    (see `_job_end()`). The job is "Done" once all its ops have ended, & the next job is
+    dispatched.
+
+    """
+    from django.db import transaction
+    from .models import ReconJob
+
+    with transaction.atomic():
+        job = ReconJob.objects.select_for_update().get(ID=job_id)
+        ended = [op for op in job.ops if op in ops]
+        if not ended:  # NOTE: E.g., the errback of a failed end link
+            return
+        job.ops = [op for op in job.ops if op not in ops]
+        if failed:
+            job.notes = f"{job.notes}\n{', '.join(ended)} failed.".strip()
+        if not job.ops:
+            job.status = "Done"
+            transaction.on_commit(lambda: recon_dispatch_task.delay())
+        job.save(update_fields=["ops", "status", "notes"])
+    cel_logger.info(
+        f"recon_job_end_task (task_id={self.request.id}): Job {job_id} - {ended} ended{' with errors' if failed else ''}; {job.status}."
+    )
+
+
+def _step_signature(step: str, runID: Optional[str] = None) -> Signature:
+    """
+    Signature of `ops_step_task` for `step`, on its queue & with its time limits
+
+    Parameters
+    ----------
+    step : str
+        Step of the op's `_run_order`
+    runID : Optional[str]
+        Run ID, for the first step of a chain
+        Default: None, i.e., the previous task's result
+
+    """
+    options = {"queue": STEP_QUEUES[step]}
+    if limit := RECON_STEP_TIME_LIMITS.get(step):
+        # NOTE: The soft limit stops the step's commands (see `utils.run_profiled()`)
+        options.update(soft_time_limit=limit, time_limit=limit + STEP_KILL_GRACE)
+    signature = ops_step_task.si(runID, step) if runID else ops_step_task.s(step)
+
+    return signature.set(**options)
+
+
+def ops_workflow(
+    kind: str, contrib_id: Optional[str] = None, runID: Optional[str] = None
+) -> Signature:
+    """
+    Chain of tasks for an op: `ops_start_task`, which creates the Run, then `ops_step_task`
+    for each step of its `_run_order`. Each step checkpoints the Run, so a failed run
+    can be picked up at the failed step (see `resume_run()`).
+
+    Parameters
+    ----------
+    kind : str
+        The op to run ["aV", "GS"].
+    contrib_id : Optional[str]
+        The `Contribution` instance's UUID, for a new Run
+    runID : Optional[str]
+        Run to pick up, instead of a new one - only its steps not done are queued
+
+    Returns
+    -------
+    Signature
+        The chain
+
+    """
+    from .models import Run
+    from .workers import OPS_MAP
+
+    steps = OPS_MAP[kind]._run_order
+    if runID is None:
+        start = ops_start_task.si(contrib_id, kind).set(queue=OPS_QUEUES[kind])
+        return chain(start, *[_step_signature(step) for step in steps])
+
+    done = Run.objects.get(ID=runID).state.get("done", [])
+    steps = [step for step in steps if step not in done]
+    if not steps:
+        raise ValueError(f"All steps of Run {runID} are done.")
+    return chain(
+        _step_signature(steps[0], runID),
+        *[_step_signature(step) for step in steps[1:]],
+    )
+
+
+def resume_run(runID: str) -> list:
+    """
+    Queues the steps of an errored-out Run that are not done yet, i.e., resumes it at
+    the failed step.
+
+    Parameters
+    ----------
+    runID : str
+        Run ID
+
+    Returns
+    -------
+    list
+        The queued steps
+
+    Raises
+    ------
+    ValueError
+        If the Run did not error out, or has no checkpoint
+
+    """
+    from .models import Run
+
+    run = Run.objects.get(ID=runID)
+    if run.status != "Error":
+        raise ValueError(
+            f"Run {runID} is '{run.status}'; only errored-out runs resume."
+        )
+    if "contrib_id" not in run.state:
+        raise ValueError(f"Run {runID} has no checkpoint to resume from.")
+
+    workflow = ops_workflow(run.kind, runID=runID)
+    workflow.apply_async()
+    steps = [task.args[-1] for task in workflow.tasks]
+    cel_logger.info(f"resume_run: Queued {steps} for Run {runID}.")
+
+    return steps
+
+
+@app.task(bind=True)
+def ops_start_task(self, contrib_id: str, kind: str) -> str:
+    """
+    Creates the Run of an op, i.e., the first task of `ops_workflow()`.
+
+    Returns
+    -------
+    str
+        Run ID, for the next task
+
+    """
+    from .workers import ops_start
+
+    cel_logger.info(
+        f"ops_start_task (task_id={self.request.id}): Starting {kind}Ops for {contrib_id}..."
+    )
+    return ops_start(contrib_id, kind)
+
+
+@app.task(bind=True)
+def ops_step_task(self, runID: str, step: str) -> str:
+    """
+    Runs a step of a Run & checkpoints it. Stops the chain, if the run was cancelled.
+
+    Returns
+    -------
+    str
+        Run ID, for the next task
+
+    """
+    from .workers import ops_step
+
+    cel_logger.info(
+        f"ops_step_task (task_id={self.request.id}): Running {step} for Run {runID}..."
+    )
+    try:
+        if not ops_step(runID, step):
+            # NOTE: Skips the remaining steps, but still ends the job, if any - see `_job_end()`
+            self.request.chain = [
+                task
+                for task in self.request.chain or []
+                if task["task"] == recon_job_end_task.name
+            ] or None
+    except Exception as e:
+        cel_logger.error(
+            f"ops_step_task (task_id={self.request.id}): {step} failed for Run {runID}: {e}"
+        )
+        # Note: ops_step already sends its own notification, so we don't need to send another here
+        raise e
+    cel_logger.info(
+        f"ops_step_task (task_id={self.request.id}): Finished {step} for Run {runID}."
+    )
+
+    return runID
+
+
+@app.task(bind=True, max_retries=3, default_retry_delay=60)
+def send_email_task(self, func_name: str, kwargs: dict) -> None:
+    """
+    Sends an email with `email_utils.<func_name>(**kwargs)`, on the `email` queue.
+    Retries, if sending fails.
+
+    """
+    from . import email_utils
+
+    if not getattr(email_utils, func_name)(**kwargs):
+        cel_logger.warning(
+            f"send_email_task (task_id={self.request.id}): {func_name} failed; retrying..."
+        )
+        raise self.retry()
+
+
+@app.task(bind=True, max_retries=3, default_retry_delay=600)
+def archive_run_task(self, runID: str) -> None:
+    """
+    Moves a Run's directory to `ARCHIVE_ROOT` across devices (see `workers.archive_run()`),
+    on the `maintenance` queue. Retries, if the move fails - the source is kept till then.
+
+    """
+    from .workers import archive_run
+
+    cel_logger.info(
+        f"archive_run_task (task_id={self.request.id}): Archiving Run {runID}..."
+    )
+    try:
+        archive_run(runID)
+    except Exception as e:
+        cel_logger.error(
+            f"archive_run_task (task_id={self.request.id}): Archiving Run {runID} failed: {e}; retrying..."
+        )
+        raise self.retry(exc=e)
+    cel_logger.info(
+        f"archive_run_task (task_id={self.request.id}): Archived Run {runID}."
+    )
 
 
 @app.task
@@ -225,3 +770,13 @@ def setup_periodic_tasks(sender, **kwargs):
     sender.add_periodic_task(
         DBCLEANUP_INTERVAL, db_cleanup_task.s(), name="db_cleanup_task"
     )
+
+    # Calls recon_sweep_task() every RECON_SWEEP_INTERVAL.
+    sender.add_periodic_task(
+        RECON_SWEEP_INTERVAL, recon_sweep_task.s(), name="recon_sweep_task"
+    )
+
+    # Calls recon_dispatch_task() every RECON_DISPATCH_INTERVAL, e.g., for jobs whose runs never started.
+    sender.add_periodic_task(
+        RECON_DISPATCH_INTERVAL, recon_dispatch_task.s(), name="recon_dispatch_task"
+    )
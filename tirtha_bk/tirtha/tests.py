@@ -1,3 +1,372 @@
-# LATE_EXP: TODO:
+"""
+Tests for `tirtha`. None of them touch the DB, so they are `SimpleTestCase`s.
 
-# Create your tests here.
+Usage: `python manage.py test tirtha`
+
+"""
+
+import json
+import os
+import subprocess as sp
+import tempfile
+import time
+from pathlib import Path
+from unittest import SkipTest
+
+import numpy as np
+from django.conf import settings
+from django.test import SimpleTestCase
+from PIL import Image as PILImage
+from plyfile import PlyData, PlyElement
+
+# Local imports
+from tirtha.management.commands.benchmark_postprocess import (
+    legacy_convert,
+    legacy_density_filter,
+    legacy_remove_floaters,
+    make_synthetic_cloud,
+    same_columns,
+)
+from tirtha.postprocess import (
+    CSPLAT_CHUNK_DTYPE,
+    CSPLAT_HEADER_DTYPE,
+    LOD_MANIFEST,
+    SPLAT_DTYPE,
+    PostProcess,
+    csplat_dtype,
+    decode_compressed_splat,
+    encode_compressed_splat,
+)
+from tirtha.utilsvggt import vggt_health, vggt_request, vggt_run
+
+# Slack for the float32 rounding of the decoded `.csplat` values & the chunk bounds
+EPS = 1e-5
+
+
+def make_records(num_points: int, seed: int = 0) -> np.ndarray:
+    """
+    Random `.splat` records, with some underflowed scales.
+
+    """
+    rng = np.random.default_rng(seed)
+    records = np.empty(num_points, dtype=SPLAT_DTYPE)
+    records["position"] = rng.normal(scale=5.0, size=(num_points, 3))
+    records["scale"] = np.exp(rng.normal(loc=-4.0, scale=2.0, size=(num_points, 3)))
+    records["scale"][: num_points // 100] = 0.0  # Underflowed `exp()`
+    records["color"] = rng.integers(0, 256, size=(num_points, 4))
+    records["rot"] = rng.integers(0, 256, size=(num_points, 4))
+
+    return records
+
+
+COLMAP_FILES = ("cameras.bin", "images.bin", "points3D.bin")
+SERVER_START_TIMEOUT = 120  # seconds
+VGGT_PYTHON = Path(settings.VGGT_ENV_PATH) / "bin/python"
+
+
+def make_scene(scene_dir: Path, num_images: int, seed: int = 0) -> None:
+    """
+    Random textured images, of different sizes, in `scene_dir/images`.
+
+    """
+    rng = np.random.default_rng(seed)
+    (scene_dir / "images").mkdir(parents=True)
+    for i in range(num_images):
+        size = (64 + 8 * i, 48)
+        pixels = rng.integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8)
+        PILImage.fromarray(pixels).save(scene_dir / "images" / f"{i:03d}.jpg")
+
+
+def runner_cmd(*args: str) -> list:
+    # The VGGT runner with the stub model, in the VGGT env
+    return [str(VGGT_PYTHON), settings.VGGT_SCRIPT_PATH, "--stub_model", *args]
+
+
+class PostProcessTests(SimpleTestCase):
+    """
+    Checks `PostProcess` against its previous, loop-based implementation (see the
+    `benchmark_postprocess` command, which times both).
+
+    """
+
+    NUM_POINTS = 20_000
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.cloud = make_synthetic_cloud(self.NUM_POINTS)
+        self.input_path = self.tmp / "splat.ply"
+        PlyData([PlyElement.describe(self.cloud, "vertex")]).write(self.input_path)
+        self.postproc = PostProcess(
+            input_path=self.input_path,
+            output_path=self.tmp / "postprocessed.splat",
+            runDir=self.tmp,
+            log_path=self.tmp / "logs",
+        )
+        self.voxel_size, self.thresh_percen = map(float, self.postproc.dens_filt_args)
+
+    def density_filter(self):
+        self.postproc.apply_density_filter(
+            voxel_size=self.voxel_size, thresh_percen=self.thresh_percen
+        )
+        return legacy_density_filter(self.cloud, self.voxel_size, self.thresh_percen)
+
+    def test_density_filter(self):
+        ref = self.density_filter()
+        self.assertTrue(0 < len(ref) < self.NUM_POINTS)
+        self.assertTrue(same_columns(ref, self.postproc.data))
+
+    def test_remove_floaters(self):
+        ref = self.density_filter()
+        num_dense = len(ref)
+        # NOTE: With a single chunk, the previous implementation is global as well.
+        # A low `threshold_factor`, so that the small cloud has floaters to remove.
+        k, threshold_factor = int(self.postproc.rem_float_args[0]), 2.0
+        ref = legacy_remove_floaters(ref, k, threshold_factor, chunk_size=num_dense)
+        self.postproc.remove_floaters(k=k, threshold_factor=threshold_factor)
+        self.assertLess(len(ref), num_dense)
+        self.assertTrue(same_columns(ref, self.postproc.data))
+
+    def test_convert(self):
+        self.density_filter()
+        ref = legacy_convert(self.postproc.data)
+        self.postproc.run_convert()
+        out = self.postproc.output_path.read_bytes()
+        self.assertEqual(len(out), len(ref))
+        self.assertTrue(out == ref, ".splat differs from the previous encoder.")
+
+        # The progressive chunks' byte ranges must cover the `.splat` file
+        manifest = json.loads(
+            (self.tmp / "postprocessed_lod" / LOD_MANIFEST).read_text()
+        )
+        chunks = b"".join(
+            out[chunk["offset"] : chunk["offset"] + chunk["length"]]
+            for chunk in manifest["chunks"]
+        )
+        self.assertTrue(chunks == out, "Progressive chunks differ from the .splat.")
+
+
+class SplatCodecTests(SimpleTestCase):
+    """
+    Round trips of the compressed `.csplat` format, against the error bounds in
+    `quantize_splat()`.
+
+    """
+
+    def setUp(self):
+        self.records = make_records(50_000)
+
+    def check_round_trip(
+        self, records: np.ndarray, chunk_size: int, scale_bits: int
+    ) -> None:
+        buffer = encode_compressed_splat(records, chunk_size, scale_bits)
+        num_chunks = -(-len(records) // chunk_size)
+        self.assertEqual(
+            len(buffer),
+            CSPLAT_HEADER_DTYPE.itemsize
+            + num_chunks * CSPLAT_CHUNK_DTYPE.itemsize
+            + len(records) * csplat_dtype(scale_bits).itemsize,
+        )
+
+        decoded = decode_compressed_splat(buffer)
+        self.assertEqual(len(decoded), len(records))
+        if len(records) == 0:
+            return
+
+        chunk_idx = np.arange(len(records)) // chunk_size
+        starts = np.arange(0, len(records), chunk_size)
+
+        # Positions - half a 16-bit step of the chunk's bounding box
+        position = records["position"].astype(np.float64)
+        extent = np.maximum.reduceat(position, starts, axis=0) - np.minimum.reduceat(
+            position, starts, axis=0
+        )
+        bound = extent[chunk_idx] / (2 * 65535) + EPS * (1 + np.abs(position))
+        pos_err = np.abs(decoded["position"] - position)
+        self.assertTrue(
+            np.all(pos_err <= bound), f"Position error {pos_err.max()} is too large."
+        )
+
+        # Log-scales - half a step of the chunk's log-scale range
+        log_scale = np.log(np.maximum(records["scale"].astype(np.float64), 1e-30))
+        log_range = np.maximum.reduceat(
+            log_scale.max(axis=1), starts
+        ) - np.minimum.reduceat(log_scale.min(axis=1), starts)
+        bound = log_range[chunk_idx, None] / (2 * (2**scale_bits - 1)) + EPS * (
+            1 + np.abs(log_scale)
+        )
+        decoded_log_scale = np.log(
+            np.maximum(decoded["scale"].astype(np.float64), 1e-30)
+        )
+        scale_err = np.abs(decoded_log_scale - log_scale)
+        # NOTE: float32 cannot hold the decoded scales below ~1e-45
+        scale_err[decoded["scale"] == 0] = 0.0
+        self.assertTrue(
+            np.all(scale_err <= bound),
+            f"Log-scale error {scale_err.max()} is too large.",
+        )
+
+        # Colours & rotations are lossless
+        np.testing.assert_array_equal(decoded["color"], records["color"])
+        np.testing.assert_array_equal(decoded["rot"], records["rot"])
+
+    def test_round_trips(self):
+        cases = {
+            "random": self.records,
+            "empty": self.records[:0],
+            "single Gaussian": self.records[:1],
+            "constant chunk": np.repeat(self.records[:1], 2048),
+        }
+        for name, records in cases.items():
+            for chunk_size in (256, 1024):
+                for scale_bits in (8, 16):
+                    with self.subTest(
+                        name, chunk_size=chunk_size, scale_bits=scale_bits
+                    ):
+                        self.check_round_trip(records, chunk_size, scale_bits)
+
+    def test_write_compressed(self):
+        # The streaming writer must match the in-memory encoder
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        splat_path = Path(tmp.name) / "postprocessed.splat"
+        self.records.tofile(splat_path)
+        for scale_bits in (8, 16):
+            with self.subTest(scale_bits=scale_bits):
+                out = PostProcess.write_compressed(
+                    splat_path, scale_bits=scale_bits, block_size=10_000
+                )
+                self.assertTrue(
+                    out.read_bytes()
+                    == encode_compressed_splat(self.records, scale_bits=scale_bits)
+                )
+
+    def test_decode_splat(self):
+        with self.assertRaises(ValueError):
+            decode_compressed_splat(self.records[:1].tobytes())
+
+
+class VGGTBackendTests(SimpleTestCase):
+    """
+    Checks the VGGT SfM backend (`tirtha/run_vggt.py`) on CPU, with its tiny stub model,
+    in the configured VGGT env: batching, the COLMAP output, the low-confidence fallback &
+    the model server.
+
+    """
+
+    NUM_IMAGES = 7
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if not VGGT_PYTHON.exists():
+            raise SkipTest(f"No VGGT env at {settings.VGGT_ENV_PATH}.")
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.scene_dir = Path(tmp.name)
+        make_scene(self.scene_dir, self.NUM_IMAGES)
+        self.env = {**os.environ, "CUDA_VISIBLE_DEVICES": ""}
+
+    def run_vggt(self, out_dir: Path, *args: str) -> dict:
+        # Runs the VGGT runner with the stub model on CPU & returns its report
+        report_file = self.scene_dir / "report.json"
+        cmd = runner_cmd(
+            "--scene_dir",
+            str(self.scene_dir),
+            "--out_dir",
+            str(out_dir),
+            "--report",
+            str(report_file),
+            *args,
+        )
+        result = sp.run(cmd, capture_output=True, text=True, env=self.env)
+        self.assertEqual(
+            result.returncode, 0, f"VGGT runner failed:\n{result.stderr[-2000:]}"
+        )
+
+        return json.loads(report_file.read_text())
+
+    def test_batched(self):
+        batch, overlap = 3, 1
+        out_dir = self.scene_dir / "sparse"
+        report = self.run_vggt(
+            out_dir,
+            "--max_batch_images",
+            str(batch),
+            "--chunk_overlap",
+            str(overlap),
+        )
+        self.assertTrue(report["ok"])
+        self.assertEqual(
+            report["batches"], -(-(self.NUM_IMAGES - overlap) // (batch - overlap))
+        )
+        for f in COLMAP_FILES:
+            self.assertTrue((out_dir / f).exists(), f"Missing {f}.")
+        # NOTE: `images.bin` starts with the number of images (uint64)
+        registered = int(np.fromfile(out_dir / "images.bin", "<u8", count=1)[0])
+        self.assertEqual(registered, self.NUM_IMAGES)
+
+    def test_low_confidence(self):
+        # No reconstruction, so that GSOps falls back to COLMAP
+        out_dir = self.scene_dir / "sparse_low"
+        report = self.run_vggt(
+            out_dir,
+            "--stub_confidence",
+            "1.0",
+            "--min_confident_fraction",
+            "0.5",
+        )
+        self.assertFalse(report["ok"])
+        self.assertFalse(out_dir.exists())
+
+    def test_server(self):
+        # Health, warm-up & a job
+        socket_path = self.scene_dir / "vggt.sock"
+        server = sp.Popen(
+            runner_cmd("--serve", "--socket", str(socket_path)),
+            stdout=sp.DEVNULL,
+            stderr=sp.PIPE,
+            text=True,
+            env=self.env,
+        )
+        try:
+            start = time.perf_counter()
+            while vggt_health(socket_path) is None:
+                self.assertIsNone(
+                    server.poll(),
+                    f"VGGT server exited:\n{server.stderr.read()[-2000:]}",
+                )
+                self.assertLess(
+                    time.perf_counter() - start,
+                    SERVER_START_TIMEOUT,
+                    "VGGT server did not start.",
+                )
+                time.sleep(1)
+            status = vggt_request(socket_path, {"op": "warmup"})["status"]
+            self.assertTrue(status["warm"])
+
+            out_dir = self.scene_dir / "sparse_server"
+            report_file = self.scene_dir / "report.json"
+            response = vggt_run(
+                socket_path,
+                [
+                    "--scene_dir",
+                    str(self.scene_dir),
+                    "--out_dir",
+                    str(out_dir),
+                    "--report",
+                    str(report_file),
+                ],
+                self.scene_dir / "server_job.log",
+            )
+            self.assertTrue(response["result"])
+            self.assertTrue(json.loads(report_file.read_text())["ok"])
+            for f in COLMAP_FILES:
+                self.assertTrue((out_dir / f).exists(), f"Missing {f}.")
+            self.assertEqual(vggt_health(socket_path)["jobs_done"], 1)
+        finally:
+            server.terminate()
+            server.wait()
@@ -3,14 +3,40 @@ Utility classes & functions
 
 """
 
+import fcntl
+import hashlib
+import json
+import os
 import psutil
+import re
+import resource
+import shlex
+import shutil
+import signal
 import subprocess as sp
+import tempfile
+import threading
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Union
+from time import perf_counter, sleep
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from logging import DEBUG, Formatter, Logger
 from logging.handlers import RotatingFileHandler
 
+PROFILE_FILE = "profile.jsonl"  # Per-command resource usage, in the run directory
+PROFILE_INTERVAL = 0.5  # seconds, between RSS samples
+STREAM_CHUNK_SIZE = 2**16  # bytes, read from a command's output at a time
+TAIL_LINES = 100  # Last lines of a command's output kept for error messages
+KILL_GRACE = 5  # seconds, between SIGTERM & SIGKILL to a process group
+PROGRESS_STEP = 10  # %, between progress logs
+GPU_LOCK_DIR = Path(tempfile.gettempdir()) / "tirtha_gpu"  # Lock files of the GPU slots
+GPU_POLL_INTERVAL = 5  # seconds, between tries to take a GPU slot
+FICLONE = 0x40049409  # `ioctl` request for a reflink, i.e., a copy-on-write clone (Btrfs, XFS)
+COPY_CHUNK_SIZE = 2**22  # bytes, copied & hashed at a time
+
 
 class Logger(Logger):
     """
@@ -74,3 +100,548 @@ def _sysinfo() -> dict:
     }
 
     return res
+
+
+class ProgressParser:
+    """
+    Parses the progress of a command from its output
+
+    Understands:
+    * boost's progress bar (most aliceVision nodes) - a `|----|----|...` scale
+      followed by up to 51 `*`, printed without newlines
+    * percentages in parentheses, e.g., `1000 (3.33%)` (nerfstudio)
+
+    """
+
+    BAR_SCALE = re.compile(rb"^\|(-{4}\|){10}$")
+    BAR_LENGTH = 51
+    PERCENT = re.compile(rb"\((\d+(?:\.\d+)?)%\)")
+
+    def __init__(self) -> None:
+        self.stars = None  # Stars so far, while in a progress bar
+        self.progress = None
+
+    def feed(self, line: bytes, complete: bool = True) -> Optional[float]:
+        """
+        Feeds a line (or the start of one) & returns the progress (%), if it changed
+
+        Parameters
+        ----------
+        line : bytes
+            Line of output, without the newline
+        complete : bool
+            Whether the line is complete, else only the stars in it are counted
+            Default: True
+
+        Returns
+        -------
+        Optional[float]
+            Progress in %, or None if unchanged
+
+        """
+        progress = None
+        stripped = line.strip()
+        if self.stars is not None and stripped and not stripped.strip(b"*"):
+            progress = 100 * min(len(stripped), self.BAR_LENGTH) / self.BAR_LENGTH
+            if complete:
+                self.stars = None
+        elif complete and self.BAR_SCALE.match(stripped):
+            self.stars, progress = 0, 0.0
+        elif complete and (match := self.PERCENT.search(stripped)):
+            progress = float(match.group(1))
+
+        if progress is None or progress == self.progress:
+            return None
+        self.progress = progress
+
+        return progress
+
+
+def _kill_group(process: sp.Popen) -> None:
+    """
+    Terminates a process group, started with `start_new_session=True`, & kills it after `KILL_GRACE`
+
+    """
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:  # Already gone
+            return
+        try:
+            process.wait(timeout=KILL_GRACE)
+            return
+        except sp.TimeoutExpired:
+            continue
+
+
+def _stream_output(
+    stream,
+    log_file: Optional[Path],
+    tail: deque,
+    on_progress: Optional[Callable[[float], None]],
+) -> None:
+    """
+    Streams a command's output to its log file in chunks, keeping the last lines in `tail`
+    NOTE: Runs in a thread, so that a full pipe does not block the child
+
+    """
+    log = open(log_file, "ab") if log_file else None
+    parser = ProgressParser()
+    partial = b""
+    try:
+        while chunk := stream.read1(STREAM_CHUNK_SIZE):
+            if log:
+                log.write(chunk)
+                log.flush()
+            *lines, partial = (partial + chunk).split(b"\n")
+            if len(partial) > STREAM_CHUNK_SIZE:  # Bound the buffer
+                lines, partial = [*lines, partial], b""
+            for line in lines:
+                tail.append(line)
+                progress = parser.feed(line)
+                if on_progress and progress is not None:
+                    on_progress(progress)
+            progress = parser.feed(partial, complete=False)
+            if on_progress and progress is not None:
+                on_progress(progress)
+        if partial:
+            tail.append(partial)
+    finally:
+        if log:
+            log.close()
+
+
+def run_profiled(
+    cmd: Union[str, List[str]],
+    log_file: Optional[Union[str, Path]] = None,
+    env: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    on_progress: Optional[Callable[[float], None]] = None,
+    interval: float = PROFILE_INTERVAL,
+) -> Tuple[int, bytes, dict]:
+    """
+    Run a command, stream its output to a log file & profile it
+    The command runs in its own process group, which is killed on timeout or if the
+    caller is interrupted (e.g., a Celery time limit).
+
+    Parameters
+    ----------
+    cmd : Union[str, List[str]]
+        Command to run, as argv or a string split like a shell would (no shell features)
+    log_file : Optional[Union[str, Path]]
+        Optional, Log file to append the combined stdout & stderr to
+        Default: None, i.e., only the last `TAIL_LINES` lines are kept
+    env : Optional[dict]
+        Optional, Environment for the command
+        Default: None, i.e., inherit
+    timeout : Optional[float]
+        Optional, Timeout in seconds
+        Default: None, i.e., no timeout
+    on_progress : Optional[Callable[[float], None]]
+        Optional, Called with the progress (%) whenever it changes - see `ProgressParser`
+        Default: None
+    interval : float
+        Optional, Seconds between samples of the process tree's RSS
+        Default: `PROFILE_INTERVAL`
+
+    Returns
+    -------
+    Tuple[int, bytes, dict]
+        Exit status, last `TAIL_LINES` lines of output, and the profile:
+        start time, wall & CPU time (s), peak RSS of the process tree (MB), exit status & whether it timed out
+
+    """
+    argv = shlex.split(cmd) if isinstance(cmd, str) else [str(arg) for arg in cmd]
+    tail = deque(maxlen=TAIL_LINES)
+
+    # NOTE: CPU time is that of all descendants reaped meanwhile, i.e., the whole process tree
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    started_at = datetime.now().isoformat(timespec="seconds")
+    start = perf_counter()
+    try:
+        process = sp.Popen(
+            argv, stdout=sp.PIPE, stderr=sp.STDOUT, env=env, start_new_session=True
+        )
+    except OSError as error:  # E.g., missing executable - fail like a shell would
+        output = f"{argv[0]}: {error}".encode()
+        if log_file:
+            with open(log_file, "ab") as log:
+                log.write(output + b"\n")
+        profile = {
+            "started_at": started_at,
+            "wall_s": 0.0,
+            "cpu_s": 0.0,
+            "peak_rss_mb": 0.0,
+            "exit_status": 127,
+            "timed_out": False,
+        }
+        return 127, output, profile
+
+    reader = threading.Thread(
+        target=_stream_output, args=(process.stdout, log_file, tail, on_progress)
+    )
+    reader.start()
+
+    peak_rss, timed_out = 0, False
+    try:
+        root = psutil.Process(process.pid)
+        while True:
+            rss = 0
+            try:
+                for proc in [root, *root.children(recursive=True)]:
+                    rss += proc.memory_info().rss
+            except psutil.Error:  # Exited in between
+                pass
+            peak_rss = max(peak_rss, rss)
+            try:
+                process.wait(timeout=interval)
+                break
+            except sp.TimeoutExpired:
+                if timeout is not None and perf_counter() - start > timeout:
+                    timed_out = True
+                    _kill_group(process)
+                    break
+    except BaseException:
+        _kill_group(process)
+        raise
+    finally:
+        reader.join()
+        process.stdout.close()
+    wall = perf_counter() - start
+    usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (usage_after.ru_utime - usage.ru_utime) + (
+        usage_after.ru_stime - usage.ru_stime
+    )
+
+    profile = {
+        "started_at": started_at,
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "peak_rss_mb": round(peak_rss / 2**20, 1),
+        "exit_status": process.returncode,
+        "timed_out": timed_out,
+    }
+
+    return process.returncode, b"\n".join(tail), profile
+
+
+def log_progress(
+    logger: Logger, name: str, step: float = PROGRESS_STEP
+) -> Callable[[float], None]:
+    """
+    Returns an `on_progress` callback for `run_profiled()` that logs every `step`%
+
+    Parameters
+    ----------
+    logger : Logger
+        Logger to log to
+    name : str
+        Name of the command in the logs
+    step : float
+        Optional, Minimum change in progress (%) between logs
+        Default: `PROGRESS_STEP`
+
+    Returns
+    -------
+    Callable[[float], None]
+        Callback
+
+    """
+    last = None
+
+    def on_progress(progress: float) -> None:
+        nonlocal last
+        # NOTE: Progress drops when a node starts its next progress bar
+        if (
+            last is None
+            or progress < last
+            or progress - last >= step
+            or (progress == 100 and last != 100)
+        ):
+            logger.info(f"{name}: {progress:.0f}% done.")
+            last = progress
+
+    return on_progress
+
+
+def write_profile(profile_file: Union[str, Path], record: dict) -> None:
+    """
+    Append a record to a run's profile (JSON Lines)
+
+    Parameters
+    ----------
+    profile_file : Union[str, Path]
+        Path to the profile file
+    record : dict
+        Record to append
+
+    """
+    # NOTE: One write per record, so that records from a pool do not interleave
+    with open(profile_file, "a") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+
+
+def summarize_profile(profile_file: Union[str, Path]) -> Dict[str, dict]:
+    """
+    Summarize a run's profile per step (e.g., `featureExtraction`, `obj2gltf`)
+
+    Parameters
+    ----------
+    profile_file : Union[str, Path]
+        Path to the profile file
+
+    Returns
+    -------
+    Dict[str, dict]
+        Calls, failures, wall & CPU time (s), and peak RSS (MB) per step, and the totals
+        NOTE: The wall time of a step run in a pool is that of the pool, not the sum over its blocks
+
+    """
+    profile_file = Path(profile_file)
+    if not profile_file.exists():
+        return {}
+
+    steps, pool_walls = {}, {}
+    with open(profile_file) as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get("kind") == "pool":
+                pool_walls[record["step"]] = (
+                    pool_walls.get(record["step"], 0) + record["wall_s"]
+                )
+                continue
+            step = steps.setdefault(
+                record["step"],
+                {
+                    "calls": 0,
+                    "failures": 0,
+                    "wall_s": 0,
+                    "cpu_s": 0,
+                    "peak_rss_mb": 0,
+                },
+            )
+            step["calls"] += 1
+            step["failures"] += record["exit_status"] != 0
+            step["wall_s"] += record["wall_s"]
+            step["cpu_s"] += record["cpu_s"]
+            step["peak_rss_mb"] = max(step["peak_rss_mb"], record["peak_rss_mb"])
+    for name, wall in pool_walls.items():
+        if name in steps:
+            steps[name]["wall_s"] = wall
+
+    total = {
+        "calls": sum(step["calls"] for step in steps.values()),
+        "failures": sum(step["failures"] for step in steps.values()),
+        "wall_s": sum(step["wall_s"] for step in steps.values()),
+        "cpu_s": sum(step["cpu_s"] for step in steps.values()),
+        "peak_rss_mb": max([step["peak_rss_mb"] for step in steps.values()] or [0]),
+    }
+    for step in [*steps.values(), total]:
+        step["wall_s"] = round(step["wall_s"], 1)
+        step["cpu_s"] = round(step["cpu_s"], 1)
+
+    return {"steps": steps, "total": total}
+
+
+class GPUSlot:
+    """
+    Holds one of `slots` GPU slots while in a `with` block
+    NOTE: Slots are lock files (`flock`), so they are shared by all threads & processes on the host
+    and freed even if the holder dies.
+
+    """
+
+    def __init__(
+        self,
+        slots: int = 1,
+        logger: Optional[Logger] = None,
+        name: str = "",
+        lock_dir: Union[str, Path] = GPU_LOCK_DIR,
+    ) -> None:
+        self.slots = slots
+        self.logger = logger
+        self.name = name
+        self.lock_dir = Path(lock_dir)
+        self._file = None
+
+    def _log(self, msg: str) -> None:
+        if self.logger:
+            self.logger.info(f"{self.name}: {msg}" if self.name else msg)
+
+    def __enter__(self) -> "GPUSlot":
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        waiting = False
+        while True:
+            for slot in range(self.slots):
+                lock_file = open(self.lock_dir / f"gpu.{slot}.lock", "w")
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:  # Taken
+                    lock_file.close()
+                    continue
+                self._file = lock_file
+                self._log(f"Took GPU slot {slot}.")
+                return self
+            if not waiting:
+                self._log(f"Waiting for one of {self.slots} GPU slot(s)...")
+                waiting = True
+            sleep(GPU_POLL_INTERVAL)
+
+    def __exit__(self, *exc) -> None:
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+        self._log("Released GPU slot.")
+
+
+def publish_file(src: Union[str, Path], dest: Union[str, Path]) -> str:
+    """
+    Publishes a file at `dest` without copying its data, where possible: as a hard link,
+    else as a reflink, else as a copy. `dest` is replaced atomically, so that readers never
+    see a partial file.
+    NOTE: A hard link shares its data with `src`, so `dest` must only ever be replaced,
+    not written to in place.
+
+    Parameters
+    ----------
+    src : Union[str, Path]
+        Path to the file
+    dest : Union[str, Path]
+        Path to publish it at
+
+    Returns
+    -------
+    str
+        How it was published, one of ["link", "reflink", "copy"]
+
+    """
+    src, dest = Path(src), Path(dest)
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+        method = "link"
+    except OSError:  # E.g., across devices
+        try:
+            with open(src, "rb") as fsrc, open(tmp, "wb") as ftmp:
+                fcntl.ioctl(ftmp.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, tmp)
+            method = "reflink"
+        except OSError:  # Not supported by the filesystem
+            shutil.copy2(src, tmp)
+            method = "copy"
+    os.replace(tmp, dest)
+
+    return method
+
+
+def publish_tree(src: Union[str, Path], dest: Union[str, Path]) -> Dict[str, int]:
+    """
+    Publishes the files of a directory tree at `dest` with `publish_file()`
+
+    Returns
+    -------
+    Dict[str, int]
+        Number of files published by each method
+
+    """
+    src, dest = Path(src), Path(dest)
+    methods = {}
+    for file in src.rglob("*"):
+        if file.is_dir():
+            continue
+        out = dest / file.relative_to(src)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        method = publish_file(file, out)
+        methods[method] = methods.get(method, 0) + 1
+
+    return methods
+
+
+def same_device(a: Union[str, Path], b: Union[str, Path]) -> bool:
+    """
+    Whether two existing paths are on the same device, i.e., a rename between them is cheap
+
+    """
+    return os.stat(a).st_dev == os.stat(b).st_dev
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _copy_verified(src: Path, dest: Path) -> int:
+    """
+    Copies a file, hashing it on the way, & checks the copy against the hash
+
+    Returns
+    -------
+    int
+        Bytes copied
+
+    Raises
+    ------
+    IOError
+        If the copy's checksum does not match
+
+    """
+    if src.is_symlink():
+        dest.unlink(missing_ok=True)
+        os.symlink(os.readlink(src), dest)
+        return 0
+
+    digest, size = hashlib.blake2b(), 0
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+        while chunk := fsrc.read(COPY_CHUNK_SIZE):
+            digest.update(chunk)
+            fdest.write(chunk)
+            size += len(chunk)
+        fdest.flush()
+        os.fsync(fdest.fileno())
+    shutil.copystat(src, dest)
+    if _file_digest(dest) != digest.hexdigest():
+        raise IOError(f"Checksum mismatch for {dest} (copied from {src}).")
+
+    return size
+
+
+def copy_tree_verified(
+    src: Union[str, Path], dest: Union[str, Path], threads: int = 4
+) -> int:
+    """
+    Copies a directory tree, e.g., to another device, in `threads` threads. Each copy is
+    checked against the checksum of its source, so that `src` can be deleted safely.
+    NOTE: Symlinks are copied as symlinks. Re-running it after a failure redoes the copy.
+
+    Parameters
+    ----------
+    src : Union[str, Path]
+        Path to the directory
+    dest : Union[str, Path]
+        Path to copy it to
+    threads : int
+        Number of files copied at a time, by default 4
+
+    Returns
+    -------
+    int
+        Bytes copied
+
+    """
+    src, dest = Path(src), Path(dest)
+    files = []
+    for root, dirs, filenames in os.walk(src):
+        rel = Path(root).relative_to(src)
+        (dest / rel).mkdir(parents=True, exist_ok=True)
+        # NOTE: `os.walk()` does not follow the symlinks to directories
+        links = [d for d in dirs if (Path(root) / d).is_symlink()]
+        files += [rel / name for name in filenames + links]
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        sizes = pool.map(lambda rel: _copy_verified(src / rel, dest / rel), files)
+        return sum(sizes)
@@ -0,0 +1,257 @@
+"""
+Exports aliceVision's SfM to nerfstudio's data format, so that GS can skip COLMAP
+
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# aliceVision camera types -> nerfstudio camera models & their distortion parameters
+CAMERA_MODELS = {
+    "pinhole": ("OPENCV", []),
+    "radial1": ("OPENCV", ["k1"]),
+    "radial3": ("OPENCV", ["k1", "k2", "k3"]),
+    "brown": ("OPENCV", ["k1", "k2", "k3", "p1", "p2"]),
+    "fisheye4": ("OPENCV_FISHEYE", ["k1", "k2", "k3", "k4"]),
+}
+# aliceVision (OpenCV: x right, y down, z forward) -> nerfstudio (OpenGL: x right, y up, z back)
+CV_TO_GL = np.diag([1.0, -1.0, -1.0, 1.0])
+PLY_FILE = "sparse_pc.ply"
+
+
+def _version(sfm: dict) -> Tuple[int, ...]:
+    """
+    Version of an aliceVision SfM file, e.g., (1, 2, 0)
+
+    """
+    return tuple(int(v) for v in sfm.get("version", ["1", "0", "0"]))
+
+
+def _intrinsics(intrinsic: dict, version: Tuple[int, ...]) -> dict:
+    """
+    Converts an aliceVision intrinsic to nerfstudio's camera parameters
+    NOTE: Follows `loadIntrinsic()` in aliceVision's `sfmDataIO_json.cpp`, whose
+    focal length & principal point conventions changed across versions.
+
+    Parameters
+    ----------
+    intrinsic : dict
+        aliceVision intrinsic
+    version : Tuple[int, ...]
+        Version of the SfM file
+
+    Returns
+    -------
+    dict
+        nerfstudio's camera parameters
+
+    Raises
+    ------
+    ValueError
+        If the camera type is not supported
+
+    """
+    w, h = int(intrinsic["width"]), int(intrinsic["height"])
+    if version < (1, 2, 0):
+        fx = fy = float(intrinsic["pxFocalLength"])
+    elif version < (1, 2, 2):
+        fx, fy = (float(f) for f in intrinsic["pxFocalLength"])
+    else:  # In mm
+        fx = float(intrinsic["focalLength"]) / float(intrinsic["sensorWidth"]) * w
+        fy = fx / float(intrinsic.get("pixelRatio", 1.0))
+    cx, cy = (float(c) for c in intrinsic["principalPoint"])
+    if version >= (1, 2, 5):  # Offset from the image centre
+        cx, cy = cx + w / 2, cy + h / 2
+
+    camera_type = intrinsic.get("type", "radial3")
+    if camera_type not in CAMERA_MODELS:
+        raise ValueError(f"Unsupported aliceVision camera type: {camera_type}.")
+    camera_model, names = CAMERA_MODELS[camera_type]
+    params = [float(d) for d in intrinsic.get("distortionParams", [])]
+
+    return {
+        "camera_model": camera_model,
+        "fl_x": fx,
+        "fl_y": fy,
+        "cx": cx,
+        "cy": cy,
+        "w": w,
+        "h": h,
+        **dict(zip(names, params)),
+    }
+
+
+def _transform_matrix(pose: dict) -> List[List[float]]:
+    """
+    Converts an aliceVision pose to nerfstudio's camera-to-world matrix
+    NOTE: aliceVision stores the world-to-camera rotation column-major, i.e., the
+    camera-to-world rotation row-major, and the camera centre.
+
+    """
+    transform = pose["pose"]["transform"]
+    c2w = np.eye(4)
+    c2w[:3, :3] = np.array(transform["rotation"], dtype=float).reshape(3, 3)
+    c2w[:3, 3] = np.array(transform["center"], dtype=float)
+
+    return (c2w @ CV_TO_GL).tolist()
+
+
+def _write_ply(path: Path, points: np.ndarray, colors: np.ndarray) -> None:
+    """
+    Writes a coloured point cloud as a binary PLY
+
+    """
+    vertices = np.empty(
+        len(points),
+        dtype=[
+            ("x", "<f4"),
+            ("y", "<f4"),
+            ("z", "<f4"),
+            ("red", "u1"),
+            ("green", "u1"),
+            ("blue", "u1"),
+        ],
+    )
+    for i, axis in enumerate("xyz"):
+        vertices[axis] = points[:, i]
+    for i, channel in enumerate(("red", "green", "blue")):
+        vertices[channel] = colors[:, i]
+
+    header = (
+        "ply\nformat binary_little_endian 1.0\n"
+        + f"element vertex {len(points)}\n"
+        + "property float x\nproperty float y\nproperty float z\n"
+        + "property uchar red\nproperty uchar green\nproperty uchar blue\n"
+        + "end_header\n"
+    )
+    with open(path, "wb") as f:
+        f.write(header.encode("ascii"))
+        f.write(vertices.tobytes())
+
+
+def sfm_views(sfm_file: Union[str, Path]) -> Dict[str, bool]:
+    """
+    Image names in an aliceVision SfM file & whether they were posed
+
+    Parameters
+    ----------
+    sfm_file : Union[str, Path]
+        Path to the SfM file (JSON)
+
+    Returns
+    -------
+    Dict[str, bool]
+        Image file name -> posed
+
+    """
+    sfm = json.loads(Path(sfm_file).read_text())
+    poses = {pose["poseId"] for pose in sfm.get("poses", [])}
+
+    return {
+        Path(view["path"]).name: view.get("poseId") in poses
+        for view in sfm.get("views", [])
+    }
+
+
+def export_nerfstudio(
+    sfm_file: Union[str, Path],
+    image_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    max_points: Optional[int] = None,
+) -> int:
+    """
+    Exports an aliceVision SfM file (from `aliceVision_convertSfMFormat`) to
+    nerfstudio's data format, as `ns-process-data` would after COLMAP:
+    `transforms.json`, the sparse points in `sparse_pc.ply` & the images in `images/`.
+    NOTE: Poses & points stay in aliceVision's world frame. The splat only shares the mesh's
+    orientation, if `ns-train` keeps it, i.e., with `nerfstudio-data --orientation-method none
+    --center-method none --auto-scale-poses False` (see `GSOps.run_splatfacto()`).
+
+    Parameters
+    ----------
+    sfm_file : Union[str, Path]
+        Path to the SfM file (JSON) with views, intrinsics, poses & structure
+    image_dir : Union[str, Path]
+        Folder with the images
+    output_dir : Union[str, Path]
+        nerfstudio data folder
+    max_points : Optional[int]
+        Optional, Max. sparse points to keep, sampled uniformly
+        Default: None, i.e., all
+
+    Returns
+    -------
+    int
+        Number of posed images exported
+
+    Raises
+    ------
+    ValueError
+        If there are no posed images or an intrinsic is unsupported
+
+    """
+    sfm = json.loads(Path(sfm_file).read_text())
+    version = _version(sfm)
+    image_dir, output_dir = Path(image_dir), Path(output_dir)
+    (output_dir / "images").mkdir(parents=True, exist_ok=True)
+
+    intrinsics = {
+        intrinsic["intrinsicId"]: _intrinsics(intrinsic, version)
+        for intrinsic in sfm.get("intrinsics", [])
+    }
+    poses = {pose["poseId"]: pose for pose in sfm.get("poses", [])}
+
+    frames = []
+    for view in sfm.get("views", []):
+        pose = poses.get(view.get("poseId"))
+        if pose is None or view.get("intrinsicId") not in intrinsics:
+            continue  # Not reconstructed
+        name = Path(view["path"]).name
+        dst = output_dir / "images" / name
+        if not dst.exists():
+            try:  # Hard link, since the images do not change
+                os.link(image_dir / name, dst)
+            except OSError:
+                shutil.copy2(image_dir / name, dst)
+        frames.append(
+            {
+                "file_path": f"images/{name}",
+                "transform_matrix": _transform_matrix(pose),
+                **intrinsics[view["intrinsicId"]],
+            }
+        )
+    if not frames:
+        raise ValueError(f"No posed images in {sfm_file}.")
+    frames.sort(key=lambda frame: frame["file_path"])
+    # NOTE: nerfstudio takes a single camera model, at the top level
+    camera_models = {frame.pop("camera_model") for frame in frames}
+    if len(camera_models) > 1:
+        raise ValueError(f"Mixed camera models in {sfm_file}: {camera_models}.")
+
+    # Sparse points, to initialise the Gaussians
+    structure = sfm.get("structure", [])
+    points = np.array([landmark["X"] for landmark in structure], dtype=float)
+    colors = np.array([landmark["color"] for landmark in structure], dtype=float)
+    if max_points and len(points) > max_points:
+        keep = np.linspace(0, len(points) - 1, max_points).astype(int)
+        points, colors = points[keep], colors[keep]
+    _write_ply(
+        output_dir / PLY_FILE,
+        points.reshape(-1, 3),
+        np.clip(colors.reshape(-1, 3), 0, 255).astype(np.uint8),
+    )
+
+    transforms = {
+        "camera_model": camera_models.pop(),
+        "frames": frames,
+        "ply_file_path": PLY_FILE,
+    }
+    with open(output_dir / "transforms.json", "w") as f:
+        json.dump(transforms, f, indent=4)
+
+    return len(frames)
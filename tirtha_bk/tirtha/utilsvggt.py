@@ -0,0 +1,99 @@
+"""
+Client for the VGGT model server, i.e., `run_vggt.py --serve`, which keeps the model
+loaded across runs. See `VGGTServer` there for the protocol.
+
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+def vggt_request(
+    socket_path: Union[str, Path], request: dict, timeout: Optional[float] = None
+) -> dict:
+    """
+    Sends a request to the VGGT server & waits for its response
+
+    Parameters
+    ----------
+    socket_path : Union[str, Path]
+        Unix socket of the server
+    request : dict
+        Request, e.g., `{"op": "health"}`
+    timeout : Optional[float]
+        Optional, Timeout in seconds
+        Default: None, i.e., no timeout
+
+    Returns
+    -------
+    dict
+        Response
+
+    Raises
+    ------
+    ConnectionError
+        If the server closes the connection without responding
+    RuntimeError
+        If the request failed on the server
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError(
+            f"The VGGT server at {socket_path} closed the connection."
+        )
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise RuntimeError(f"VGGT server: {response.get('error')}")
+
+    return response
+
+
+def vggt_health(socket_path: Union[str, Path], timeout: float = 5.0) -> Optional[dict]:
+    """
+    Status of the VGGT server, e.g., its device & whether it is busy
+
+    Returns
+    -------
+    Optional[dict]
+        Status, or None if the server is unreachable
+
+    """
+    try:
+        return vggt_request(socket_path, {"op": "health"}, timeout)["status"]
+    except (OSError, ValueError, RuntimeError):
+        return None
+
+
+def vggt_run(
+    socket_path: Union[str, Path], argv: List[str], log_file: Union[str, Path]
+) -> dict:
+    """
+    Runs a reconstruction on the VGGT server, as `run_vggt.py` would with `argv`
+
+    Parameters
+    ----------
+    socket_path : Union[str, Path]
+        Unix socket of the server
+    argv : List[str]
+        `run_vggt.py`'s CLI args, e.g., `["--scene_dir", ...]`
+    log_file : Union[str, Path]
+        Log file the server appends the job's output to
+
+    Returns
+    -------
+    dict
+        Result & the job's profile (wall & CPU time (s), and the server's peak RSS (MB))
+
+    """
+    return vggt_request(
+        socket_path,
+        {"op": "run", "argv": argv, "log": str(Path(log_file).resolve())},
+    )
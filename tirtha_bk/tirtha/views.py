@@ -118,7 +118,7 @@ def _get_mesh_context(mesh: Mesh, run: Run = None) -> Dict:
 
     if run:
         runs_arks = list(
-            mesh.runs.filter(status__in=("Archived", "Manual"))
+            mesh.runs.filter(status__in=("Archiving", "Archived", "Manual"))
             .order_by("-ended_at")
             .values_list("ark", "ended_at")
         )
@@ -191,11 +191,11 @@ def index(request, vid: str = None, runid: str = None):
             else:
                 mesh = Mesh.objects.get(ID=settings.DEFAULT_MESH_ID)
 
-            # Try to get latest archived or manual run
+            # Try to get latest archived (or archiving) or manual run
             try:
-                run = mesh.runs.filter(status__in=("Archived", "Manual")).latest(
-                    "ended_at"
-                )
+                run = mesh.runs.filter(
+                    status__in=("Archiving", "Archived", "Manual")
+                ).latest("ended_at")
                 if run.hidden or run.mesh.hidden:
                     logging.warning(f"Attempt to access hidden Run or Mesh: {run.ID}")
                     raise Run.DoesNotExist("Run or Mesh is hidden.")
@@ -1,38 +1,76 @@
 import json
 import os
 import re
+import shlex
 import shutil
+import threading
 import pytz
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from subprocess import STDOUT, CalledProcessError, check_output
+from time import perf_counter
+from subprocess import CalledProcessError, TimeoutExpired
 from rich.console import Console
 from typing import Optional
 from django.conf import settings
-from django.db import IntegrityError
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
 # Local imports
-from tirtha.models import ARK, Contribution, Image, Mesh, Run
+from tirtha.models import ARK, Contribution, Image, Mesh, MeshLock, Run
 
-from .alicevision import AliceVision
+from .alicevision import MANIFEST_FILE, SFM_EXPORT_FILE, AliceVision
 from .postprocess import PostProcess
-from .utils import Logger
+from .utils import (
+    PROFILE_FILE,
+    GPUSlot,
+    Logger,
+    copy_tree_verified,
+    log_progress,
+    publish_file,
+    publish_tree,
+    run_profiled,
+    same_device,
+    summarize_profile,
+    write_profile,
+)
 from .utilsark import generate_noid, noid_check_digit
+from .utilssfm import export_nerfstudio, sfm_views
+from .utilsvggt import vggt_health, vggt_run
 
 
 STATIC = Path(settings.STATIC_ROOT)
 MEDIA = Path(settings.MEDIA_ROOT)
 LOG_DIR = Path(settings.LOG_DIR)
 ARCHIVE_ROOT = Path(settings.ARCHIVE_ROOT)
+ARCHIVE_THREADS = settings.ARCHIVE_THREADS
 GS_MAX_ITER = settings.GS_MAX_ITER
+GS_STREAMING_THRESHOLD_MB = settings.GS_STREAMING_THRESHOLD_MB
+GS_STREAMING_TILE_POINTS = settings.GS_STREAMING_TILE_POINTS
+GS_COMPRESS_SPLAT = settings.GS_COMPRESS_SPLAT
+GS_SPLAT_SCALE_BITS = settings.GS_SPLAT_SCALE_BITS
+GS_CAMERAS_FROM_AV = settings.GS_CAMERAS_FROM_AV
 MIN_MATCHED_IMAGES = settings.MIN_MATCHED_IMAGES
 MIN_MATCH_RATIO = settings.MIN_MATCH_RATIO
 MESHOPS_MIN_IMAGES = settings.MESHOPS_MIN_IMAGES
+MESHOPS_RESUME = settings.MESHOPS_RESUME
+MESHOPS_FEATURE_CACHE = settings.MESHOPS_FEATURE_CACHE
+MESHOPS_INCREMENTAL_MATCHING = settings.MESHOPS_INCREMENTAL_MATCHING
 ALICEVISION_DIRPATH = settings.ALICEVISION_DIRPATH
+ALICEVISION_NODE_CONCURRENCY = settings.ALICEVISION_NODE_CONCURRENCY
+ALICEVISION_NODE_TIMEOUTS = settings.ALICEVISION_NODE_TIMEOUTS
+GPU_CONCURRENCY = settings.GPU_CONCURRENCY
+ALICEVISION_ADMISSION_CONTROL = settings.ALICEVISION_ADMISSION_CONTROL
 NSFW_MODEL_DIRPATH = settings.NSFW_MODEL_DIRPATH
 VGGT_SCRIPT_PATH = settings.VGGT_SCRIPT_PATH
 VGGT_ENV_PATH = settings.VGGT_ENV_PATH
+GS_SFM_BACKEND = settings.GS_SFM_BACKEND
+VGGT_MAX_BATCH_IMAGES = settings.VGGT_MAX_BATCH_IMAGES
+VGGT_CHUNK_OVERLAP = settings.VGGT_CHUNK_OVERLAP
+VGGT_MIN_CONFIDENT_FRACTION = settings.VGGT_MIN_CONFIDENT_FRACTION
+VGGT_WEIGHTS_PATH = settings.VGGT_WEIGHTS_PATH
+VGGT_OFFLINE = settings.VGGT_OFFLINE
+VGGT_SERVER_SOCKET = settings.VGGT_SERVER_SOCKET
 MANIQA_MODEL_FILEPATH = settings.MANIQA_MODEL_FILEPATH
 OBJ2GLTF_PATH = settings.OBJ2GLTF_PATH
 GLTFPACK_PATH = settings.GLTFPACK_PATH
@@ -41,6 +79,8 @@ BASE_URL = settings.BASE_URL
 ARK_NAAN = settings.ARK_NAAN
 ARK_SHOULDER = settings.ARK_SHOULDER
 MAIL_CONTRIB_TOGGLE = settings.MAIL_CONTRIB_TOGGLE
+MESH_LOCK_TTL = settings.MESH_LOCK_TTL  # seconds
+MESH_LOCK_QUEUED_TTL = settings.MESH_LOCK_QUEUED_TTL  # seconds
 
 
 class RunCancelledError(Exception):
@@ -50,8 +90,151 @@ class RunCancelledError(Exception):
     """
 
 
+class MeshLockedError(Exception):
+    """
+    Raised when a run cannot take, or loses, the lock on its mesh (see `models.MeshLock`).
+
+    """
+
+
+def acquire_mesh_lock(meshID: str, kind: str, runID: str) -> bool:
+    """
+    Takes the lock on the runs of `kind` on a mesh for a Run for `MESH_LOCK_TTL` seconds, or
+    renews it, if the Run holds it already. A lock that expired, e.g., of a crashed run, is free.
+    NOTE: Each is a single conditional UPDATE, so no two runs get the lock.
+
+    Parameters
+    ----------
+    meshID : str
+        Mesh ID
+    kind : str
+        Kind of the run, one of ['aV', 'GS']
+    runID : str
+        Run ID
+
+    Returns
+    -------
+    bool
+        Whether the Run holds the lock
+
+    """
+    if renew_mesh_lock(meshID, kind, runID):
+        return True
+
+    now = timezone.now()
+    MeshLock.objects.get_or_create(mesh_id=meshID, kind=kind)
+    return bool(
+        MeshLock.objects.filter(mesh_id=meshID, kind=kind)
+        .filter(Q(owner="") | Q(expires_at__lt=now))
+        .update(
+            owner=runID,
+            acquired_at=now,
+            expires_at=now + timedelta(seconds=MESH_LOCK_TTL),
+        )
+    )
+
+
+def renew_mesh_lock(
+    meshID: str, kind: str, runID: str, ttl: int = MESH_LOCK_TTL
+) -> bool:
+    """
+    Extends the lock on the runs of `kind` on a mesh by `ttl` seconds, if the Run holds it.
+    NOTE: Between the steps of a Run, by `MESH_LOCK_QUEUED_TTL`, since the next step may
+    wait in the queue behind other runs' steps (see `ops_start()` & `ops_step()`).
+
+    Returns
+    -------
+    bool
+        Whether the Run holds the lock
+
+    """
+    expires_at = timezone.now() + timedelta(seconds=ttl)
+    return bool(
+        MeshLock.objects.filter(mesh_id=meshID, kind=kind, owner=runID).update(
+            expires_at=expires_at
+        )
+    )
+
+
+def release_mesh_lock(meshID: str, kind: str, runID: str) -> None:
+    """
+    Frees the lock on the runs of `kind` on a mesh, if the Run holds it
+
+    """
+    MeshLock.objects.filter(mesh_id=meshID, kind=kind, owner=runID).update(
+        owner="", expires_at=None
+    )
+
+
+def mesh_locked(meshID: str) -> bool:
+    """
+    Whether a run holds a lock on the mesh, i.e., the mesh is processing
+
+    """
+    return MeshLock.objects.filter(
+        mesh_id=meshID, expires_at__gt=timezone.now()
+    ).exists()
+
+
+class MeshLockHeartbeat:
+    """
+    Renews a Run's lock on its mesh every `MESH_LOCK_TTL / 3` seconds in a thread, while in
+    a `with` block, e.g., through the long aliceVision nodes. Sets `lost`, if the lock was
+    taken over meanwhile.
+
+    """
+
+    def __init__(
+        self, meshID: str, kind: str, runID: str, logger: Optional[Logger] = None
+    ) -> None:
+        self.meshID = meshID
+        self.kind = kind
+        self.runID = runID
+        self.logger = logger
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, daemon=True)
+
+    def _beat(self) -> None:
+        try:
+            while not self._stop.wait(MESH_LOCK_TTL / 3):
+                if not renew_mesh_lock(self.meshID, self.kind, self.runID):
+                    self.lost = True
+                    if self.logger:
+                        self.logger.error(
+                            f"Run {self.runID} lost its lock on mesh {self.meshID}."
+                        )
+                    return
+        finally:
+            connection.close()  # This thread's own DB connection
+
+    def __enter__(self) -> "MeshLockHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
 class BaseOps:
-    def __init__(self, meshID: str, kind: str = "aV", contrib_id: str = None) -> None:
+    # Steps run after the op's own steps - see `_run_order` of the subclasses
+    _run_order_suffix = [
+        "run_cleanup",
+        "run_ark",
+        "run_finalize",
+    ]
+    _run_order = []
+    # Outputs of the steps that later steps need - checkpointed on the Run by `run_step()`
+    _state_attrs = ("textured_path", "glb_path", "opt_path", "arkURL", "arkStr")
+
+    def __init__(
+        self,
+        meshID: str,
+        kind: str = "aV",
+        contrib_id: str = None,
+        runID: Optional[str] = None,
+    ) -> None:
         """
         Base class for all operations
 
@@ -63,6 +246,9 @@ class BaseOps:
             Kind of operation, one of ['aV', 'GS'], by default 'aV'
         contrib_id : str, optional
             Contribution ID that triggered this operation
+        runID : str, optional
+            Run to pick up from its checkpoint (see `run_step()`), e.g., in the task of
+            a later step or to resume a failed run, by default None, i.e., a new Run
         """
         self.meshID = meshID
         self.mesh = mesh = Mesh.objects.get(ID=meshID)
@@ -72,19 +258,32 @@ class BaseOps:
         self.cancelled = False
         self.cancel_reason = None
 
-        # Create new Run
         self.kind = kind
-        self.run = run = Run.objects.create(mesh=mesh, kind=kind)
-        run.save()  # Creates run directory
-        self.runID = runID = run.ID
-        # Ensure run.directory is relative path for new runs
-        run_dir_path = Path(run.directory)
-        if run_dir_path.is_absolute():
-            # This should not happen for new runs, but handle gracefully
-            raise ValueError(
-                f"New run directory should be relative, got absolute path: {run.directory}"
+        new_run = runID is None
+        if new_run:
+            # Create new Run, once it holds the lock on the mesh
+            self.run = run = Run(
+                mesh=mesh, kind=kind, state={"contrib_id": contrib_id, "done": []}
             )
-        self.runDir = STATIC / "models" / run_dir_path
+            if not acquire_mesh_lock(meshID, kind, run.ID):
+                raise MeshLockedError(
+                    f"Another {kind} run holds the lock on mesh {self.meshStr}."
+                )
+            run.save()  # Creates run directory
+            # Ensure run.directory is relative path for new runs
+            run_dir_path = Path(run.directory)
+            if run_dir_path.is_absolute():
+                # This should not happen for new runs, but handle gracefully
+                raise ValueError(
+                    f"New run directory should be relative, got absolute path: {run.directory}"
+                )
+        else:
+            self.run = run = Run.objects.get(ID=runID, mesh=mesh, kind=kind)
+            run_dir_path = Path(run.directory)
+        self.runID = runID = run.ID
+        # NOTE: `run_cleanup` moves the run directory to the archive
+        root = ARCHIVE_ROOT if run.status == "Archived" else STATIC / "models"
+        self.runDir = root / run_dir_path
 
         # Set up Logger
         self.log_path = LOG_DIR / f"{kind}Ops/{meshID}" / self.runDir.stem
@@ -97,6 +296,8 @@ class BaseOps:
         cls.logger.info(
             f"ID {meshID} has Verbose ID (VID) {self.meshVID}. Using VID for logging."
         )
+        # Resource usage of every command, summarized on the Run at the end
+        cls.profile_file = self.runDir / PROFILE_FILE
         # Get contribution object if contrib_id provided
         self.contribution = None
         if contrib_id:
@@ -109,14 +310,23 @@ class BaseOps:
         # Source (images) & run directories
         self.imageDir = MEDIA / f"models/{meshID}/images/good"
 
+        # Use image filenames (UUIDs in DB) to fetch images & corresponding contributors
+        self.imageFiles = sorted(self.imageDir.glob("*"))
+        self.imageUUIDs = [imageFile.stem for imageFile in self.imageFiles]
+
+        if not new_run:
+            if not acquire_mesh_lock(meshID, kind, runID):
+                raise MeshLockedError(
+                    f"Another {kind} run holds the lock on mesh {self.meshStr}."
+                )
+            self._restore_state()
+            return
+
         cls.logger.info(f"Created new {kind} Run {runID} for mesh {self.meshStr}.")
         cls.logger.info(f"{kind} Run directory: {self.runDir}")
         cls.logger.info(f"{kind} Run log file: {cls.logger._log_file}")
         self._update_mesh_status("Processing")
 
-        # Use image filenames (UUIDs in DB) to fetch images & corresponding contributors
-        self.imageFiles = sorted(self.imageDir.glob("*"))
-        self.imageUUIDs = [imageFile.stem for imageFile in self.imageFiles]
         try:
             # NOTE: This does not raise an error if the image is not found in the DB
             # CHECK: Test ain_bulk()
@@ -139,16 +349,99 @@ class BaseOps:
         except Exception as e:
             self._handle_error(excep=e, caller="Fetching images & contributors")
 
-        # Specify the run order (else alphabetical order)
-        self._run_order_suffix = [
-            "run_cleanup",
-            "run_ark",
-            "run_finalize",
-        ]
+    def _restore_state(self) -> None:
+        """
+        Picks up the Run from its checkpoint, i.e., restores the outputs of the steps done.
+        If the Run had errored out, marks it & the mesh as processing again.
+
+        """
+        run = self.run
+        for attr, value in run.state.get("outputs", {}).items():
+            setattr(self, attr, Path(value) if attr.endswith("_path") else value)
+        self.logger.info(
+            f"Picked up {self.kind} Run {self.runID} for mesh {self.meshStr} after steps {run.state.get('done', [])}."
+        )
+        if run.status == "Error":
+            self.logger.info(f"Resuming errored-out {self.kind} Run {self.runID}...")
+            run.ended_at = None
+            self._update_run_status("Processing")
+            self._update_mesh_status("Processing")
+
+    def run_step(self, step: str) -> None:
+        """
+        Runs a step of `_run_order` & checkpoints it on the Run, i.e., marks it done & saves
+        the outputs later steps need (`_state_attrs`). Skips the step, if it is done already.
+
+        Parameters
+        ----------
+        step : str
+            Name of the step, e.g., "run_aliceVision"
+
+        """
+        state = self.run.state
+        if step in state.get("done", []):
+            self.logger.info(f"{step} is done already for Run {self.runID}. Skipping.")
+            return
+
+        try:
+            with MeshLockHeartbeat(
+                self.meshID, self.kind, self.runID, self.logger
+            ) as heartbeat:
+                getattr(self, step)()
+            if heartbeat.lost:
+                raise MeshLockedError(
+                    f"Run {self.runID} lost its lock on mesh {self.meshStr} during {step}."
+                )
+        except RunCancelledError as cancel_err:
+            self.logger.info(f"Run cancelled during '{step}': {cancel_err}")
+            return
+        except Exception as e:
+            self._handle_error(excep=e, caller=step)
+
+        state.setdefault("done", []).append(step)
+        state["outputs"] = {
+            attr: str(getattr(self, attr))
+            for attr in self._state_attrs
+            if hasattr(self, attr)
+        }
+        self.run.save(update_fields=["state"])
+        self.logger.info(f"Checkpointed {step} for Run {self.runID}.")
+        if step == self._run_order[-1]:
+            self._settle_mesh_status("Live")
+            if Path(self.run.directory).is_absolute():  # See `run_cleanup()`
+                self._hand_off_archive()
+
+    def _release_lock(self) -> None:
+        release_mesh_lock(self.meshID, self.kind, self.runID)
+        self.logger.info(f"Released the lock on mesh {self.meshStr}.")
+
+    def _settle_mesh_status(self, status: str) -> None:
+        """
+        Releases the Run's lock & sets the mesh's final status, unless another run on the
+        mesh still holds a lock, e.g., the GS run alongside an aV run (`RECON_OVERLAP`).
+        That run then sets it, when it ends.
+        NOTE: The mesh row stays locked meanwhile, so of two runs that end together, the
+        last one sets it.
+
+        Parameters
+        ----------
+        status : str
+            The final status, one of ['Live', 'Error']
+
+        """
+        with transaction.atomic():
+            Mesh.objects.select_for_update().get(ID=self.meshID)
+            self._release_lock()
+            if mesh_locked(self.meshID):
+                self.logger.info(
+                    f"Another run is processing mesh {self.meshStr}. Leaving its status to that run."
+                )
+                return
+            self._update_mesh_status(status)
 
     def _run_all(self) -> None:
         """
-        Runs all the steps with default parameters.
+        Runs all the steps with default parameters, in this process.
 
         Raises
         ------
@@ -158,20 +451,12 @@ class BaseOps:
             If any exception is raised during the execution
 
         """
-        step_name = None
-        try:
-            if self._run_order:
-                for step in self._run_order:
-                    step_name = step
-                    getattr(self, step)()
-            else:
-                raise ValueError("_run_order is not defined.")
-        except RunCancelledError as cancel_err:
-            self.logger.info(
-                f"Run cancelled during '{step_name or 'unknown'}': {cancel_err}"
-            )
-        except Exception as e:
-            self._handle_error(excep=e, caller="_run_all")
+        if not self._run_order:
+            raise ValueError("_run_order is not defined.")
+        for step in self._run_order:
+            self.run_step(step)
+            if self.cancelled:
+                break
 
     def _check_output(self, out: Path, src: str) -> None:
         if not out.is_file():
@@ -202,7 +487,6 @@ class BaseOps:
         self.logger.error(f"{excep}", exc_info=True)
 
         # Update statuses to 'Error'
-        self._update_mesh_status("Error")
         self.run.ended_at = timezone.now()
         log_file_info = (
             f"Log file: {self.logger._log_file}"
@@ -210,16 +494,19 @@ class BaseOps:
             else "Log file: Not available"
         )
         self.run.notes = f"Error in {caller}:\n{str(excep)}\n\n{log_file_info}"
+        self._summarize_profile()
         self.run.save()
         self._update_run_status("Error")
+        self._settle_mesh_status("Error")
         # Send email notification to admin about the failure
         try:
-            from .email_utils import send_reconstruction_failure_email
+            from .email_utils import queue_email
 
             # Get contribution and contributor details - use exact contribution if available
             contribution_id, contributor_email = self._resolve_contribution_details()
 
-            send_reconstruction_failure_email(
+            queue_email(
+                "send_reconstruction_failure_email",
                 contribution_id=contribution_id,
                 mesh_id=str(self.mesh.ID),
                 mesh_name=self.mesh.name,
@@ -299,7 +586,6 @@ class BaseOps:
         if log_excerpt:
             self.logger.warning("COLMAP log excerpt:\n%s", log_excerpt)
 
-        self._update_mesh_status("Error")
         self.run.ended_at = timezone.now()
         log_file_info = (
             f"Log file: {log_file_path}" if log_file_path else "Log file: Not available"
@@ -308,18 +594,21 @@ class BaseOps:
         if log_excerpt:
             notes_content += f"\n\nCOLMAP log excerpt:\n{log_excerpt}"
         self.run.notes = notes_content
+        self._summarize_profile()
         self.run.save()
         self._update_run_status("Cancelled")
+        self._settle_mesh_status("Error")
 
         try:
-            from .email_utils import send_reconstruction_failure_email
+            from .email_utils import queue_email
 
             contribution_id, contributor_email = self._resolve_contribution_details()
             error_message = reason
             if log_excerpt:
                 error_message = f"{reason}\n\n{log_excerpt}"
 
-            send_reconstruction_failure_email(
+            queue_email(
+                "send_reconstruction_failure_email",
                 contribution_id=contribution_id,
                 mesh_id=str(self.mesh.ID),
                 mesh_name=self.mesh.name,
@@ -352,7 +641,9 @@ class BaseOps:
 
         """
         self.mesh.status = status
-        self.mesh.save()  # NOTE: Consider the effect on signals.py when saving Mesh or any other model
+        # NOTE: Consider the effect on signals.py when saving Mesh or any other model
+        # Only the status, since the aV & GS runs of a mesh may hold their own copies of it
+        self.mesh.save(update_fields=["status", "updated_at"])
         self.logger.info(
             f"Updated mesh.status to '{status}' for mesh {self.meshStr}..."
         )
@@ -373,10 +664,27 @@ class BaseOps:
             f"Updated {self.kind} run.status to '{status}' for run {self.runID}..."
         )
 
+    def _summarize_profile(self) -> None:
+        """
+        Summarizes the run's profile onto the Run (saved with it)
+        NOTE: Best effort, so that a broken profile does not mask the run's own errors
+
+        """
+        try:
+            self.run.profile = summarize_profile(self.profile_file)
+        except Exception as e:
+            self.logger.warning(
+                f"Could not summarize the profile at {self.profile_file}: {e}"
+            )
+            return
+        if self.run.profile:
+            self.logger.info(f"Profile summary: {self.run.profile['total']}")
+
     @classmethod  # NOTE: Won't be picklable as a regular method
-    def _serialRunner(cls, cmd: str, log_file: Path):
+    def _serialRunner(cls, cmd: str, log_file: Path, timeout: Optional[int] = None):
         """
-        Run a command serially and log the output
+        Run a command serially and stream its output to the log file
+        Logs its progress & appends its resource usage to `cls.profile_file`.
 
         Parameters
         ----------
@@ -384,6 +692,9 @@ class BaseOps:
             Command to run
         log_file : Path
             Path to the log file
+        timeout : Optional[int]
+            Optional, Timeout in seconds
+            Default: None, i.e., no timeout
 
         """
         logger = Logger(log_file.stem, log_file.parent)
@@ -391,11 +702,24 @@ class BaseOps:
         try:
             cls.logger.info(f"Starting command execution. Log file: {log_path}.")
             logger.info(f"Command:\n{cmd}")
-            output = check_output(cmd, shell=True, stderr=STDOUT)
-            logger.info(f"Output:\n{output.decode().strip()}")
+            logger.info("Output:")
+            exit_status, output, profile = run_profiled(
+                cmd,
+                log_path,
+                timeout=timeout,
+                on_progress=log_progress(cls.logger, logger.name),
+            )
+            write_profile(
+                cls.profile_file,
+                {"step": log_file.stem, "log": log_file.stem, "cmd": cmd, **profile},
+            )
+            if profile["timed_out"]:
+                raise TimeoutExpired(cmd, timeout, output)
+            if exit_status:
+                raise CalledProcessError(exit_status, cmd, output)
             cls.logger.info(f"Finished command execution. Log file: {log_path}.")
-        except CalledProcessError as error:
-            logger.error(f"\n{error.output.decode().strip()}")
+        except (CalledProcessError, TimeoutExpired) as error:
+            logger.error(f"{error}")
             cls.logger.error(
                 f"Error in command execution for {logger.name}. Check log file: {log_path}."
             )
@@ -407,14 +731,18 @@ class BaseOps:
         """
         Does the following:
         1. Cleans up older errored-out runs.
-        2. Copies current run's output to "published".
-        2. Archives current run.
+        2. Publishes current run's output to "published" - hard-linked or reflinked, where possible.
+        3. Archives current run - renamed on the same device, else handed off to `archive_run()`,
+        which moves it in the background.
         NOTE: Errored-out runs are not deleted during their run, but only during the next run.
         This is done to allow for debugging.
 
         """
         kind = self.kind
         out_map = {"aV": ".glb", "GS": ".splat", "Point": ".ply"}
+        # NOTE: GS runs publish the compressed `.csplat` when present & the `.splat` next to it
+        if kind == "GS" and (self.opt_path / "postprocessed.csplat").exists():
+            out_map["GS"] = ".csplat"
         out_type = out_map[kind]
         # out_type = ".glb" if kind == "aV" else ".splat"  # Filetype of final output
         meshStr = self.meshStr
@@ -427,9 +755,11 @@ class BaseOps:
             self.logger.info(
                 f"Looking up & deleting errored-out runs for mesh {meshStr}..."
             )
-            runs = Run.objects.filter(mesh=self.mesh, status="Error").order_by(
-                "-ended_at"
-            )
+            # NOTE: Only the runs that ended before this one started, i.e., not the other
+            # pipeline of the same contribution, when they overlap (`RECON_OVERLAP`)
+            runs = Run.objects.filter(
+                mesh=self.mesh, status="Error", ended_at__lt=self.run.started_at
+            ).order_by("-ended_at")
             if len(runs) > 0:
                 for run in runs:
                     # Handle both relative and absolute paths in run.directory
@@ -454,14 +784,14 @@ class BaseOps:
                 f"Deleted {len(runs)} errored-out runs for mesh {meshStr}."
             )
 
-            # 2. Copy current run's output to STATIC / "models" / meshID / "published" / output_name
+            # 2. Publish current run's output to STATIC / "models" / meshID / "published" / output_name
             self.logger.info(
-                f"Copying output for {kind} run {curr_runID} for mesh {meshStr}..."
+                f"Publishing output for {kind} run {curr_runID} for mesh {meshStr}..."
             )
 
             out_file_mapper = {
                 "aV": "decimatedOptGLB.glb",
-                "GS": "postprocessed.splat",
+                "GS": f"postprocessed{out_map['GS']}",
                 "Point": "Point_Voxel.ply",
             }
             out_file = out_file_mapper[kind]
@@ -470,28 +800,66 @@ class BaseOps:
                 f"models/{self.meshID}/published/{self.meshID}_{curr_runID}{out_type}"
             )
             dest = STATIC / self.arkURL
-            shutil.copy2(src, dest)
+            # NOTE: Hard links keep pointing to the data after the run directory is archived
+            method = publish_file(src, dest)
+            if out_type == ".csplat":
+                publish_file(src.with_suffix(".splat"), dest.with_suffix(".splat"))
+            # Progressive LOD package, if any - published next to the output, as `<name>_lod/`
+            lod_src = src.with_name(f"{src.stem}_lod")
+            if lod_src.is_dir():
+                publish_tree(lod_src, dest.with_name(f"{dest.stem}_lod"))
             self.logger.info(
-                f"Copied output for {kind} run {curr_runID} for mesh {meshStr}."
+                f"Published output ({method}) for {kind} run {curr_runID} for mesh {meshStr}."
             )
+            self._summarize_profile()  # Saved with the status below
             # 3. Move everything else to arcDir
-            self.logger.info(
-                f"Archiving {kind} run {curr_runID} for mesh {meshStr} to {arcDir}."
-            )
-            shutil.move(self.runDir, arcDir)  # Move run folder to archive
-            # Store relative path to avoid creating nested directory structures in STATIC
-            relative_arc_path = arcDir.relative_to(ARCHIVE_ROOT)
-            self.run.directory = str(relative_arc_path)  # Update run directory
-            self._update_run_status("Archived")  # Update run status & save
-            self.logger.info(
-                f"Archived {kind} run {curr_runID} for mesh {meshStr} to {arcDir}."
-            )
+            arcDir.parent.mkdir(parents=True, exist_ok=True)
+            if same_device(self.runDir, arcDir.parent):
+                self.logger.info(
+                    f"Archiving {kind} run {curr_runID} for mesh {meshStr} to {arcDir}."
+                )
+                os.rename(self.runDir, arcDir)  # Move run folder to archive
+                # Store relative path to avoid creating nested directory structures in STATIC
+                relative_arc_path = arcDir.relative_to(ARCHIVE_ROOT)
+                self.run.directory = str(relative_arc_path)  # Update run directory
+                self._update_run_status("Archived")  # Update run status & save
+                self.logger.info(
+                    f"Archived {kind} run {curr_runID} for mesh {meshStr} to {arcDir}."
+                )
+            else:
+                # NOTE: Absolute & "Archiving" till `archive_run()` has moved it, after the
+                # last step (see `_hand_off_archive()`), so that no run reads it meanwhile
+                self.run.directory = str(self.runDir)
+                self._update_run_status("Archiving")  # Update run status & save
+                self.logger.info(
+                    f"{self.runDir} is on another device than {ARCHIVE_ROOT}; {kind} run {curr_runID} will be archived in the background."
+                )
 
         except Exception as e:
             self.logger.error(f"Error cleaning up runs for mesh {meshStr}.")
             self._handle_error(e, "run_cleanup")
         self.logger.info(f"Finished cleaning up runs for mesh {meshStr}.")
 
+    def _hand_off_archive(self) -> None:
+        """
+        Queues the move of the run directory to `ARCHIVE_ROOT` across devices (`archive_run()`)
+        on the `maintenance` queue, once the run is done, so that no step saves the Run over it.
+        NOTE: If the broker is unreachable, the run directory stays in place & still works.
+
+        """
+        from .tasks import archive_run_task  # NOTE: Avoids a circular import
+
+        try:
+            archive_run_task.delay(self.runID)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to queue archiving of {self.kind} run {self.runID}: {e}. It stays at {self.runDir}."
+            )
+            return
+        self.logger.info(
+            f"Queued archiving of {self.kind} run {self.runID} for mesh {self.meshStr}."
+        )
+
     def run_ark(self, ark_len: int = 16) -> None:
         """
         Runs the ark generator to generate a unique ark for the run.
@@ -578,13 +946,14 @@ class BaseOps:
     def run_finalize(self) -> None:
         """
         Finalizes current run
+        NOTE: `run_step()` then sets the mesh live (see `_settle_mesh_status()`).
 
         """
         kind = self.kind
         self.logger.info(f"Finalizing {kind} run {self.runID} for mesh {self.meshStr}.")
         self.mesh.reconstructed_at = datetime.now(pytz.timezone("Asia/Kolkata"))
+        self.mesh.save(update_fields=["reconstructed_at", "updated_at"])
         self.logger.info(f"{kind} Run {self.runID} finished for mesh {self.meshStr}.")
-        self._update_mesh_status("Live")
         self.logger.info(
             f"Finished finalizing {kind} run {self.runID} for mesh {self.meshStr}."
         )
@@ -600,8 +969,27 @@ class MeshOps(BaseOps):
 
     """
 
-    def __init__(self, meshID: str, contrib_id: str) -> None:
-        super().__init__(meshID=meshID, kind="aV", contrib_id=contrib_id)
+    # Specify the run order (else alphabetical order)
+    _run_order = [
+        "run_aliceVision",
+        "run_obj2gltf",
+        "run_meshopt",
+    ] + BaseOps._run_order_suffix
+
+    def __init__(
+        self,
+        meshID: str,
+        contrib_id: str,
+        resume: bool = MESHOPS_RESUME,
+        runID: Optional[str] = None,
+    ) -> None:
+        super().__init__(meshID=meshID, kind="aV", contrib_id=contrib_id, runID=runID)
+        # Whether to reuse the up-to-date nodes of the last errored-out aV run
+        self.resume = resume
+        # Per-mesh cache of the extracted features
+        self.featureCacheDir = None
+        if MESHOPS_FEATURE_CACHE:
+            self.featureCacheDir = STATIC / "models" / meshID / "featcache"
 
         # Check if executables exist
         self.aV_exec = Path(ALICEVISION_DIRPATH)
@@ -617,13 +1005,6 @@ class MeshOps(BaseOps):
             name=f"alicevision__{self.runID}",
         )
 
-        # Specify the run order (else alphabetical order)
-        self._run_order = [
-            "run_aliceVision",
-            "run_obj2gltf",
-            "run_meshopt",
-        ] + self._run_order_suffix
-
     def _check_exec(self, exe: str = None, path: Path = None) -> None:
         """
         Checks if the executables exist and are valid
@@ -651,15 +1032,103 @@ class MeshOps(BaseOps):
                 self.logger.error(f"Executable not found: {exe}")
                 raise FileNotFoundError(f"Executable not found: {exe}")
 
+    def _restore_node_dirs(self) -> None:
+        """
+        Moves the aliceVision node folders of the last errored-out aV run
+        for the mesh into the current run directory. `AliceVision` then skips
+        the nodes whose completion manifests still match.
+
+        """
+        # NOTE: A resumed run (see `run_step()`) has its own node folders already
+        if any(d.is_dir() for d in self.runDir.glob("[0-9][0-9]_*")):
+            self.logger.info(
+                f"Run {self.runID} has aliceVision node folders already. Not restoring any."
+            )
+            return
+
+        # NOTE: Another aV run still in "Processing" was interrupted, e.g., by a worker restart,
+        # since `prerun_check()` does not start a run on a mesh that is being processed.
+        runs = (
+            Run.objects.filter(
+                mesh=self.mesh, kind="aV", status__in=["Error", "Processing"]
+            )
+            .exclude(ID=self.runID)
+            .order_by("-started_at")
+        )
+        for run in runs:
+            # Handle both relative and absolute paths in run.directory
+            run_dir_path = Path(run.directory)
+            if not run_dir_path.is_absolute():
+                run_dir_path = STATIC / "models" / run_dir_path
+
+            node_dirs = sorted(
+                d for d in run_dir_path.glob("[0-9][0-9]_*") if d.is_dir()
+            )
+            if not node_dirs:
+                continue
+
+            self.logger.info(
+                f"Restoring {len(node_dirs)} aliceVision node folders from aV Run {run.ID} for mesh {self.meshStr}..."
+            )
+            for node_dir in node_dirs:
+                # NOTE: Preserves the mtimes, which the manifests check
+                shutil.move(node_dir, self.runDir / node_dir.name)
+            return
+
+        self.logger.info(
+            f"No aliceVision node folders to restore for mesh {self.meshStr}."
+        )
+
+    def _previous_run_dir(self) -> Optional[Path]:
+        """
+        Directory of the last archived aV run for the mesh, whose matches
+        are reused to only match the new images.
+
+        Returns
+        -------
+        Optional[Path]
+            Archived run directory, or None if there is none
+
+        """
+        run = (
+            Run.objects.filter(mesh=self.mesh, kind="aV", status="Archived")
+            .exclude(ID=self.runID)
+            .order_by("-ended_at")
+            .first()
+        )
+        if run is None or not run.directory:
+            return None
+
+        # NOTE: Absolute only till `archive_run()` has moved it (see `run_cleanup()`)
+        run_dir_path = Path(run.directory)
+        if run_dir_path.is_absolute():
+            return None
+        run_dir_path = ARCHIVE_ROOT / run_dir_path
+        if not run_dir_path.exists():
+            return None
+
+        self.logger.info(
+            f"Matching the new images against aV Run {run.ID} for mesh {self.meshStr}."
+        )
+        return run_dir_path
+
     def run_aliceVision(self) -> None:
         """
         Runs the aliceVision pipeline
+        If `self.resume`, restarts from the first node that is not up to date
+        in the last errored-out aV run.
 
         """
         mesh = self.mesh
         meshStr = self.meshStr
         self.logger.info(f"Creating aliceVision worker for mesh {meshStr}...")
         try:
+            if self.resume:
+                self._restore_node_dirs()
+            previous_run = None
+            if MESHOPS_INCREMENTAL_MATCHING:
+                previous_run = self._previous_run_dir()
+
             aV = AliceVision(
                 exec_path=self.aV_exec,
                 input_dir=self.imageDir,
@@ -667,6 +1136,14 @@ class MeshOps(BaseOps):
                 # If a prior run had errored out, set the current run to produce full tracebacks
                 verboseLevel="trace" if mesh.status == "Error" else "info",
                 logger=MeshOps.av_logger,
+                resume=self.resume,
+                feature_cache=self.featureCacheDir,
+                previous_run=previous_run,
+                concurrency=ALICEVISION_NODE_CONCURRENCY,
+                timeouts=ALICEVISION_NODE_TIMEOUTS,
+                gpu_slots=GPU_CONCURRENCY,
+                export_sfm=GS_CAMERAS_FROM_AV,
+                admission_control=ALICEVISION_ADMISSION_CONTROL,
             )
         except Exception:
             self._handle_error(
@@ -688,7 +1165,7 @@ class MeshOps(BaseOps):
             if not matches:
                 center_image = None
                 mesh.center_image = ""
-                mesh.save()
+                mesh.save(update_fields=["center_image", "updated_at"])
 
             aV._run_all(
                 center_image=center_image,
@@ -805,8 +1282,16 @@ class GSOps(BaseOps):
 
     """
 
-    def __init__(self, meshID: str, contrib_id: str) -> None:
-        super().__init__(meshID=meshID, kind="GS", contrib_id=contrib_id)
+    # Specify the run order (else alphabetical order)
+    _run_order = [
+        "run_splatfacto",
+        "run_postprocess",
+    ] + BaseOps._run_order_suffix
+
+    def __init__(
+        self, meshID: str, contrib_id: str, runID: Optional[str] = None
+    ) -> None:
+        super().__init__(meshID=meshID, kind="GS", contrib_id=contrib_id, runID=runID)
 
         # Check if nerfstudio is installed
         from importlib.util import find_spec
@@ -817,11 +1302,227 @@ class GSOps(BaseOps):
             self.logger.error("nerfstudio is not installed.")
             self._handle_error(ImportError("nerfstudio is not installed."), "GSOps")
 
-        # Specify the run order (else alphabetical order)
-        self._run_order = [
-            "run_splatfacto",
-            "run_postprocess",
-        ] + self._run_order_suffix
+    def _find_av_sfm(self) -> Optional[Path]:
+        """
+        Finds the SfM exported by the latest aV run (see `AliceVision.export_sfm`), if it
+        covers exactly the current images. Does not wait for a running aV run - GS is queued
+        after aV with `GS_CAMERAS_FROM_AV` (see `tasks.recon_runner_task()`).
+
+        Returns
+        -------
+        Optional[Path]
+            Path to the SfM file, or None if there is none to use
+
+        """
+        runs = Run.objects.filter(mesh=self.mesh, kind="aV").order_by("-started_at")
+        for run in runs:
+            # NOTE: An "Archiving" run's directory is deleted, once `archive_run()` has copied it
+            if run.status == "Archiving":
+                continue
+            root = ARCHIVE_ROOT if run.status == "Archived" else STATIC / "models"
+            sfm_file = root / run.directory / "07_sfmRotate" / SFM_EXPORT_FILE
+            # NOTE: The node writes its manifest once it has finished
+            if not ((sfm_file.parent / MANIFEST_FILE).exists() and sfm_file.exists()):
+                continue
+            # NOTE: Older runs cover fewer images, so only the latest SfM can match
+            if set(sfm_views(sfm_file)) != {f.name for f in self.imageFiles}:
+                break
+            self.logger.info(f"Found the SfM of aV run {run.ID}: {sfm_file}.")
+            return sfm_file
+        self.logger.info("No usable aV SfM.")
+
+        return None
+
+    def _export_av_cameras(self, output_path: Path) -> bool:
+        """
+        Exports aV's cameras & sparse points as nerfstudio data, instead of running COLMAP
+
+        Parameters
+        ----------
+        output_path : Path
+            nerfstudio data folder
+
+        Returns
+        -------
+        bool
+            Whether the export succeeded, else COLMAP is needed
+
+        """
+        self.logger.info("Looking for aV's SfM, to skip COLMAP...")
+        sfm_file = self._find_av_sfm()
+        if sfm_file is None:
+            return False
+
+        try:
+            # Same thresholds as for COLMAP's matches
+            posed = sum(sfm_views(sfm_file).values())
+            ratio = posed / len(self.imageFiles)
+            if posed < MIN_MATCHED_IMAGES or ratio < MIN_MATCH_RATIO:
+                self.logger.warning(
+                    f"aV posed only {posed} of {len(self.imageFiles)} images. Falling back to COLMAP."
+                )
+                return False
+            frames = export_nerfstudio(sfm_file, self.imageDir, output_path)
+        except Exception as e:
+            self.logger.warning(
+                f"Could not export aV's SfM: {e}. Falling back to COLMAP.",
+                exc_info=True,
+            )
+            return False
+        self.logger.info(f"Exported {frames} aV cameras to {output_path}.")
+
+        return True
+
+    def _vggt_server_ready(self) -> bool:
+        """
+        Checks the VGGT model server (`run_vggt.py --serve`) at `VGGT_SERVER_SOCKET`
+
+        """
+        status = vggt_health(VGGT_SERVER_SOCKET)
+        if status is None:
+            self.logger.warning(
+                f"VGGT server at {VGGT_SERVER_SOCKET} is unreachable. Loading the model for this run."
+            )
+            return False
+        self.logger.info(f"VGGT server status: {status}.")
+
+        return True
+
+    def _vggt_server_job(self, args: str, log_file: Path) -> None:
+        """
+        Runs `run_vggt.py` with `args` on the VGGT model server & appends its resource
+        usage to `self.profile_file`, like `_serialRunner()`
+
+        Raises
+        ------
+        RuntimeError
+            If the job failed on the server
+
+        """
+        log_path = Path(log_file).resolve()
+        cmd = f"vggt-server {args}"
+        started_at = datetime.now().isoformat(timespec="seconds")
+        start = perf_counter()
+        self.logger.info(
+            f"Submitting the job to the VGGT server. Log file: {log_path}."
+        )
+        try:
+            response = vggt_run(VGGT_SERVER_SOCKET, shlex.split(args), log_path)
+        except (OSError, RuntimeError) as error:
+            write_profile(
+                self.profile_file,
+                {
+                    "step": log_file.stem,
+                    "log": log_file.stem,
+                    "cmd": cmd,
+                    "started_at": started_at,
+                    "wall_s": round(perf_counter() - start, 3),
+                    "cpu_s": 0.0,
+                    "peak_rss_mb": 0.0,
+                    "exit_status": 1,
+                    "timed_out": False,
+                },
+            )
+            self.logger.error(f"VGGT server job failed. Check log file: {log_path}.")
+            raise RuntimeError(f"VGGT server job failed: {error}") from error
+        # NOTE: CPU time & peak RSS are the server's
+        write_profile(
+            self.profile_file,
+            {
+                "step": log_file.stem,
+                "log": log_file.stem,
+                "cmd": cmd,
+                "started_at": started_at,
+                **response["profile"],
+                "exit_status": 0,
+                "timed_out": False,
+            },
+        )
+        self.logger.info(f"VGGT server job finished. Log file: {log_path}.")
+
+    def _run_vggt(self, output_path: Path) -> bool:
+        """
+        Estimates the cameras & sparse points with VGGT (`run_vggt.py`, in the VGGT env),
+        instead of COLMAP, and converts them to nerfstudio data with `ns-process-data`
+        NOTE: The runner splits the images into memory-bounded, overlapping batches & writes
+        no reconstruction if too few of its depths are confident.
+
+        Parameters
+        ----------
+        output_path : Path
+            nerfstudio data folder
+
+        Returns
+        -------
+        bool
+            Whether VGGT succeeded, else COLMAP is needed
+
+        """
+        scene_dir = self.runDir / "vggt"
+        sparse_dir = output_path / "colmap/sparse/0"  # Where `--skip-colmap` looks
+        report_file = scene_dir / "report.json"
+        log_path = self.log_path / "vggt.log"
+
+        self.logger.info("Estimating cameras with VGGT...")
+        self.logger.info(f"Check log file: {log_path}.")
+        try:
+            # NOTE: The runner reads `scene_dir/images`
+            scene_dir.mkdir(parents=True, exist_ok=True)
+            report_file.unlink(missing_ok=True)
+            if not (scene_dir / "images").exists():
+                (scene_dir / "images").symlink_to(self.imageDir.resolve())
+            args = (
+                f"--scene_dir {scene_dir}"
+                + f" --out_dir {sparse_dir}"
+                + f" --report {report_file}"
+                + f" --max_batch_images {VGGT_MAX_BATCH_IMAGES}"
+                + f" --chunk_overlap {VGGT_CHUNK_OVERLAP}"
+                + f" --min_confident_fraction {VGGT_MIN_CONFIDENT_FRACTION}"
+            )
+            with GPUSlot(GPU_CONCURRENCY, self.logger, "VGGT"):
+                # On the model server, if any, else loading the model for this run
+                if VGGT_SERVER_SOCKET and self._vggt_server_ready():
+                    self._vggt_server_job(args, log_path)
+                else:
+                    cmd = (
+                        str(Path(VGGT_ENV_PATH) / "bin/python")
+                        + f" {VGGT_SCRIPT_PATH} "
+                        + args
+                        + (
+                            f" --weights {VGGT_WEIGHTS_PATH}"
+                            if VGGT_WEIGHTS_PATH
+                            else ""
+                        )
+                        + (" --offline" if VGGT_OFFLINE else "")
+                    )
+                    self._serialRunner(cmd, log_path)
+            report = json.loads(report_file.read_text())
+            if not report["ok"]:
+                self.logger.warning(
+                    f"Only {report['confident_fraction']:.1%} of VGGT's depths are confident. Falling back to COLMAP."
+                )
+                return False
+            self.logger.info(
+                f"VGGT posed {report['images']} images in {report['batches']} batch(es)."
+            )
+
+            cmd = (
+                "ns-process-data images --data "
+                + str(self.imageDir)
+                + " --output-dir "
+                + str(output_path)
+                + " --skip-colmap"
+            )
+            self._serialRunner(cmd, self.log_path / "splatfacto.log")
+        except Exception as e:
+            self.logger.warning(
+                f"VGGT failed: {e}. Falling back to COLMAP.", exc_info=True
+            )
+            shutil.rmtree(output_path / "colmap", ignore_errors=True)
+            return False
+        self.logger.info(f"Converted VGGT's cameras to {output_path}.")
+
+        return True
 
     def run_splatfacto(self) -> None:
         """
@@ -834,19 +1535,23 @@ class GSOps(BaseOps):
         sf_train_log_path = self.log_path / "splatfacto_train.log"
         output_path = self.runDir / "output/"
 
-        # Process data
-        self.logger.info("Processing data for Splatfacto...")
-        cmd = (
-            "ns-process-data images --data "
-            + str(self.imageDir)
-            + " --output-dir "
-            + str(output_path)
-            + " --colmap-cmd "
-            + str(COLMAP_PATH)
-        )
-        self._serialRunner(cmd, log_path)
-        self.logger.info("Processed data for Splatfacto.")
-        self._validate_colmap_matches(log_path)
+        # Process data - from aV's cameras or VGGT, if any, else with COLMAP
+        cameras_from_av = GS_CAMERAS_FROM_AV and self._export_av_cameras(output_path)
+        if not cameras_from_av and not (
+            GS_SFM_BACKEND == "vggt" and self._run_vggt(output_path)
+        ):
+            self.logger.info("Processing data for Splatfacto...")
+            cmd = (
+                "ns-process-data images --data "
+                + str(self.imageDir)
+                + " --output-dir "
+                + str(output_path)
+                + " --colmap-cmd "
+                + str(COLMAP_PATH)
+            )
+            self._serialRunner(cmd, log_path)
+            self.logger.info("Processed data for Splatfacto.")
+            self._validate_colmap_matches(log_path)
 
         # Create GS
         self.logger.info("Creating GS using Splatfacto...")
@@ -873,15 +1578,20 @@ class GSOps(BaseOps):
             + f" --max-num-iterations {GS_MAX_ITER} "
             # Quit after GS creation
             # Also see: https://docs.nerf.studio/quickstart/viewer_quickstart.html#accessing-over-an-ssh-connection
-            + "--viewer.quit-on-train-completion True "
+            + "--viewer.quit-on-train-completion True"
             # TODO: Uncomment these with newer nerfstudio
-            # + "--eval-mode fraction"
-            # + "--train-split-fraction 1"
-            + "> "
-            + str(sf_train_log_path)
+            # + " --eval-mode fraction"
+            # + " --train-split-fraction 1"
         )
+        if cameras_from_av:
+            # Keep aV's world frame, so that the splat shares the mesh's orientation
+            cmd += (
+                " nerfstudio-data --orientation-method none --center-method none"
+                + " --auto-scale-poses False"
+            )
         self.logger.info(f"Check log file: {sf_train_log_path}.")
-        self._serialRunner(cmd, log_path)
+        with GPUSlot(GPU_CONCURRENCY, self.logger, "ns-train"):
+            self._serialRunner(cmd, sf_train_log_path)
         self.logger.info("Created GS using Splatfacto.")
 
         # Export GS
@@ -917,11 +1627,21 @@ class GSOps(BaseOps):
 
         try:
             self.logger.info(f"Post-processing GS for {self.meshStr}.")
+            # NOTE: Large splats are post-processed in tiles on disk, to bound memory use
+            size_mb = inp.stat().st_size / 2**20
+            streaming = size_mb > GS_STREAMING_THRESHOLD_MB
+            self.logger.info(
+                f"Input splat is {size_mb:.1f} MB. Streaming mode: {streaming}."
+            )
             postproc = PostProcess(
                 input_path=inp,
                 output_path=out,
                 runDir=self.runDir,
                 log_path=self.log_path,
+                streaming=streaming,
+                tile_points=GS_STREAMING_TILE_POINTS,
+                compress=GS_COMPRESS_SPLAT,
+                scale_bits=GS_SPLAT_SCALE_BITS,
             )
             self.logger.info(f"Check log file: {postproc.log_path}.")
             postproc.run_ops()
@@ -1048,7 +1768,7 @@ def prerun_check(contrib_id: str, recons_type: str) -> tuple[bool, str]:
     # Check if mesh is already being processed or completed
     if mesh.completed:
         return False, "Mesh already completed."
-    if mesh.status == "Processing":
+    if mesh_locked(mesh.ID):
         return False, "Mesh already processing."
     if images_count < MESHOPS_MIN_IMAGES:
         return (
@@ -1066,9 +1786,148 @@ def prerun_check(contrib_id: str, recons_type: str) -> tuple[bool, str]:
     return True, "Mesh ready for processing."
 
 
-def ops_runner(contrib_id: str, kind: str) -> None:
+def archive_run(runID: str) -> None:
+    """
+    Moves the directory of a Run to `ARCHIVE_ROOT`, after `BaseOps.run_cleanup()` handed it
+    off, i.e., when it is on another device. The files are copied in `ARCHIVE_THREADS`
+    threads & checked against their checksums, before the Run points to the archive, is
+    marked "Archived" & the source is deleted. Does nothing, if the Run was archived already.
+
+    Parameters
+    ----------
+    runID : str
+        Run ID
+
+    """
+    run = Run.objects.get(ID=runID)
+    src = Path(run.directory)
+    if run.status != "Archiving" or not src.is_absolute():
+        return
+    relative_arc_path = src.relative_to(STATIC / "models")
+    arcDir = ARCHIVE_ROOT / relative_arc_path
+
+    logger = Logger(
+        log_path=LOG_DIR / f"{run.kind}Ops/{run.mesh_id}" / src.stem,
+        name=f"archive_{runID[:8]}",
+    )
+    logger.info(f"Archiving {run.kind} run {runID} from {src} to {arcDir}...")
+    start = perf_counter()
+    size = copy_tree_verified(src, arcDir, threads=ARCHIVE_THREADS)
+    # NOTE: `update()`, so that the rest of the Run is not overwritten
+    Run.objects.filter(ID=runID).update(
+        directory=str(relative_arc_path), status="Archived"
+    )
+    shutil.rmtree(src)
+    logger.info(
+        f"Archived {run.kind} run {runID} to {arcDir}: {size / 2**30:.2f} GiB in {perf_counter() - start:.0f} s."
+    )
+
+
+OPS_MAP = {"aV": MeshOps, "GS": GSOps}
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _notify_failure(
+    contrib: Contribution,
+    kind: str,
+    error: Exception,
+    op: Optional[BaseOps] = None,
+) -> None:
+    """
+    Sends an additional failure notification for `ops_start()` & `ops_step()`
+    NOTE: This covers cases where the error might occur outside of the BaseOps methods
+
+    """
+    cons = Console()
+    try:
+        from .email_utils import queue_email
+
+        queue_email(
+            "send_reconstruction_failure_email",
+            contribution_id=str(contrib.ID),
+            mesh_id=str(contrib.mesh.ID),
+            mesh_name=contrib.mesh.name,
+            contributor_email=contrib.contributor.email,
+            processing_step="ops_runner",
+            error_message=str(error),
+            log_file_path=str(op.log_path) if op is not None else None,
+            run_id=str(op.runID) if op is not None else None,
+            operation_type=kind,
+        )
+    except Exception as email_error:
+        cons.print(f"Failed to send failure notification email: {email_error}")
+
+
+def _notify_success(contrib: Contribution, kind: str, op: BaseOps) -> None:
+    """
+    Sends the success notifications, once the last step of a run is done
+
+    """
+    cons = Console()
+    meshID = str(contrib.mesh.ID)
+    # Remove microseconds
+    processing_duration = str(timezone.now() - op.run.started_at).split(".")[0]
+    try:
+        from .email_utils import queue_email
+
+        contributor_name = (
+            contrib.contributor.name or contrib.contributor.email.split("@")[0]
+        )
+
+        # Get ARK information if available
+        ark_url = None
+        ark_id = None
+        if op.run.ark:
+            ark_url = f"{settings.BASE_URL}/ark:/{op.run.ark.ark}"
+            ark_id = op.run.ark.ark
+
+        # Conditionally send notification to contributor
+        if MAIL_CONTRIB_TOGGLE:
+            queue_email(
+                "send_contribution_processing_success_email",
+                contribution_id=str(contrib.ID),
+                mesh_id=meshID,
+                mesh_name=contrib.mesh.name,
+                contributor_email=contrib.contributor.email,
+                contributor_name=contributor_name,
+                operation_type=kind,
+                run_id=str(op.runID),
+                mesh_url=f"{settings.BASE_URL}/mesh/{meshID}/",
+                processing_duration=processing_duration,
+                ark_url=ark_url,
+                ark_id=ark_id,
+            )
+            cons.print(
+                f"{_now()}: Success notification queued for {contrib.contributor.email}."
+            )
+
+        # Send notification to admins
+        queue_email(
+            "send_admin_run_completion_email",
+            contribution_id=str(contrib.ID),
+            mesh_id=meshID,
+            mesh_name=contrib.mesh.name,
+            contributor_email=contrib.contributor.email,
+            contributor_name=contributor_name,
+            operation_type=kind,
+            run_id=str(op.runID),
+            processing_duration=processing_duration,
+            ark_url=ark_url,
+            ark_id=ark_id,
+        )
+        cons.print(f"{_now()}: Admin notification queued for run completion.")
+
+    except Exception as email_error:
+        cons.print(f"Warning: Failed to send notification emails: {email_error}")
+        # NOTE: Don't raise the exception - email failure shouldn't break the processing
+
+
+def ops_start(contrib_id: str, kind: str) -> str:
     """
-    Runs the appropriate operations on a `models.Mesh` and publishes the results.
+    Creates the Run of an operation on a `models.Mesh`, whose steps `ops_step()` then runs.
 
     Parameters
     ----------
@@ -1078,9 +1937,13 @@ def ops_runner(contrib_id: str, kind: str) -> None:
         Kind of operation to run
         Options: 'aV' (AliceVision) or 'GS' (Gaussian Splatting)
 
+    Returns
+    -------
+    str
+        Run ID
+
     """
-    ops_map = {"aV": MeshOps, "GS": GSOps, "Point": PointOps}
-    OP = ops_map[kind]
+    OP = OPS_MAP[kind]
     op_name = OP.__name__
 
     contrib = Contribution.objects.get(ID=contrib_id)
@@ -1089,128 +1952,97 @@ def ops_runner(contrib_id: str, kind: str) -> None:
 
     cons = Console()  # This appears as normal printed logs in celery logs.
     cons.rule(f"{op_name} Runner Start")
-    cons.print(
-        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: Triggered by {contrib.ID} for Mesh {meshVID} <=> {meshID}."
-    )
-    cons.print(
-        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: Starting {op_name} on Mesh {meshVID} <=> {meshID}."
-    )
+    cons.print(f"{_now()}: Triggered by {contrib.ID} for Mesh {meshVID} <=> {meshID}.")
+    cons.print(f"{_now()}: Starting {op_name} on Mesh {meshVID} <=> {meshID}.")
 
     try:
-        op = OP(meshID=meshID)
-        cons.print(f"Check {op.log_path} for more details.")
-
-        # Store start time for calculating processing duration
-        start_time = datetime.now()
-        op._run_all()
-
-        if getattr(op, "cancelled", False):
-            cancel_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cancel_reason = getattr(op, "cancel_reason", "Run cancelled.")
-            cons.print(
-                f"{cancel_timestamp}: {op_name} cancelled for {meshVID} <=> {meshID}. {cancel_reason}"
-            )
-        else:
-            # Calculate processing duration
-            end_time = datetime.now()
-            processing_duration = str(end_time - start_time).split(".")[
-                0
-            ]  # Remove microseconds
+        op = OP(meshID=meshID, contrib_id=contrib_id)
+    except Exception as e:
+        cons.print(
+            f"{_now()}: ERROR encountered in {op_name} for {meshVID} <=> {meshID}!"
+        )
+        cons.print(f"{_now()}: {e}")
+        _notify_failure(contrib, kind, e)
+        raise e
+    cons.print(f"Check {op.log_path} for more details.")
+    # NOTE: Keeps the mesh locked, while the first step waits in the queue
+    renew_mesh_lock(meshID, kind, op.runID, ttl=MESH_LOCK_QUEUED_TTL)
 
-            cons.print(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: Finished {op_name} on {meshVID} <=> {meshID}."
-            )
+    return op.runID
 
-            # Send success email notification to contributor and admins
-            try:
-                from .email_utils import (
-                    send_contribution_processing_success_email,
-                    send_admin_run_completion_email,
-                )
 
-                contributor_name = (
-                    contrib.contributor.name or contrib.contributor.email.split("@")[0]
-                )
+def ops_step(runID: str, step: str) -> bool:
+    """
+    Runs a step of a Run (see `BaseOps.run_step()`) & publishes the results after the last one.
 
-                # Get ARK information if available
-                ark_url = None
-                ark_id = None
-                if hasattr(op, "run") and op.run.ark:
-                    ark_url = f"{settings.BASE_URL}/ark:/{op.run.ark.ark}"
-                    ark_id = op.run.ark.ark
-
-                # Conditionally send notification to contributor
-                if MAIL_CONTRIB_TOGGLE:
-                    send_contribution_processing_success_email(
-                        contribution_id=contrib_id,
-                        mesh_id=meshID,
-                        mesh_name=contrib.mesh.name,
-                        contributor_email=contrib.contributor.email,
-                        contributor_name=contributor_name,
-                        operation_type=kind,
-                        run_id=str(op.runID) if hasattr(op, "runID") else None,
-                        mesh_url=f"{settings.BASE_URL}/mesh/{meshID}/",
-                        processing_duration=processing_duration,
-                        ark_url=ark_url,
-                        ark_id=ark_id,
-                    )
-                    cons.print(
-                        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: Success notification sent to {contrib.contributor.email}."
-                    )
+    Parameters
+    ----------
+    runID : str
+        Run ID, from `ops_start()`
+    step : str
+        Step of the operation's `_run_order`, e.g., "run_aliceVision"
 
-                # Send notification to admins
-                send_admin_run_completion_email(
-                    contribution_id=contrib_id,
-                    mesh_id=meshID,
-                    mesh_name=contrib.mesh.name,
-                    contributor_email=contrib.contributor.email,
-                    contributor_name=contributor_name,
-                    operation_type=kind,
-                    run_id=str(op.runID) if hasattr(op, "runID") else None,
-                    processing_duration=processing_duration,
-                    ark_url=ark_url,
-                    ark_id=ark_id,
-                )
-                cons.print(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: Admin notification sent for run completion."
-                )
+    Returns
+    -------
+    bool
+        Whether the run goes on, i.e., False if it was cancelled
 
-            except Exception as email_error:
-                cons.print(
-                    f"Warning: Failed to send notification emails: {email_error}"
-                )
-                # NOTE: Don't raise the exception - email failure shouldn't break the processing
+    """
+    run = Run.objects.select_related("mesh").get(ID=runID)
+    kind = run.kind
+    OP = OPS_MAP[kind]
+    op_name = OP.__name__
+    contrib_id = run.state.get("contrib_id")
+    contrib = Contribution.objects.get(ID=contrib_id)
+    meshID = str(run.mesh.ID)
+    meshVID = str(run.mesh.verbose_id)
 
+    cons = Console()
+    cons.print(f"{_now()}: Running {op_name}.{step} for {meshVID} <=> {meshID}.")
+    op = None
+    try:
+        op = OP(meshID=meshID, contrib_id=contrib_id, runID=runID)
+        op.run_step(step)
     except Exception as e:
         cons.print(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: ERROR encountered in {op_name} for {meshVID} <=> {meshID}!"
+            f"{_now()}: ERROR encountered in {op_name} for {meshVID} <=> {meshID}!"
         )
-        cons.print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: {e}")
+        cons.print(f"{_now()}: {e}")
+        _notify_failure(contrib, kind, e, op)
+        raise e
 
-        # Send additional email notification if _handle_error didn't cover it
-        # This covers cases where the error might occur outside of the BaseOps methods
-        try:
-            from .email_utils import send_reconstruction_failure_email
+    if op.cancelled:
+        cons.print(
+            f"{_now()}: {op_name} cancelled for {meshVID} <=> {meshID}. {op.cancel_reason}"
+        )
+        return False
 
-            contributor_email = contrib.contributor.email
+    if step == OP._run_order[-1]:
+        cons.print(f"{_now()}: Finished {op_name} on {meshVID} <=> {meshID}.")
+        _notify_success(contrib, kind, op)
+        cons.rule(f"{op_name} Runner End")
+    else:
+        # NOTE: Keeps the mesh locked, while the next step waits in the queue
+        renew_mesh_lock(meshID, kind, runID, ttl=MESH_LOCK_QUEUED_TTL)
 
-            send_reconstruction_failure_email(
-                contribution_id=contrib_id,
-                mesh_id=meshID,
-                mesh_name=contrib.mesh.name,
-                contributor_email=contributor_email,
-                processing_step="ops_runner",
-                error_message=str(e),
-                log_file_path=str(op.log_path)
-                if "op" in locals() and hasattr(op, "log_path")
-                else None,
-                run_id=str(op.runID)
-                if "op" in locals() and hasattr(op, "runID")
-                else None,
-                operation_type=kind,
-            )
-        except Exception as email_error:
-            cons.print(f"Failed to send failure notification email: {email_error}")
+    return True
 
-        raise e
-    cons.rule(f"{op_name} Runner End")
+
+def ops_runner(contrib_id: str, kind: str) -> None:
+    """
+    Runs the appropriate operations on a `models.Mesh` and publishes the results, in this
+    process. NOTE: `tasks.recon_runner_task` runs each step as its own Celery task instead.
+
+    Parameters
+    ----------
+    contrib_id : str
+        Contribution ID
+    kind : str
+        Kind of operation to run
+        Options: 'aV' (AliceVision) or 'GS' (Gaussian Splatting)
+
+    """
+    runID = ops_start(contrib_id, kind)
+    for step in OPS_MAP[kind]._run_order:
+        if not ops_step(runID, step):
+            break
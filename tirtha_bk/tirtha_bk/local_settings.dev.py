@@ -51,6 +51,9 @@ PRE_URL = "project/tirtha/"
 PROD_DIR = os.path.join(BASE_DIR, "prod")
 NFS_DIR = os.path.join(BASE_DIR, "arch")
 ARCHIVE_ROOT = os.path.join(NFS_DIR, "archives")
+ARCHIVE_THREADS = (
+    4  # Files copied at a time, when archiving a run to another device, e.g., NFS
+)
 LOG_DIR = os.path.join(PROD_DIR, "logs")
 LOG_LOCATION = os.path.join(LOG_DIR, "django.log")
 ADMIN_LOG_LOCATION = os.path.join(LOG_DIR, "admin.log")
@@ -97,10 +100,51 @@ GS_MAX_ITER = 30_000
 ALPHA_CULL_THRESH = 0.005  # Threshold to delete translucent gaussians - lower values remove more (usually better quality)
 MIN_MATCHED_IMAGES = 5  # Minimum number of matched images required
 MIN_MATCH_RATIO = 0.10  # Minimum ratio of matched images to total images
+GS_STREAMING_THRESHOLD_MB = (
+    4096  # splat.ply files larger than this are post-processed in tiles on disk
+)
+GS_STREAMING_TILE_POINTS = 2_000_000  # Max. Gaussians per tile in streaming mode
+GS_COMPRESS_SPLAT = True  # Also publish a compressed .csplat, preferred by the viewers
+GS_SPLAT_SCALE_BITS = 8  # 8 or 16 bits per log-scale in the .csplat
+GS_CAMERAS_FROM_AV = (
+    False  # Train GS on the aV run's cameras & sparse points, instead of running COLMAP
+)
+
+# VGGT
+VGGT_SCRIPT_PATH = "./tirtha/run_vggt.py"
+VGGT_ENV_PATH = "../.venv"
+GS_SFM_BACKEND = (
+    "colmap"  # "colmap" or "vggt" - VGGT falls back to COLMAP on low confidence
+)
+VGGT_MAX_BATCH_IMAGES = (
+    0  # Max. images per VGGT forward pass (0 to fit the free memory)
+)
+VGGT_WEIGHTS_PATH = ""  # Local VGGT-1B weights (model.pt) - downloaded per run if empty
+VGGT_OFFLINE = (
+    False  # Never download VGGT's weights, i.e., VGGT_WEIGHTS_PATH is required
+)
+VGGT_SERVER_SOCKET = ""  # Unix socket of the VGGT model server (`run_vggt.py --serve`) - loads the model per run if empty or down
+VGGT_CHUNK_OVERLAP = 4  # Images shared by consecutive VGGT batches, to register them
+VGGT_MIN_CONFIDENT_FRACTION = (
+    0.3  # Fall back to COLMAP if fewer of VGGT's depths are confident
+)
 
 ALICEVISION_DIRPATH = BASE_DIR / "bin21"
+ALICEVISION_NODE_CONCURRENCY = (
+    {}
+)  # Max. blocks at a time per aliceVision node, e.g., {"depthMapEstimation": 1}
+ALICEVISION_NODE_TIMEOUTS = (
+    {}
+)  # Max. seconds per command of an aliceVision node, e.g., {"depthMapEstimation": 7200}
+ALICEVISION_ADMISSION_CONTROL = True  # Throttle the memory-heavy aliceVision nodes to the free RAM, instead of skipping aV on large meshes
 NSFW_MODEL_DIRPATH = BASE_DIR / "nn_models/nsfw_model/mobilenet_v2_140_224/"
 MANIQA_MODEL_FILEPATH = BASE_DIR / "static/artifacts/ckpt_kadid10k.pt"
+IMAGEOPS_CHECKS = True  # NSFW & quality checks on contributed images; else, all images are marked good
+IMAGEOPS_BATCH_SIZE = (
+    16  # Images (or MANIQA crops) per forward pass of the image check models
+)
+IMAGEOPS_THREADS = 4  # Threads decoding & resizing images for the image checks
+IMAGEOPS_MANIQA_CROPS = 20  # Random crops averaged per MANIQA score
 OBJ2GLTF_PATH = "obj2gltf"  # NOTE: Ensure the binary is on system PATH
 GLTFPACK_PATH = "gltfpack"  # NOTE: Ensure the binary is on system PATH
 MESHOPS_MIN_IMAGES = 10  # Minimum number of images required to run meshops
@@ -108,6 +152,36 @@ MESHOPS_MAX_IMAGES = (
     500  # Maximum number of images to use for meshops - to avoid OOM issues
 )
 MESHOPS_CONTRIB_DELAY = 0.005
+MESHOPS_RESUME = (
+    True  # Reuse the up-to-date aliceVision nodes of the last errored-out run
+)
+MESHOPS_FEATURE_CACHE = (
+    True  # Reuse the extracted features of unchanged images across runs
+)
+MESHOPS_INCREMENTAL_MATCHING = (
+    False  # Only match the new images against the last archived run
+)
+RECON_OVERLAP = True  # Run the aV & GS pipelines of a contribution side by side, instead of one after the other
+GPU_CONCURRENCY = (
+    1  # Max. GPU-heavy steps (`depthMapEstimation`, `ns-train`) at a time on this host
+)
+RECON_STEP_TIME_LIMITS = (
+    {}
+)  # Max. seconds per step of a run, e.g., {"run_splatfacto": 36000}; a step over it errors out & can be resumed
+RECON_PRIORITIES = {
+    "First": 0,
+    "Admin": 1,
+    "Incremental": 2,
+}  # Priority of a reconstruction job by reason - lower runs first; editable per job in the admin
+RECON_COST_WEIGHTS = {
+    "aV": 3.0,
+    "GS": 1.0,
+}  # Estimated cost of a job per good image, by kind - cheaper jobs run first at equal priority
+RECON_MAX_ACTIVE = (
+    1  # Max. meshes reconstructing at a time; the rest of the jobs wait in the DB queue
+)
+MESH_LOCK_TTL = 1800  # Seconds a run's lock on its mesh lasts without a heartbeat, e.g., after a crash
+MESH_LOCK_QUEUED_TTL = 86400  # Seconds a run's lock lasts while its next step waits in the queue
 FILE_UPLOAD_MAX_MEMORY_SIZE = (
     10_485_760 * 2
 )  # 20 MiB (each file max - post compression)
@@ -4,6 +4,7 @@ Fields marked CHANGEME: need to be changed before deployment
 
 """
 
+import json
 import os
 from pathlib import Path
 from django.core.management.utils import get_random_secret_key
@@ -63,6 +64,9 @@ NFS_DIR = os.getenv(  # Long term storage for old runs # CHANGEME: Does not need
     "NFS_DIR", "/var/www/tirtha/archive/"
 )
 ARCHIVE_ROOT = f"{NFS_DIR}archives"
+ARCHIVE_THREADS = int(
+    os.getenv("ARCHIVE_THREADS", "4")
+)  # Files copied at a time, when archiving a run to another device, e.g., NFS
 LOG_DIR = f"{PROD_DIR}logs"
 LOG_LOCATION = LOG_DIR + "/django.log"
 ADMIN_LOG_LOCATION = LOG_DIR + "/admin.log"
@@ -167,19 +171,76 @@ ALPHA_CULL_THRESH = float(
 )  # Threshold to delete translucent gaussians - lower values remove more (usually better quality)
 MIN_MATCHED_IMAGES = int(os.getenv("MIN_MATCHED_IMAGES", "5"))
 MIN_MATCH_RATIO = float(os.getenv("MIN_MATCH_RATIO", "0.10"))
+GS_STREAMING_THRESHOLD_MB = float(
+    os.getenv("GS_STREAMING_THRESHOLD_MB", "4096")
+)  # splat.ply files larger than this are post-processed in tiles on disk
+GS_STREAMING_TILE_POINTS = int(
+    os.getenv("GS_STREAMING_TILE_POINTS", "2000000")
+)  # Max. Gaussians per tile in streaming mode
+GS_COMPRESS_SPLAT = (
+    os.getenv("GS_COMPRESS_SPLAT", "True").lower() == "true"
+)  # Also publish a compressed .csplat, preferred by the viewers
+GS_SPLAT_SCALE_BITS = int(
+    os.getenv("GS_SPLAT_SCALE_BITS", "8")
+)  # 8 or 16 bits per log-scale in the .csplat
+GS_CAMERAS_FROM_AV = (
+    os.getenv("GS_CAMERAS_FROM_AV", "False").lower() == "true"
+)  # Train GS on the aV run's cameras & sparse points, instead of running COLMAP
 
 # VGGT
 VGGT_SCRIPT_PATH = "./tirtha/run_vggt.py"
 VGGT_ENV_PATH = "../.venv"
+GS_SFM_BACKEND = os.getenv(
+    "GS_SFM_BACKEND", "colmap"
+)  # "colmap" or "vggt" - VGGT falls back to COLMAP on low confidence
+VGGT_MAX_BATCH_IMAGES = int(
+    os.getenv("VGGT_MAX_BATCH_IMAGES", "0")
+)  # Max. images per VGGT forward pass (0 to fit the free memory)
+VGGT_WEIGHTS_PATH = os.getenv(
+    "VGGT_WEIGHTS_PATH", ""
+)  # Local VGGT-1B weights (model.pt) - downloaded per run if empty
+VGGT_OFFLINE = (
+    os.getenv("VGGT_OFFLINE", "False").lower() == "true"
+)  # Never download VGGT's weights, i.e., VGGT_WEIGHTS_PATH is required
+VGGT_SERVER_SOCKET = os.getenv(
+    "VGGT_SERVER_SOCKET", ""
+)  # Unix socket of the VGGT model server (`run_vggt.py --serve`) - loads the model per run if empty or down
+VGGT_CHUNK_OVERLAP = int(
+    os.getenv("VGGT_CHUNK_OVERLAP", "4")
+)  # Images shared by consecutive VGGT batches, to register them
+VGGT_MIN_CONFIDENT_FRACTION = float(
+    os.getenv("VGGT_MIN_CONFIDENT_FRACTION", "0.3")
+)  # Fall back to COLMAP if fewer of VGGT's depths are confident
 
 # MR
 # NOTE: Defaulting to Meshroom 2021 for now. 2023/25 will require further changes
 ALICEVISION_DIRPATH = Path(
     os.getenv("ALICEVISION_DIRPATH", BASE_DIR / "bin21")
 )  # CHANGEME:
+ALICEVISION_NODE_CONCURRENCY = json.loads(
+    os.getenv("ALICEVISION_NODE_CONCURRENCY", "{}")
+)  # Max. blocks at a time per aliceVision node, e.g., {"depthMapEstimation": 1}
+ALICEVISION_NODE_TIMEOUTS = json.loads(
+    os.getenv("ALICEVISION_NODE_TIMEOUTS", "{}")
+)  # Max. seconds per command of an aliceVision node, e.g., {"depthMapEstimation": 7200}
+ALICEVISION_ADMISSION_CONTROL = (
+    os.getenv("ALICEVISION_ADMISSION_CONTROL", "True").lower() == "true"
+)  # Throttle the memory-heavy aliceVision nodes to the free RAM, instead of skipping aV on large meshes
 # NOTE: See `Requirements` section in README.md
 NSFW_MODEL_DIRPATH = BASE_DIR / "nn_models/nsfw_model/mobilenet_v2_140_224/"
 MANIQA_MODEL_FILEPATH = BASE_DIR / "nn_models/MANIQA/ckpt_kadid10k.pt"
+IMAGEOPS_CHECKS = (
+    os.getenv("IMAGEOPS_CHECKS", "True").lower() == "true"
+)  # NSFW & quality checks on contributed images; else, all images are marked good
+IMAGEOPS_BATCH_SIZE = int(
+    os.getenv("IMAGEOPS_BATCH_SIZE", "16")
+)  # Images (or MANIQA crops) per forward pass of the image check models
+IMAGEOPS_THREADS = int(
+    os.getenv("IMAGEOPS_THREADS", "4")
+)  # Threads decoding & resizing images for the image checks
+IMAGEOPS_MANIQA_CROPS = int(
+    os.getenv("IMAGEOPS_MANIQA_CROPS", "20")
+)  # Random crops averaged per MANIQA score
 
 OBJ2GLTF_PATH = os.getenv("OBJ2GLTF_PATH", "obj2gltf")
 GLTFPACK_PATH = os.getenv("GLTFPACK_PATH", "gltfpack")
@@ -189,7 +250,40 @@ MESHOPS_MIN_IMAGES = int(
 MESHOPS_MAX_IMAGES = int(os.getenv("MESHOPS_MAX_IMAGES", "500"))
 MESHOPS_CONTRIB_DELAY = float(
     os.getenv("MESHOPS_CONTRIB_DELAY", str(0.005))
-)  # 18 seconds for testing | Keep >= 1 hour(s) - CHANGEME: time to wait before running meshops after a new contribution
+)  # 18 seconds for testing | Keep >= 1 hour(s) - CHANGEME: quiet period before running meshops after the last contribution to a mesh
+MESHOPS_RESUME = (
+    os.getenv("MESHOPS_RESUME", "True").lower() == "true"
+)  # Reuse the up-to-date aliceVision nodes of the last errored-out run
+MESHOPS_FEATURE_CACHE = (
+    os.getenv("MESHOPS_FEATURE_CACHE", "True").lower() == "true"
+)  # Reuse the extracted features of unchanged images across runs
+MESHOPS_INCREMENTAL_MATCHING = (
+    os.getenv("MESHOPS_INCREMENTAL_MATCHING", "False").lower() == "true"
+)  # Only match the new images against the last archived run
+RECON_OVERLAP = (
+    os.getenv("RECON_OVERLAP", "True").lower() == "true"
+)  # Run the aV & GS pipelines of a contribution side by side, instead of one after the other
+GPU_CONCURRENCY = int(
+    os.getenv("GPU_CONCURRENCY", "1")
+)  # Max. GPU-heavy steps (`depthMapEstimation`, `ns-train`) at a time on this host
+RECON_STEP_TIME_LIMITS = json.loads(
+    os.getenv("RECON_STEP_TIME_LIMITS", "{}")
+)  # Max. seconds per step of a run, e.g., {"run_splatfacto": 36000}; a step over it errors out & can be resumed
+RECON_PRIORITIES = json.loads(
+    os.getenv("RECON_PRIORITIES", '{"First": 0, "Admin": 1, "Incremental": 2}')
+)  # Priority of a reconstruction job by reason - lower runs first; editable per job in the admin
+RECON_COST_WEIGHTS = json.loads(
+    os.getenv("RECON_COST_WEIGHTS", '{"aV": 3.0, "GS": 1.0}')
+)  # Estimated cost of a job per good image, by kind - cheaper jobs run first at equal priority
+RECON_MAX_ACTIVE = int(
+    os.getenv("RECON_MAX_ACTIVE", "1")
+)  # Max. meshes reconstructing at a time; the rest of the jobs wait in the DB queue
+MESH_LOCK_TTL = int(
+    os.getenv("MESH_LOCK_TTL", "1800")
+)  # Seconds a run's lock on its mesh lasts without a heartbeat, e.g., after a crash
+MESH_LOCK_QUEUED_TTL = int(
+    os.getenv("MESH_LOCK_QUEUED_TTL", "86400")
+)  # Seconds a run's lock lasts while its next step waits in the queue
 FILE_UPLOAD_MAX_MEMORY_SIZE = int(
     os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", str(10_485_760 * 2))
 )  # 20 MiB (each file max - post compression)